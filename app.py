@@ -1,19 +1,47 @@
 # Imports necessários
-from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify
+from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify, g
+from flask.json.provider import DefaultJSONProvider
+from flask.logging import default_handler
+from werkzeug.routing import BaseConverter
+from flask_session import Session
+from cachelib.file import FileSystemCache
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.connection import HTTPConnection
+from urllib3.fields import format_multipart_header_param
 from functools import wraps
+from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError as FutureTimeoutError
+from collections import OrderedDict
 import os
+import socket
 import re
 import uuid
+import hashlib
+import io
 import json
+import orjson
 from dotenv import load_dotenv
 import sys
-from datetime import timedelta
+from datetime import date, datetime, timedelta
 import time
+import threading
+import logging
+import queue
+import atexit
+from logging.handlers import QueueHandler, QueueListener
 
 # ===== CARREGAMENTO E VALIDAÇÃO DE VARIÁVEIS DE AMBIENTE =====
-# Carrega as variáveis do arquivo .env
-load_dotenv()
+# Carrega as variáveis do arquivo .env (retorna False se o arquivo não existir).
+# Em servidores, as variáveis podem vir do próprio ambiente, sem .env.
+ENV_FILE_LOADED = load_dotenv()
+
+def print_env_file_hint():
+    # Orientação extra quando falta uma variável obrigatória e não há .env
+    if not ENV_FILE_LOADED:
+        print("\nAVISO: Arquivo .env não encontrado na raiz do projeto!")
+        print("Crie o arquivo .env com FLASK_APP, FLASK_ENV, SECRET_KEY e API_BASE_URL")
+        print("ou defina essas variáveis no ambiente do servidor.")
 
 # Validação obrigatória: SECRET_KEY
 SECRET_KEY = os.getenv('SECRET_KEY')
@@ -25,6 +53,7 @@ if not SECRET_KEY:
     print("  SECRET_KEY=sua-chave-secreta-aqui")
     print("\nPara gerar uma chave segura, execute:")
     print("  python -c \"import secrets; print(secrets.token_hex(32))\"")
+    print_env_file_hint()
     print("\nConsulte o README.md para mais informações.")
     print("=" * 80)
     sys.exit(1)
@@ -38,27 +67,11 @@ if not API_BASE_URL:
     print("\nPor favor, configure o arquivo .env na raiz do projeto com:")
     print("  API_BASE_URL=http://127.0.0.1:8000")
     print("\nAjuste a URL conforme necessário se a API estiver em outro servidor.")
+    print_env_file_hint()
     print("\nConsulte o README.md para mais informações.")
     print("=" * 80)
     sys.exit(1)
 
-# Validação: Verifica se o arquivo .env existe
-if not os.path.exists('.env'):
-    print("=" * 80)
-    print("AVISO: Arquivo .env não encontrado na raiz do projeto!")
-    print("=" * 80)
-    print("\nO arquivo .env é OBRIGATÓRIO para executar esta aplicação.")
-    print("\nCrie o arquivo .env na raiz do projeto com as seguintes variáveis:")
-    print("  FLASK_APP=app.py")
-    print("  FLASK_ENV=development")
-    print("  SECRET_KEY=sua-chave-secreta-aqui")
-    print("  API_BASE_URL=http://127.0.0.1:8000")
-    print("\nPara gerar uma chave segura, execute:")
-    print("  python -c \"import secrets; print(secrets.token_hex(32))\"")
-    print("\nConsulte o README.md para instruções detalhadas.")
-    print("=" * 80)
-    sys.exit(1)
-
 # Validação de formato da URL da API
 if not API_BASE_URL.startswith(('http://', 'https://')):
     print("=" * 80)
@@ -74,7 +87,28 @@ FLASK_ENV = os.getenv('FLASK_ENV', 'development')
 DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
 
 # ===== CONFIGURAÇÃO DA APLICAÇÃO FLASK =====
+class ORJSONProvider(DefaultJSONProvider):
+    # jsonify() e request.get_json() usando orjson (implementado em C),
+    # bem mais rápido que o json da stdlib para as listas repassadas da API
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+class ApiIdConverter(BaseConverter):
+    # IDs repassados à API (inteiros, UUIDs ou hashes): só letras, números, '-' e '_'.
+    # Valores fora disso recebem 404 no roteamento, sem entrar na view.
+    regex = r'[A-Za-z0-9_-]+'
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+app.url_map.converters['api_id'] = ApiIdConverter
 app.secret_key = SECRET_KEY  # Chave secreta para sessões (obrigatória)
 
 # Timestamp de inicialização do servidor - usado para invalidar sessões após reiniciar
@@ -88,6 +122,34 @@ app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
 # Força que a sessão expire quando o navegador fecha (não permanente)
 app.config['SESSION_COOKIE_SECURE'] = False  # True apenas em HTTPS
 
+# Sessão no servidor: o cookie carrega apenas o ID da sessão, e as listas
+# (docentes, conteúdos, matérias, wizard) ficam gravadas em disco, evitando
+# cookies acima de 4 KB e a reassinatura da estrutura inteira a cada resposta
+# Com REDIS_URL definido (vários processos/servidores) as sessões vão para o Redis;
+# sem ele, ficam em arquivos locais.
+REDIS_URL = os.getenv('REDIS_URL')
+SESSION_FILE_DIR = os.getenv('SESSION_FILE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'flask_session'))
+if REDIS_URL:
+    import redis
+    app.config['SESSION_TYPE'] = 'redis'
+    app.config['SESSION_REDIS'] = redis.from_url(REDIS_URL)
+    print(f"[INFO] Sessões armazenadas no Redis")
+else:
+    app.config['SESSION_TYPE'] = 'cachelib'
+    app.config['SESSION_CACHELIB'] = FileSystemCache(cache_dir=SESSION_FILE_DIR, threshold=1000)
+app.config['SESSION_PERMANENT'] = False
+# Só grava a sessão (e envia Set-Cookie) quando ela muda de fato: rotas de leitura
+# (dashboard, listagens, visualizações) não reescrevem o armazenamento nem o cookie.
+# A validade no armazenamento só é renovada na gravação; para manter as 24 h contadas
+# a partir da última atividade, a sessão é "tocada" no máximo uma vez por
+# SESSION_TOUCH_INTERVAL (ver touch_session)
+app.config['SESSION_REFRESH_EACH_REQUEST'] = False
+SESSION_TOUCH_INTERVAL = 3600
+# Tudo o que vai para a sessão (usuário, listas, wizard, provas) é str/int/list/dict,
+# então serializamos em JSON: legível no armazenamento e sem formato binário
+app.config['SESSION_SERIALIZATION_FORMAT'] = 'json'
+Session(app)
+
 # Configuração do modo debug baseado na variável de ambiente
 if FLASK_ENV == 'development':
     app.config['DEBUG'] = True
@@ -96,16 +158,195 @@ else:
     app.config['DEBUG'] = DEBUG
     print(f"[INFO] Modo de produção ativado (DEBUG={DEBUG})")
 
+# Logs de depuração via logging (formatação preguiçosa, descartada fora do modo debug).
+# LOG_LEVEL permite ajustar o nível sem ativar o modo debug.
+app.logger.setLevel(os.getenv('LOG_LEVEL', '').upper() or (logging.DEBUG if app.config['DEBUG'] else logging.WARNING))
+
+# A escrita dos logs acontece em uma thread separada: as rotas só enfileiram o registro
+_log_queue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler(sys.stderr)
+_log_stream_handler.setFormatter(logging.Formatter("[%(asctime)s] %(levelname)s in %(module)s: %(message)s"))
+_log_listener = QueueListener(_log_queue, _log_stream_handler)
+app.logger.removeHandler(default_handler)
+app.logger.addHandler(QueueHandler(_log_queue))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 # Log de configuração bem-sucedida
 print(f"[INFO] Configuração carregada com sucesso!")
 print(f"[INFO] API_BASE_URL: {API_BASE_URL}")
 print(f"[INFO] SECRET_KEY configurada: {'*' * 20}...{SECRET_KEY[-8:]}")
 
+# ===== CLIENTE HTTP COMPARTILHADO PARA A API =====
+# Todas as chamadas vão para o mesmo API_BASE_URL: uma única Session reaproveita
+# as conexões (keep-alive) em vez de abrir um novo TCP/TLS a cada requisição.
+# O pool é thread-safe e é compartilhado entre as threads do servidor.
+# Falhas transitórias do gateway (502/503/504) e limite de taxa (429, respeitando o
+# Retry-After) são repetidas com backoff curto, apenas nos métodos idempotentes
+# (GET/PUT/DELETE...): um POST repetido poderia criar o registro em duplicidade.
+# raise_on_status=False mantém a resposta original quando as tentativas acabam.
+# API_POOL_SIZE deve acompanhar o total de threads que falam com a API (threads do
+# servidor + API_MAX_WORKERS); com menos conexões no pool, as excedentes são
+# abertas e descartadas a cada requisição e o keep-alive se perde sob carga.
+API_POOL_SIZE = int(os.getenv('API_POOL_SIZE', '50'))
+API_MAX_WORKERS = int(os.getenv('API_MAX_WORKERS', '16'))
+# Timeout das chamadas à API: (conexão, leitura). Um handshake travado falha em 3 s
+# em vez de consumir os 10 s reservados à resposta
+API_TIMEOUT = (3, 10)
+
+class KeepAliveAdapter(HTTPAdapter):
+    # Conexões do pool com TCP keep-alive, além do TCP_NODELAY padrão do urllib3:
+    # conexões ociosas entre picos não são derrubadas em silêncio por NAT/firewall,
+    # e os JSONs pequenos seguem sem o atraso de Nagle
+    socket_options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', self.socket_options)
+        super().init_poolmanager(*args, **kwargs)
+
+class CappedRetry(Retry):
+    # Respeita o Retry-After da API (ex.: 429), mas com espera máxima de
+    # RETRY_AFTER_MAX segundos: a pausa acontece na thread da requisição do usuário
+    RETRY_AFTER_MAX = 1.0
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, self.RETRY_AFTER_MAX)
+
+API_SESSION = requests.Session()
+_api_retry = CappedRetry(total=2, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504], raise_on_status=False)
+_api_adapter = KeepAliveAdapter(pool_connections=20, pool_maxsize=API_POOL_SIZE, max_retries=_api_retry)
+API_SESSION.mount('http://', _api_adapter)
+API_SESSION.mount('https://', _api_adapter)
+# A API sempre responde JSON; o header fixo fica na Session (os de autenticação
+# continuam por chamada, pois o token muda conforme o usuário)
+API_SESSION.headers.update({'Accept': 'application/json'})
+
+# Chamadas à IA podem levar até 60 s. Elas usam uma Session com pool próprio para
+# não prender as conexões keep-alive usadas pelas rotas rápidas (listas e CRUD)
+# enquanto esperam a resposta do modelo.
+API_IA_POOL_SIZE = int(os.getenv('API_IA_POOL_SIZE', '10'))
+IA_SESSION = requests.Session()
+_ia_adapter = KeepAliveAdapter(pool_connections=1, pool_maxsize=API_IA_POOL_SIZE)
+IA_SESSION.mount('http://', _ia_adapter)
+IA_SESSION.mount('https://', _ia_adapter)
+IA_SESSION.headers.update({'Accept': 'application/json'})
+
+# Executor para disparar em paralelo chamadas independentes à API dentro de uma
+# mesma requisição (ex.: disciplina + cronograma + avaliações), reduzindo o tempo
+# total de N round-trips sequenciais para o da chamada mais lenta.
+API_EXECUTOR = ThreadPoolExecutor(max_workers=API_MAX_WORKERS, thread_name_prefix='api')
+
+# ===== CACHE EM MEMÓRIA (TTL) PARA LISTAS DA API =====
+# Listas que mudam pouco (alunos, disciplinas, coordenadores...) são consultadas
+# a cada carregamento de página. Guardamos o JSON por alguns segundos, separado
+# por usuário, e descartamos as entradas do recurso sempre que uma escrita
+# (POST/PUT/DELETE) feita pelo API_SESSION é concluída com sucesso.
+# O número de entradas é limitado (LRU) para a memória não crescer com o
+# número de usuários/buscas distintas.
+API_CACHE_TTL = int(os.getenv('API_CACHE_TTL', '30'))
+API_CACHE_MAXSIZE = int(os.getenv('API_CACHE_MAXSIZE', '1024'))
+_api_cache = OrderedDict()
+_api_cache_lock = threading.Lock()
+
+def cache_get(key):
+    with _api_cache_lock:
+        entry = _api_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del _api_cache[key]
+            return None
+        _api_cache.move_to_end(key)
+        return entry[1]
+
+def cache_set(key, value, ttl=None):
+    with _api_cache_lock:
+        _api_cache[key] = (time.monotonic() + (API_CACHE_TTL if ttl is None else ttl), value)
+        _api_cache.move_to_end(key)
+        while len(_api_cache) > API_CACHE_MAXSIZE:
+            _api_cache.popitem(last=False)
+
+def cache_invalidate(prefix):
+    # Remove todas as entradas cujo path começa com o recurso informado (ex.: '/disciplinas')
+    with _api_cache_lock:
+        for key in [k for k in _api_cache if k[0] == prefix or k[0].startswith(prefix + '/')]:
+            del _api_cache[key]
+
+# POSTs que apenas consultam a API (não alteram dados) e por isso não invalidam o cache
+CACHE_POSTS_SEM_ESCRITA = {'ia'}
+# Recursos cujas respostas em cache dependem de outros (a IA responde com base
+# na base de conhecimento e nos documentos enviados)
+CACHE_DEPENDENTES = {
+    'baseconhecimento': ['/ia'],
+    'documentos': ['/ia'],
+}
+
+# Métodos que alteram dados na API (HEAD/OPTIONS, como o aquecimento do pool, não invalidam)
+CACHE_METODOS_ESCRITA = {'POST', 'PUT', 'PATCH', 'DELETE'}
+
+def _invalidate_cache_on_write(response, *args, **kwargs):
+    # Hook do API_SESSION: qualquer escrita bem-sucedida invalida o recurso correspondente
+    if response.request.method in CACHE_METODOS_ESCRITA and response.status_code < 400:
+        url = response.request.url
+        if url.startswith(API_BASE_URL):
+            recurso = url[len(API_BASE_URL):].lstrip('/').split('/', 1)[0].split('?', 1)[0]
+            if recurso in CACHE_POSTS_SEM_ESCRITA:
+                return
+            cache_invalidate(f"/{recurso}")
+            for dependente in CACHE_DEPENDENTES.get(recurso, []):
+                cache_invalidate(dependente)
+
+API_SESSION.hooks['response'].append(_invalidate_cache_on_write)
+
+# ===== AQUECIMENTO DO POOL DE CONEXÕES =====
+# Abre algumas conexões com a API em segundo plano na inicialização, para que as
+# primeiras requisições dos usuários não paguem DNS + handshake TCP/TLS.
+# Qualquer resposta serve (inclusive 404); falhas são ignoradas.
+API_WARMUP_CONNECTIONS = min(int(os.getenv('API_WARMUP_CONNECTIONS', '4')), API_POOL_SIZE)
+
+def _warmup_connection():
+    try:
+        API_SESSION.head(f"{API_BASE_URL}/", timeout=2)
+    except requests.exceptions.RequestException as e:
+        app.logger.debug("Aquecimento de conexão com a API falhou: %s", e)
+
+for _ in range(API_WARMUP_CONNECTIONS):
+    API_EXECUTOR.submit(_warmup_connection)
+
+# ===== EXCLUSÕES NA API EM SEGUNDO PLANO =====
+# Os DELETEs rodam no API_EXECUTOR. A rota espera a resposta por até
+# DELETE_WAIT_TIMEOUT segundos; se a API demorar mais, o usuário recebe
+# "em processamento" e o worker é liberado (o resultado fica no log).
+# Com ?sync=1 a rota espera a resposta até o fim.
+DELETE_WAIT_TIMEOUT = float(os.getenv('DELETE_WAIT_TIMEOUT', '2'))
+
+def _log_api_delete(url, future):
+    if future.exception() is not None:
+        app.logger.warning("DELETE %s falhou: %s", url, future.exception())
+    else:
+        app.logger.info("DELETE %s - Status: %s", url, future.result().status_code)
+
+def submit_api_delete(url, headers, timeout=API_TIMEOUT):
+    # Os headers vêm da requisição atual: a thread do executor não tem acesso a g/session
+    future = API_EXECUTOR.submit(API_SESSION.delete, url, headers=headers, timeout=timeout)
+    future.add_done_callback(lambda f: _log_api_delete(url, f))
+    return future
+
+def wait_api_delete(future):
+    # Resultado do DELETE, ou None se ele continuar em andamento após DELETE_WAIT_TIMEOUT
+    if request.args.get('sync') == '1':
+        return future.result()
+    try:
+        return future.result(timeout=DELETE_WAIT_TIMEOUT)
+    except FutureTimeoutError:
+        return None
+
 # ===== FUNÇÕES HELPER PARA AUTENTICAÇÃO =====
 
 def handle_token_expiration():
     # Faz logout automático quando o token expira
-    print("[INFO] Token expirado - fazendo logout automático")
+    app.logger.info("Token expirado - fazendo logout automático")
     session.clear()
     flash("Sua sessão expirou. Por favor, faça login novamente.", "error")
     return redirect(url_for('index'))
@@ -123,10 +364,10 @@ def check_token_validity():
         }
         # Faz uma requisição leve para verificar se o token é válido
         # Usa um endpoint que não requer permissões especiais
-        test_response = requests.get(f"{API_BASE_URL}/professores/lista_professores/", headers=headers, timeout=5)
+        test_response = API_SESSION.get(f"{API_BASE_URL}/professores/lista_professores/", headers=headers, timeout=5)
         
         if test_response.status_code == 401:
-            print("[INFO] Token expirado detectado - fazendo logout automático")
+            app.logger.info("Token expirado detectado - fazendo logout automático")
             session.clear()
             flash("Sua sessão expirou. Por favor, faça login novamente.", "error")
             return False
@@ -137,24 +378,24 @@ def check_token_validity():
             # Outros erros podem indicar problema de conexão, mas não necessariamente token inválido
             return True
     except requests.exceptions.ConnectionError as e:
-        print(f"[WARN] API não está disponível (ConnectionError): {e}")
+        app.logger.warning("API não está disponível (ConnectionError): %s", e)
         # Se a API não estiver disponível (servidor reiniciado), invalida a sessão
-        print("[INFO] API não disponível - invalidando sessão para forçar novo login")
+        app.logger.info("API não disponível - invalidando sessão para forçar novo login")
         session.clear()
         flash("Servidor não está disponível. Por favor, faça login novamente.", "error")
         return False
     except requests.exceptions.Timeout as e:
-        print(f"[WARN] Timeout ao verificar token: {e}")
+        app.logger.warning("Timeout ao verificar token: %s", e)
         # Timeout também pode indicar que o servidor não está respondendo
-        print("[INFO] Timeout na verificação - invalidando sessão")
+        app.logger.info("Timeout na verificação - invalidando sessão")
         session.clear()
         flash("Servidor não está respondendo. Por favor, faça login novamente.", "error")
         return False
     except Exception as e:
-        print(f"[WARN] Erro ao verificar token: {e}")
+        app.logger.warning("Erro ao verificar token: %s", e)
         # Para outros erros, assume que pode ser problema temporário
         # Mas por segurança, invalida a sessão se não conseguir verificar
-        print("[INFO] Erro na verificação - invalidando sessão por segurança")
+        app.logger.info("Erro na verificação - invalidando sessão por segurança")
         session.clear()
         flash("Erro ao verificar sessão. Por favor, faça login novamente.", "error")
         return False
@@ -162,37 +403,196 @@ def check_token_validity():
 def get_auth_headers():
     # Retorna os headers de autenticação com o access_token da sessão atual.
     # Usado para todas as requisições autenticadas à API.
+    # Memorizado em g durante a requisição (enquanto o token da sessão não mudar);
+    # o dict retornado é compartilhado e não deve ser alterado.
+    token = (session.get('user') or {}).get('access_token')
+    memo = g.get('_auth_headers_memo')
+    if memo is not None and memo[0] == token:
+        return memo[1]
+    headers = build_auth_headers()
+    g._auth_headers_memo = (token, headers)
+    return headers
+
+def build_auth_headers():
+    # Monta os headers de autenticação a partir da sessão (sem memorização)
     headers = {
         "Content-Type": "application/json"
     }
     
-    # Adiciona o token Bearer se existir na sessão
-    if 'user' in session and session['user'].get('access_token'):
-        token = session['user']['access_token']
-        # Remove espaços e quebras de linha do token
-        token = str(token).strip()
-        
-        # Verifica se o token não está vazio
-        if not token:
-            print("[ERROR] Token encontrado mas está vazio!")
-            return headers
-        
+    user = session.get('user') or {}
+    # Remove espaços e quebras de linha do token
+    token = str(user.get('access_token') or '').strip()
+    if token:
         headers["Authorization"] = f"Bearer {token}"
-        user_role = session['user'].get('tipo', 'N/A')
-        user_email = session['user'].get('email', 'N/A')
-        print(f"[DEBUG] Token incluído nos headers: {token[:20]}...")
-        print(f"[DEBUG] Token length: {len(token)} caracteres")
-        print(f"[DEBUG] User Role: {user_role}, Email: {user_email}")
-        print(f"[DEBUG] Authorization header completo: Bearer {token[:30]}...")
+        app.logger.debug("Headers de autenticação montados para %s", user.get('email', 'N/A'))
+    elif user.get('access_token'):
+        app.logger.error("Token encontrado mas está vazio!")
     else:
-        print("[DEBUG] ATENÇÃO: Nenhum access_token encontrado na sessão!")
-        if 'user' in session:
-            print(f"[DEBUG] Session user keys: {list(session['user'].keys())}")
-        else:
-            print("[DEBUG] Nenhum 'user' encontrado na sessão!")
+        app.logger.debug("ATENÇÃO: Nenhum access_token encontrado na sessão!")
     
     return headers
 
+@app.before_request
+def load_auth_headers():
+    # Monta os headers de autenticação uma única vez por requisição (reaproveitados via g)
+    if request.endpoint != 'static' and 'user' in session:
+        g.auth_headers = get_auth_headers()
+
+@app.before_request
+def touch_session():
+    # Renova a validade da sessão no armazenamento para usuários que só navegam
+    # (sem gravar na sessão): uma gravação por hora em vez de uma por requisição
+    if request.endpoint != 'static' and 'user' in session:
+        agora = int(time.time())
+        if agora - session.get('_touched_at', 0) >= SESSION_TOUCH_INTERVAL:
+            session['_touched_at'] = agora
+
+# URLs da API usadas em rotas frequentes, montadas uma única vez
+MENSAGENS_ALUNO_URL = f"{API_BASE_URL}/mensagens_aluno/"
+MENSAGENS_DASHBOARD_URL = f"{API_BASE_URL}/mensagens_aluno/dashboard/"
+IA_GERAR_RESPOSTA_URL = f"{API_BASE_URL}/ia/gerar-resposta"
+AVISO_LIST_URL = f"{API_BASE_URL}/aviso/get_lista_aviso/"
+AVISO_CREATE_URL = f"{API_BASE_URL}/aviso/"
+DISCIPLINAS_LIST_URL = f"{API_BASE_URL}/disciplinas/lista_disciplina/"
+DISCIPLINAS_CREATE_URL = f"{API_BASE_URL}/disciplinas/"
+CRONOGRAMA_CREATE_URL = f"{API_BASE_URL}/cronograma/"
+AVALIACAO_CREATE_URL = f"{API_BASE_URL}/avaliacao/"
+
+def get_upload_headers():
+    # Headers para uploads multipart: os de autenticação sem Content-Type (definido
+    # pelo corpo, com o boundary). Montados uma única vez por requisição, em g.
+    if 'upload_headers' not in g:
+        headers = dict(g.get('auth_headers') or get_auth_headers())
+        headers.pop('Content-Type', None)
+        g.upload_headers = headers
+    return g.upload_headers
+
+@app.context_processor
+def inject_user():
+    # Disponibiliza o usuário logado em todos os templates ({{ user.* }})
+    return {'user': session.get('user', {})}
+
+def api_get(path, headers=None, timeout=API_TIMEOUT, **kwargs):
+    # GET na API usando o pool compartilhado.
+    # Em threads do API_EXECUTOR não há contexto de requisição: passe os headers já montados.
+    if headers is None:
+        headers = g.get('auth_headers') or get_auth_headers()
+    return API_SESSION.get(f"{API_BASE_URL}{path}", headers=headers, timeout=timeout, **kwargs)
+
+def api_get_many(paths, headers=None, timeout=10):
+    # Agregador: dispara vários GETs independentes em paralelo (API_EXECUTOR) e devolve
+    # {path: resposta}. O tempo total fica próximo ao da chamada mais lenta, em vez da soma.
+    # Erros de rede ficam no lugar da resposta do path correspondente.
+    if headers is None:
+        headers = g.get('auth_headers') or get_auth_headers()
+    futures = {path: API_EXECUTOR.submit(api_get, path, headers, timeout) for path in paths}
+    results = {}
+    for path, future in futures.items():
+        try:
+            results[path] = future.result()
+        except requests.exceptions.RequestException as e:
+            results[path] = e
+    return results
+
+def oparse(response):
+    # Decodifica o corpo de uma resposta da API com orjson.
+    # Erros de JSON viram RequestException, como já acontecia com response.json().
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.InvalidJSONError(str(e), response=response)
+
+def passthrough(response):
+    # Repassa o corpo da API como está (sem decodificar e recodificar o JSON)
+    return app.response_class(
+        response.content,
+        status=response.status_code,
+        content_type=response.headers.get('Content-Type', 'application/json')
+    )
+
+def api_cache_key(path, params=None):
+    # Chave do cache de listas: path + usuário (+ parâmetros da busca)
+    return (path, session.get('user', {}).get('email', ''), tuple(sorted(params.items())) if params else None)
+
+def api_get_cached(path, ttl=None, params=None):
+    # GET com cache TTL por usuário. Retorna (dados, status); só respostas 200 são guardadas.
+    key = api_cache_key(path, params)
+    data = cache_get(key)
+    if data is not None:
+        return data, 200
+    response = api_get(path, params=params)
+    if response.status_code != 200:
+        return None, response.status_code
+    data = oparse(response)
+    cache_set(key, data, ttl)
+    return data, 200
+
+def api_get_cached_body(path, ttl=None, params=None):
+    # Como api_get_cached, mas guarda e devolve o corpo bruto (bytes) para rotas que
+    # apenas repassam a lista ao navegador, sem decodificar nem recodificar o JSON.
+    key = api_cache_key(path, params) + ('raw',)
+    body = cache_get(key)
+    if body is not None:
+        return body, 200
+    response = api_get(path, params=params)
+    if response.status_code != 200:
+        return None, response.status_code
+    cache_set(key, response.content, ttl)
+    return response.content, 200
+
+def api_list_async(path, ttl=None):
+    # Lista da API com o mesmo cache de api_get_cached, buscada em segundo plano.
+    # Retorna um Future: .result() devolve a lista ([] em caso de erro ou status != 200).
+    # Chave e headers são montados aqui, pois a thread do executor não tem a sessão.
+    key = api_cache_key(path)
+    data = cache_get(key)
+    if data is not None:
+        future = Future()
+        future.set_result(data)
+        return future
+    headers = g.get('auth_headers') or get_auth_headers()
+
+    def fetch():
+        try:
+            response = api_get(path, headers)
+            if response.status_code == 200:
+                data = oparse(response)
+                cache_set(key, data, ttl)
+                return data
+        except requests.exceptions.RequestException as e:
+            app.logger.debug("Erro ao buscar %s: %s", path, e)
+        return []
+
+    return API_EXECUTOR.submit(fetch)
+
+# Lista de disciplinas: usada nos selects de docentes/conteúdo, no mapa id -> nome dos
+# conteúdos e na busca do ID pelo nome. Todos leem a mesma entrada do cache, então
+# uma única chamada à API atende todos eles enquanto a entrada for válida
+DISCIPLINAS_PATH = "/disciplinas/lista_disciplina/"
+DISCIPLINAS_CACHE_TTL = 60
+
+def get_disciplinas_async():
+    # Future com a lista de disciplinas (cache compartilhado; [] em caso de erro)
+    return api_list_async(DISCIPLINAS_PATH, ttl=DISCIPLINAS_CACHE_TTL)
+
+def json_bytes_response(corpo):
+    # Resposta JSON já serializada, com ETag: em consultas repetidas o navegador envia
+    # If-None-Match e recebe 304 sem corpo quando a lista não mudou.
+    resp = app.response_class(corpo, status=200, mimetype='application/json')
+    resp.add_etag()
+    return resp.make_conditional(request)
+
+# Campos em que a API pode devolver o nome do usuário, em ordem de preferência
+USER_NOME_KEYS = ('name', 'nome_aluno', 'nome')
+
+def first_value(data, keys, default=''):
+    # Primeiro valor preenchido entre as chaves informadas
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return default
+
 # Decorator para proteger rotas que precisam de login
 def login_required(f):
     @wraps(f)
@@ -205,7 +605,7 @@ def login_required(f):
         # Verifica se a sessão foi criada antes do servidor ser reiniciado
         session_start_time = session.get('server_start_time')
         if session_start_time is None or session_start_time < SERVER_START_TIME:
-            print("[INFO] Sessão criada antes do reinício do servidor - invalidando")
+            app.logger.info("Sessão criada antes do reinício do servidor - invalidando")
             session.clear()
             flash("Servidor foi reiniciado. Por favor, faça login novamente.", "info")
             return redirect(url_for('index'))
@@ -257,7 +657,7 @@ def index():
         # Isso garante que sessões antigas sejam sempre invalidadas após reiniciar
         session_start_time = session.get('server_start_time')
         if session_start_time is None or session_start_time < SERVER_START_TIME:
-            print("[INFO] Sessão criada antes do reinício do servidor - invalidando")
+            app.logger.info("Sessão criada antes do reinício do servidor - invalidando")
             session.clear()
             flash("Servidor foi reiniciado. Por favor, faça login novamente.", "info")
             return render_template('login.html')
@@ -289,67 +689,64 @@ def login():
         credentials = {"email": email, "password": password}
 
         try:
-            print(f"[DEBUG] Tentando login com: {email}")
-            print(f"[DEBUG] Email normalizado: {email.strip().lower()}")
-            response = requests.post(auth_url, json=credentials, timeout=10)
-            print(f"[DEBUG] Status Code: {response.status_code}")
-            print(f"[DEBUG] Response: {response.text[:500]}")  # Limita a 500 caracteres para não poluir logs
+            if app.logger.isEnabledFor(logging.DEBUG):
+                app.logger.debug("Tentando login com: %s", email)
+                app.logger.debug("Email normalizado: %s", email.strip().lower())
+            response = API_SESSION.post(auth_url, data=orjson.dumps(credentials), headers={"Content-Type": "application/json"}, timeout=10)
+            app.logger.debug("Status Code: %s", response.status_code)
+            if app.logger.isEnabledFor(logging.DEBUG):
+                app.logger.debug("Response: %s", response.text[:500])  # Limita a 500 caracteres para não poluir logs
             
             # Verifica o status code antes de processar
             if response.status_code != 200:
                 error_text = response.text
                 try:
-                    error_json = response.json()
+                    error_json = oparse(response)
                     error_detail = error_json.get('detail', error_text)
                 except:
                     error_detail = error_text
                 
-                print(f"[ERROR] Login falhou com status {response.status_code}: {error_detail}")
+                app.logger.error("Login falhou com status %s: %s", response.status_code, error_detail)
                 flash(f"Erro ao fazer login: {error_detail}", "error")
                 return redirect(url_for('index'))
             
-            api_response = response.json()
-            print(f"[DEBUG] API Response JSON: {api_response}")
+            api_response = oparse(response)
+            app.logger.debug("API Response JSON: %s", api_response)
 
             # A API retorna os dados do usuário dentro de um objeto 'user'
             # Estrutura esperada: {"message": "...", "access_token": "...", "user": {"id": "...", "email": "...", "name": "...", "role": "..."}}
             user_data = api_response.get('user', {})
             
             if not user_data:
-                print("[ERROR] Resposta da API não contém objeto 'user'")
-                print(f"[DEBUG] Estrutura recebida: {list(api_response.keys())}")
+                app.logger.error("Resposta da API não contém objeto 'user'")
+                if app.logger.isEnabledFor(logging.DEBUG):
+                    app.logger.debug("Estrutura recebida: %s", list(api_response.keys()))
                 flash("Erro: Resposta da API em formato inesperado.", "error")
                 return redirect(url_for('index'))
 
-            print(f"[DEBUG] User Data extraído: {user_data}")
+            app.logger.debug("User Data extraído: %s", user_data)
 
             # Extrai o ID do usuário - a API sempre retorna 'id' dentro de 'user'
             user_id = user_data.get('id')
             
             if not user_id:
-                print("[ERROR] ID do usuário não encontrado na resposta")
-                print(f"[DEBUG] User data keys: {list(user_data.keys())}")
+                app.logger.error("ID do usuário não encontrado na resposta")
+                if app.logger.isEnabledFor(logging.DEBUG):
+                    app.logger.debug("User data keys: %s", list(user_data.keys()))
                 flash("Erro: ID do usuário não encontrado na resposta da API.", "error")
                 return redirect(url_for('index'))
             
             # Extrai o nome do usuário
-            # A API retorna 'name' que pode ser um nome completo ou separado
-            nome_completo = user_data.get('name', '')
-            
-            # Se o nome estiver vazio, tenta outros campos ou usa email como fallback
-            if not nome_completo:
-                nome_completo = (
-                    user_data.get('nome_aluno') or 
-                    user_data.get('nome') or 
-                    email.split('@')[0]  # Fallback: parte do email
-                )
+            # A API retorna 'name' que pode ser um nome completo ou separado;
+            # se vier vazio, tenta outros campos ou usa a parte do email como fallback
+            nome_completo = first_value(user_data, USER_NOME_KEYS) or email.split('@')[0]
             
             # Extrai o tipo/role do usuário
             user_tipo = user_data.get('role', 'usuario')
             # Normaliza o role para lowercase para garantir consistência
             if user_tipo:
                 user_tipo = user_tipo.lower().strip()
-            print(f"[DEBUG] Role extraído da API: '{user_tipo}' (original: '{user_data.get('role', 'N/A')}')")
+            app.logger.debug("Role extraído da API: '%s' (original: '%s')", user_tipo, user_data.get('role', 'N/A'))
             
             # Extrai o email
             user_email = user_data.get('email', email)
@@ -362,12 +759,13 @@ def login():
                 access_token = str(access_token).strip()
             
             if not access_token:
-                print("[ERROR] Access token não encontrado na resposta")
+                app.logger.error("Access token não encontrado na resposta")
                 flash("Erro: Token de acesso não encontrado na resposta da API.", "error")
                 return redirect(url_for('index'))
             
-            print(f"[DEBUG] Token recebido do login: {len(access_token)} caracteres")
-            print(f"[DEBUG] Token preview: {access_token[:30]}...")
+            if app.logger.isEnabledFor(logging.DEBUG):
+                app.logger.debug("Token recebido do login: %s caracteres", len(access_token))
+                app.logger.debug("Token preview: %s...", access_token[:30])
 
             # Guarda informações na sessão
             session['user'] = {
@@ -377,27 +775,26 @@ def login():
                 'tipo': user_tipo,  # Já normalizado para lowercase
                 'matricula': user_data.get('matricula_ra', ''),
                 'access_token': access_token.strip(),  # Garante que está limpo
-                'raw_data': api_response  # Guarda dados brutos para debug
             }
+            # Dados brutos da API (token duplicado incluso) só em modo debug: a sessão é
+            # serializada e gravada a cada requisição
+            if app.config['DEBUG']:
+                session['user']['raw_data'] = api_response
             
             # Validação adicional: verifica se o token foi salvo corretamente
             saved_token = session['user'].get('access_token', '')
             if not saved_token:
-                print("[ERROR] CRÍTICO: access_token não foi salvo na sessão!")
-            else:
-                print(f"[DEBUG] Token salvo na sessão: {len(saved_token)} caracteres")
-                print(f"[DEBUG] Token salvo (preview): {saved_token[:30]}...")
+                app.logger.error("CRÍTICO: access_token não foi salvo na sessão!")
+            elif app.logger.isEnabledFor(logging.DEBUG):
+                app.logger.debug("Token salvo na sessão: %s caracteres", len(saved_token))
+                app.logger.debug("Token salvo (preview): %s...", saved_token[:30])
                 # Verifica se o token salvo é igual ao recebido
                 if saved_token != access_token.strip():
-                    print(f"[WARN] Token salvo difere do recebido! Salvo: {len(saved_token)}, Recebido: {len(access_token)}")
+                    app.logger.warning("Token salvo difere do recebido! Salvo: %s, Recebido: %s", len(saved_token), len(access_token))
             
-            print(f"[INFO] ====== LOGIN REALIZADO COM SUCESSO ======")
-            print(f"[INFO] User ID: {user_id}")
-            print(f"[INFO] User Email: {user_email}")
-            print(f"[INFO] User Name: {nome_completo}")
-            print(f"[INFO] User Role: {user_tipo}")
-            print(f"[INFO] Access Token: {access_token[:50]}...")
-            print(f"[INFO] ===========================================")
+            # Um único registro por login (sem trecho do token), com os dados em extra
+            app.logger.info("Login realizado: id=%s email=%s role=%s", user_id, user_email, user_tipo,
+                            extra={'user_id': user_id, 'user_email': user_email, 'user_role': user_tipo})
 
             # Login bem-sucedido - configurar sessão
             # Sessão não permanente - expira quando o navegador é fechado
@@ -409,13 +806,14 @@ def login():
             return redirect(url_for('dashboard'))
 
         except requests.exceptions.HTTPError as e:
-            print(f"[DEBUG] HTTPError: {e}")
+            app.logger.debug("HTTPError: %s", e)
             error_detail = "Erro desconhecido"
             
             if hasattr(e, 'response') and e.response is not None:
-                print(f"[DEBUG] Response Text: {e.response.text}")
+                if app.logger.isEnabledFor(logging.DEBUG):
+                    app.logger.debug("Response Text: %s", e.response.text)
                 try:
-                    error_json = e.response.json()
+                    error_json = oparse(e.response)
                     error_detail = error_json.get('detail', e.response.text)
                 except:
                     error_detail = e.response.text or str(e)
@@ -423,7 +821,7 @@ def login():
                 status_code = e.response.status_code
                 
                 if status_code == 401:
-                    print(f"[ERROR] Status 401 - Credenciais inválidas")
+                    app.logger.error("Status 401 - Credenciais inválidas")
                     flash("Credenciais inválidas. Verifique seu email e senha.", "error")
                 elif status_code == 404:
                     flash("Endpoint de login não encontrado na API. Verifique a configuração.", "error")
@@ -436,22 +834,22 @@ def login():
             
             return redirect(url_for('index'))
         except requests.exceptions.ConnectionError as e:
-            print(f"[DEBUG] ConnectionError: Não foi possível conectar à API em {auth_url}")
-            print(f"[DEBUG] Erro: {e}")
+            app.logger.debug("ConnectionError: Não foi possível conectar à API em %s", auth_url)
+            app.logger.debug("Erro: %s", e)
             flash("Erro de conexão com o servidor de autenticação. Verifique se a API está online.", "error")
             return redirect(url_for('index'))
         except requests.exceptions.Timeout as e:
-            print(f"[DEBUG] Timeout: Timeout ao conectar à API em {auth_url}")
-            print(f"[DEBUG] Erro: {e}")
+            app.logger.debug("Timeout: Timeout ao conectar à API em %s", auth_url)
+            app.logger.debug("Erro: %s", e)
             flash("O servidor de autenticação demorou muito para responder. Tente novamente.", "error")
             return redirect(url_for('index'))
         except requests.exceptions.RequestException as e:
-            print(f"[DEBUG] RequestException: {e}")
+            app.logger.debug("RequestException: %s", e)
             flash("Ocorreu um erro de comunicação durante o login. Tente novamente.", "error")
             return redirect(url_for('index'))
         except Exception as e:
-            print(f"[DEBUG] Exception Inesperada: {e}")
-            print(f"[DEBUG] Tipo: {type(e)}")
+            app.logger.debug("Exception Inesperada: %s", e)
+            app.logger.debug("Tipo: %s", type(e))
             import traceback
             traceback.print_exc()
             flash("Ocorreu um erro inesperado durante o login.", "error")
@@ -462,7 +860,7 @@ def login():
 @app.route('/logout')
 def logout():
     # Limpa a sessão do utilizador (faz logout)
-    print(f"[DEBUG] Logout realizado por: {session.get('user', {}).get('nome', 'Desconhecido')}")
+    app.logger.debug("Logout realizado por: %s", session.get('user', {}).get('nome', 'Desconhecido'))
     # Limpa toda a sessão para garantir que nenhum dado permaneça
     session.clear()
     flash("Logout realizado com sucesso. Até logo!", "info")
@@ -485,19 +883,19 @@ def debug_token():
         try:
             headers = get_auth_headers()
             # Faz uma requisição GET para verificar se o token funciona
-            test_response = requests.get(f"{API_BASE_URL}/professores/lista_professores/", headers=headers, timeout=5)
+            test_response = API_SESSION.get(f"{API_BASE_URL}/professores/lista_professores/", headers=headers, timeout=5)
             token_valid = test_response.status_code == 200
             
             if test_response.status_code == 401:
                 api_role = "Token inválido ou expirado"
                 try:
-                    api_error_detail = test_response.json()
+                    api_error_detail = oparse(test_response)
                 except:
                     api_error_detail = test_response.text
             elif test_response.status_code == 403:
                 api_role = "Token válido mas sem permissão"
                 try:
-                    api_error_detail = test_response.json()
+                    api_error_detail = oparse(test_response)
                 except:
                     api_error_detail = test_response.text
             elif test_response.status_code == 200:
@@ -511,7 +909,7 @@ def debug_token():
                 'email_institucional': 'teste.debug@docente.unip.br',
                 'password': '123456'
             }
-            test_post_response = requests.post(f"{API_BASE_URL}/professores/", json=test_post_data, headers=headers, timeout=5)
+            test_post_response = API_SESSION.post(f"{API_BASE_URL}/professores/", data=orjson.dumps(test_post_data), headers=headers, timeout=5)
             test_post_result = {
                 'status_code': test_post_response.status_code,
                 'response': test_post_response.text[:200] if test_post_response.text else 'Sem resposta'
@@ -560,7 +958,7 @@ def check_user_role():
             headers = get_auth_headers()
             # Faz uma requisição que retorna informações do usuário
             # Usa o endpoint de professores para testar, mas o importante é ver o role
-            test_response = requests.get(f"{API_BASE_URL}/professores/lista_professores/", headers=headers, timeout=5)
+            test_response = API_SESSION.get(f"{API_BASE_URL}/professores/lista_professores/", headers=headers, timeout=5)
             
             if test_response.status_code == 200:
                 role_from_api = "Token válido - role verificado via API"
@@ -569,7 +967,7 @@ def check_user_role():
             elif test_response.status_code == 403:
                 api_error = "Token válido mas sem permissão (role pode estar incorreto)"
                 try:
-                    error_detail = test_response.json()
+                    error_detail = oparse(test_response)
                     api_error = error_detail.get('detail', api_error)
                 except:
                     pass
@@ -605,7 +1003,7 @@ def check_user_role():
 @login_required  
 def dashboard():
     # Dashboard principal - busca avisos da API
-    print(f"[DEBUG] Dashboard acessado por: {session.get('user', {}).get('nome', 'Desconhecido')}")
+    app.logger.debug("Dashboard acessado por: %s", session.get('user', {}).get('nome', 'Desconhecido'))
     
     # Inicializa estrutura de dados do dashboard
     dashboard_data = {
@@ -618,42 +1016,45 @@ def dashboard():
     
     # Busca avisos da API
     try:
-        print(f"[DEBUG] Buscando avisos em: {API_BASE_URL}/aviso/get_lista_aviso/")
+        app.logger.debug("Buscando avisos em: %s/aviso/get_lista_aviso/", API_BASE_URL)
         headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/aviso/get_lista_aviso/", headers=headers, timeout=5)
-        print(f"[DEBUG] Avisos - Status: {response.status_code}")
+        response = API_SESSION.get(f"{API_BASE_URL}/aviso/get_lista_aviso/", headers=headers, timeout=5)
+        app.logger.debug("Avisos - Status: %s", response.status_code)
         
         if response.status_code == 200:
-            data = response.json()
-            print(f"[DEBUG] Avisos - Tipo de dados: {type(data)}")
+            # orjson decodifica direto dos bytes; o corpo bruto é liberado em seguida
+            # para não ficar na memória junto com a lista durante a renderização
+            data = oparse(response)
+            del response
+            app.logger.debug("Avisos - Tipo de dados: %s", type(data))
             
             if isinstance(data, list):
                 dashboard_data['avisos'] = data
-                print(f"[DEBUG] {len(data)} avisos encontrados")
+                app.logger.debug("%s avisos encontrados", len(data))
             else:
-                print(f"[DEBUG] Formato inesperado de avisos: {data}")
+                app.logger.debug("Formato inesperado de avisos: %s", data)
         elif response.status_code == 403:
-            print(f"[WARN] Avisos - Status 403 - Acesso negado")
+            app.logger.warning("Avisos - Status 403 - Acesso negado")
             try:
-                error_detail = response.json()
-                print(f"[WARN] Detalhes do erro: {error_detail}")
+                error_detail = oparse(response)
+                app.logger.warning("Detalhes do erro: %s", error_detail)
                 user_role = session.get('user', {}).get('tipo', 'unknown')
-                print(f"[WARN] User role: {user_role}")
+                app.logger.warning("User role: %s", user_role)
             except:
-                print(f"[WARN] Resposta: {response.text[:200]}")
+                app.logger.warning("Resposta: %s", response.text[:200])
             # Continua sem avisos, mas não bloqueia o dashboard
         elif response.status_code == 401:
-            print(f"[ERROR] Avisos - Status 401 - Token inválido ou expirado")
+            app.logger.error("Avisos - Status 401 - Token inválido ou expirado")
             return handle_token_expiration()
         else:
-            print(f"[WARN] Avisos retornou status {response.status_code}")
+            app.logger.warning("Avisos retornou status %s", response.status_code)
             try:
-                print(f"[WARN] Resposta: {response.text[:200]}")
+                app.logger.warning("Resposta: %s", response.text[:200])
             except:
                 pass
             
     except requests.exceptions.RequestException as e:
-        print(f"[DEBUG] Erro ao buscar avisos: {e}")
+        app.logger.debug("Erro ao buscar avisos: %s", e)
     
     # Calcula totais
     dashboard_data['total_avisos'] = len(dashboard_data['avisos'])
@@ -661,8 +1062,8 @@ def dashboard():
     dashboard_data['total_professores'] = 0  # Placeholder
     dashboard_data['total_alunos'] = 0  # Placeholder
     
-    print(f"[DEBUG] Dashboard pronto - Total de avisos: {dashboard_data['total_avisos']}")
-    print(f"[DEBUG] Usuário: {dashboard_data['user'].get('nome', 'N/A')} ({dashboard_data['user'].get('email', 'N/A')})")
+    app.logger.debug("Dashboard pronto - Total de avisos: %s", dashboard_data['total_avisos'])
+    app.logger.debug("Usuário: %s (%s)", dashboard_data['user'].get('nome', 'N/A'), dashboard_data['user'].get('email', 'N/A'))
 
     return render_template('dashboard.html', **dashboard_data)
 
@@ -671,139 +1072,155 @@ def dashboard():
 def test_api():
     # Testa conectividade com a API - útil para debug
     try:
-        print(f"[DEBUG] Testando API em: {API_BASE_URL}")
+        app.logger.debug("Testando API em: %s", API_BASE_URL)
+        
+        # Teste POST com dados mínimos (disparado já, em paralelo com os GETs abaixo)
+        test_data = {
+            'id_funcional': 'TEST123',
+            'nome_professor': 'Teste',
+            'sobrenome_professor': 'API',
+            'email_institucional': 'teste@docente.unip.br',
+            'password': '123456'
+        }
+        post_future = API_EXECUTOR.submit(API_SESSION.post, f"{API_BASE_URL}/professores/", data=orjson.dumps(test_data), headers={"Content-Type": "application/json"}, timeout=5)
+        
+        # Raiz, avisos e professores são independentes: buscados em paralelo
+        respostas = api_get_many(["/", "/aviso/get_lista_aviso/", "/professores/lista_professores/"], timeout=5)
         
         # Teste básico de conectividade
-        response = requests.get(f"{API_BASE_URL}/", timeout=5)
-        print(f"[DEBUG] API Root - Status: {response.status_code}")
+        response = respostas["/"]
+        if isinstance(response, Exception):
+            raise response
+        app.logger.debug("API Root - Status: %s", response.status_code)
         
         # Teste do endpoint de avisos (que sabemos que funciona)
-        headers = get_auth_headers()
-        response_avisos = requests.get(f"{API_BASE_URL}/aviso/get_lista_aviso/", headers=headers, timeout=5)
-        print(f"[DEBUG] Avisos - Status: {response_avisos.status_code}")
+        response_avisos = respostas["/aviso/get_lista_aviso/"]
+        if isinstance(response_avisos, Exception):
+            raise response_avisos
+        app.logger.debug("Avisos - Status: %s", response_avisos.status_code)
         if response_avisos.status_code == 403:
             try:
-                error_detail = response_avisos.json()
-                print(f"[WARN] Erro 403 ao buscar avisos: {error_detail}")
+                error_detail = oparse(response_avisos)
+                app.logger.warning("Erro 403 ao buscar avisos: %s", error_detail)
             except:
-                print(f"[WARN] Resposta: {response_avisos.text[:200]}")
+                app.logger.warning("Resposta: %s", response_avisos.text[:200])
         
         # Teste do endpoint de professores (GET não existe)
-        try:
-            headers = get_auth_headers()
-            response_professores = requests.get(f"{API_BASE_URL}/professores/lista_professores/", headers=headers, timeout=5)
-            print(f"[DEBUG] Professores GET - Status: {response_professores.status_code}")
-            professores_get_status = response_professores.status_code
-        except:
+        response_professores = respostas["/professores/lista_professores/"]
+        if isinstance(response_professores, Exception):
             professores_get_status = "Erro de conexão"
-        
-        # Teste POST com dados mínimos
-        test_data = {
-            'id_funcional': 'TEST123',
-            'nome_professor': 'Teste',
-            'sobrenome_professor': 'API',
-            'email_institucional': 'teste@docente.unip.br',
-            'password': '123456'
-        }
+        else:
+            app.logger.debug("Professores GET - Status: %s", response_professores.status_code)
+            professores_get_status = response_professores.status_code
         
         try:
-            response_post = requests.post(f"{API_BASE_URL}/professores/", json=test_data, timeout=5)
-            print(f"[DEBUG] Professores POST - Status: {response_post.status_code}")
-            print(f"[DEBUG] Professores POST - Response: {response_post.text}")
+            response_post = post_future.result()
+            app.logger.debug("Professores POST - Status: %s", response_post.status_code)
+            if app.logger.isEnabledFor(logging.DEBUG):
+                app.logger.debug("Professores POST - Response: %s", response_post.text)
             professores_post_status = response_post.status_code
             professores_post_response = response_post.text
         except Exception as e:
             professores_post_status = f"Erro: {e}"
             professores_post_response = "Erro de conexão"
         
-        return f"""
-        <h1>Teste da API - Professores</h1>
-        <p><strong>API Base URL:</strong> {API_BASE_URL}</p>
-        <p><strong>API Root:</strong> {response.status_code}</p>
-        <p><strong>Avisos GET:</strong> {response_avisos.status_code}</p>
-        <p><strong>Professores GET:</strong> {professores_get_status} (Esperado: 405 - Method Not Allowed)</p>
-        <p><strong>Professores POST:</strong> {professores_post_status}</p>
-        <p><strong>Response POST:</strong> {professores_post_response}</p>
-        <hr>
-        <h2>Endpoints Disponíveis para Professores:</h2>
-        <ul>
-            <li>✅ <strong>POST /professores/</strong> - Criar professor</li>
-            <li>✅ <strong>PUT /professores/{{id}}</strong> - Atualizar professor</li>
-            <li>✅ <strong>DELETE /professores/{{id}}</strong> - Remover professor</li>
-            <li>❌ <strong>GET /professores/</strong> - Listar professores (não existe)</li>
-            <li>❌ <strong>GET /professores/{{id}}</strong> - Buscar professor (não existe)</li>
-        </ul>
-        <h3>Campos Suportados:</h3>
-        <ul>
-            <li><strong>POST:</strong> id_funcional, nome_professor, sobrenome_professor, email_institucional, password</li>
-            <li><strong>PUT:</strong> nome_professor, sobrenome_professor, email_institucional</li>
-        </ul>
-        <p><em>Nota: O frontend usa dados mock para listagem e visualização.</em></p>
-        <a href="/docentes">Voltar para Docentes</a>
-        """
+        return render_template('debug/test_api.html',
+                               api_base_url=API_BASE_URL,
+                               api_root_status=response.status_code,
+                               avisos_status=response_avisos.status_code,
+                               professores_get_status=professores_get_status,
+                               professores_post_status=professores_post_status,
+                               professores_post_response=professores_post_response)
         
     except Exception as e:
-        return f"<h1>Erro no teste da API</h1><p>Erro: {e}</p><a href='/docentes'>Voltar para Docentes</a>"
+        return render_template('debug/test_api.html', erro=e)
 
 # ===== ROTAS DE DOCENTES =====
+def get_professores_por_id():
+    # Índice id -> professor da lista da API, guardado no cache junto com a própria
+    # lista (invalidado pelas escritas em /professores). IDs numéricos também são
+    # indexados sem zeros à esquerda, para comparar "007" com "7".
+    key = api_cache_key("/professores/lista_professores/") + ('por_id',)
+    por_id = cache_get(key)
+    if por_id is None:
+        professores, status_code = api_get_cached("/professores/lista_professores/", ttl=30)
+        if status_code != 200:
+            return {}
+        por_id = {}
+        for p in professores:
+            if p.get('id') is None:
+                continue
+            p_id = str(p.get('id')).strip()
+            por_id.setdefault(p_id, p)
+            if p_id.isdigit():
+                por_id.setdefault(str(int(p_id)), p)
+        cache_set(key, por_id, 30)
+    return por_id
+
+def find_professor_por_id(id):
+    # Busca o professor no índice em cache; devolve uma cópia (a view altera o dict)
+    professores_por_id = get_professores_por_id()
+    id_str = str(id).strip()
+    docente = professores_por_id.get(id_str)
+    if docente is None and id_str.isdigit():
+        docente = professores_por_id.get(str(int(id_str)))
+    return dict(docente) if docente is not None else None
+
+# Formato de e-mail aceito no cadastro de docentes (compilado uma única vez)
+EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 @app.route('/docentes')
 @login_required
 def docentes_list():
     # Lista docentes - busca da API
     try:
-        print(f"[DEBUG] Buscando professores em: {API_BASE_URL}/professores/lista_professores/")
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/professores/lista_professores/", headers=headers, timeout=10)
+        app.logger.debug("Buscando professores em: %s/professores/lista_professores/", API_BASE_URL)
+        docentes, status_code = api_get_cached("/professores/lista_professores/", ttl=10)
         
-        if response.status_code == 200:
-            docentes = response.json()
-            print(f"[DEBUG] {len(docentes)} professores encontrados")
-            # Salva na sessão para uso posterior
-            session['docentes_list'] = docentes
+        if status_code == 200:
+            app.logger.debug("%s professores encontrados", len(docentes))
+            # Salva na sessão para uso posterior (só se mudou: a sessão inteira é
+            # serializada e gravada de novo a cada alteração)
+            if docentes != get_docentes_list():
+                set_docentes_list_session(docentes)
         else:
-            print(f"[DEBUG] Professores retornou status {response.status_code}")
+            app.logger.debug("Professores retornou status %s", status_code)
             docentes = []  # Retorna lista vazia se não houver dados da API
             flash("Nenhum professor encontrado.", "info")
     except requests.exceptions.RequestException as e:
-        print(f"[DEBUG] Erro ao buscar professores: {e}")
+        app.logger.debug("Erro ao buscar professores: %s", e)
         flash("Erro ao carregar professores da API.", "error")
         docentes = []  # Retorna lista vazia em caso de erro
     
-    user = session.get('user', {})
-    return render_template('docentes/list.html', docentes=docentes, user=user)
+    return render_template('docentes/list.html', docentes=docentes)
 
 @app.route('/docentes/add', methods=['GET', 'POST'])
 @login_required
 @role_required(['admin', 'coordenador'])
 def docentes_add():
     # Adiciona novo docente via API
-    # Buscar disciplinas da API para popular select
-    disciplinas = []
-    try:
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/disciplinas/lista_disciplina/", headers=headers, timeout=10)
-        if response.status_code == 200:
-            disciplinas = response.json()
-    except Exception as e:
-        print(f"[DEBUG] Erro ao buscar disciplinas: {e}")
-        disciplinas = []
+    # Busca as disciplinas (select do formulário) em segundo plano, enquanto o
+    # formulário é lido e validado
+    disciplinas_future = get_disciplinas_async()
     
     if request.method == 'POST':
         try:
             # Coleta e valida dados do formulário
-            nome_completo = request.form.get('nome', '').strip()
+            form = request.form
+            nome_completo = form.get('nome', '').strip()
             partes_nome = nome_completo.split(' ', 1)
             nome_professor = partes_nome[0] if partes_nome else ''
             sobrenome_professor = partes_nome[1] if len(partes_nome) > 1 else ''
             
             # Monta dados para API conforme documentação
             docente_data = {
-                'id_funcional': request.form.get('matricula', '').strip(),
+                'id_funcional': form.get('matricula', '').strip(),
                 'nome_professor': nome_professor.strip(),
                 'sobrenome_professor': sobrenome_professor.strip(),
-                'email_institucional': request.form.get('email', '').strip(),
+                'email_institucional': form.get('email', '').strip(),
                 'password': '123456'  # Senha padrão
             }
+            disciplinas = disciplinas_future.result()
             
             # Validação obrigatória
             if not docente_data['id_funcional'] or not docente_data['nome_professor'] or not docente_data['email_institucional']:
@@ -816,13 +1233,12 @@ def docentes_add():
                 return render_template('docentes/add.html', disciplinas=disciplinas)
             
             # Validação de formato de email
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            if not re.match(email_pattern, docente_data['email_institucional']):
+            if not EMAIL_RE.match(docente_data['email_institucional']):
                 flash("Formato de email inválido.", "error")
                 return render_template('docentes/add.html', disciplinas=disciplinas)
             
             # Coleta IDs de disciplinas selecionadas do formulário
-            disciplinas_ids = request.form.getlist('disciplinas')
+            disciplinas_ids = form.getlist('disciplinas')
             disciplinas_ids = [d for d in disciplinas_ids if d]  # Remove valores vazios
             
             # Converte IDs de disciplinas para nomes (API espera nomes, não IDs)
@@ -843,10 +1259,10 @@ def docentes_add():
                 docente_data['disciplina_nomes'] = disciplina_nomes
             
             # Coleta dados de atendimento se fornecidos
-            dias_atendimento = request.form.getlist('dias_atendimento')
+            dias_atendimento = form.getlist('dias_atendimento')
             dias_atendimento = [d.strip() for d in dias_atendimento if d.strip()]
-            horario_inicio = request.form.get('horario_inicio', '').strip()
-            horario_fim = request.form.get('horario_fim', '').strip()
+            horario_inicio = form.get('horario_inicio', '').strip()
+            horario_fim = form.get('horario_fim', '').strip()
             
             if dias_atendimento:
                 docente_data['dias_atendimento'] = dias_atendimento
@@ -864,30 +1280,30 @@ def docentes_add():
                 except:
                     pass
             
-            print(f"[DEBUG] Criando docente: {docente_data}")
-            print(f"[DEBUG] Disciplinas selecionadas (IDs): {disciplinas_ids}")
-            print(f"[DEBUG] Disciplinas convertidas (nomes): {disciplina_nomes}")
-            print(f"[DEBUG] URL da API: {API_BASE_URL}/professores/")
+            app.logger.debug("Criando docente: %s", docente_data)
+            app.logger.debug("Disciplinas selecionadas (IDs): %s", disciplinas_ids)
+            app.logger.debug("Disciplinas convertidas (nomes): %s", disciplina_nomes)
+            app.logger.debug("URL da API: %s/professores/", API_BASE_URL)
             headers = get_auth_headers()
             
             # Debug detalhado dos headers
-            print(f"[DEBUG] Headers sendo enviados: {list(headers.keys())}")
+            app.logger.debug("Headers sendo enviados: %s", list(headers.keys()))
             if 'Authorization' in headers:
                 auth_header = headers['Authorization']
-                print(f"[DEBUG] Authorization header: {auth_header[:50]}...")
+                app.logger.debug("Authorization header: %s...", auth_header[:50])
                 # Verifica se o header tem o formato correto
                 if not auth_header.startswith('Bearer '):
-                    print("[ERROR] Authorization header não começa com 'Bearer '!")
+                    app.logger.error("Authorization header não começa com 'Bearer '!")
                     flash("Erro de configuração de autenticação. Por favor, faça logout e login novamente.", "error")
                     return render_template('docentes/add.html', disciplinas=disciplinas)
             else:
-                print("[ERROR] Authorization header NÃO está presente!")
+                app.logger.error("Authorization header NÃO está presente!")
                 flash("Erro de autenticação: Token não encontrado. Por favor, faça logout e login novamente.", "error")
                 return render_template('docentes/add.html', disciplinas=disciplinas)
             
             # Debug da sessão
             user_info = session.get('user', {})
-            print(f"[DEBUG] User na sessão: role={user_info.get('tipo')}, email={user_info.get('email')}, tem_token={'access_token' in user_info}")
+            app.logger.debug("User na sessão: role=%s, email=%s, tem_token=%s", user_info.get('tipo'), user_info.get('email'), 'access_token' in user_info)
             
             # Verifica se o token ainda é válido antes de fazer o POST
             if not check_token_validity():
@@ -896,42 +1312,43 @@ def docentes_add():
                 if 'user' not in session:
                     return redirect(url_for('index'))
             
-            response = requests.post(f"{API_BASE_URL}/professores/", json=docente_data, headers=headers, timeout=10)
-            print(f"[DEBUG] Status Code: {response.status_code}")
-            print(f"[DEBUG] Response Headers: {dict(response.headers)}")
-            print(f"[DEBUG] Response Text: {response.text}")
+            response = API_SESSION.post(f"{API_BASE_URL}/professores/", data=orjson.dumps(docente_data), headers=headers, timeout=10)
+            app.logger.debug("Status Code: %s", response.status_code)
+            app.logger.debug("Response Headers: %s", response.headers)
+            if app.logger.isEnabledFor(logging.DEBUG):
+                app.logger.debug("Response Text: %s", response.text)
             
             # Se for 401, o token expirou - faz logout automático
             if response.status_code == 401:
-                print("[INFO] Token expirado detectado na resposta - fazendo logout automático")
+                app.logger.info("Token expirado detectado na resposta - fazendo logout automático")
                 return handle_token_expiration()
             elif response.status_code == 403:
                 try:
-                    error_detail = response.json()
-                    print(f"[ERROR] Detalhes do erro 403: {error_detail}")
+                    error_detail = oparse(response)
+                    app.logger.error("Detalhes do erro 403: %s", error_detail)
                     error_msg = error_detail.get('detail', 'Acesso negado')
                     flash(f"Acesso negado: {error_msg}. Verifique se seu usuário tem permissão de coordenador ou admin.", "error")
                 except:
-                    print(f"[ERROR] Resposta 403 (texto): {response.text}")
+                    app.logger.error("Resposta 403 (texto): %s", response.text)
                     flash("Acesso negado (HTTP 403). Verifique se seu usuário tem permissão de coordenador ou admin.", "error")
             
             if response.status_code == 201:
                 try:
-                    response_data = response.json()
-                    print(f"[DEBUG] Resposta da API: {response_data}")
+                    response_data = oparse(response)
+                    app.logger.debug("Resposta da API: %s", response_data)
                     # Adiciona o novo docente à lista da sessão com dados da API
                     add_docente_to_list(docente_data, response_data)
                     flash("Docente cadastrado com sucesso!", "success")
                     return redirect(url_for('docentes_list'))
                 except Exception as e:
-                    print(f"[ERROR] Erro ao processar resposta da API: {e}")
+                    app.logger.error("Erro ao processar resposta da API: %s", e)
                     # Tenta adicionar mesmo sem a resposta completa
                     add_docente_to_list(docente_data)
                     flash("Docente cadastrado com sucesso!", "success")
                     return redirect(url_for('docentes_list'))
             elif response.status_code == 400:
                 try:
-                    error_detail = response.json()
+                    error_detail = oparse(response)
                     flash(f"Dados inválidos: {error_detail}", "error")
                 except:
                     flash("Dados inválidos. Verifique se todos os campos estão preenchidos corretamente.", "error")
@@ -939,103 +1356,66 @@ def docentes_add():
                 response.raise_for_status()
             
         except requests.exceptions.HTTPError as e:
-            print(f"[DEBUG] HTTPError: {e}")
+            app.logger.debug("HTTPError: %s", e)
             if e.response and e.response.status_code == 401:
                 return handle_token_expiration()
             elif e.response and e.response.status_code == 422:
                 try:
-                    error_detail = e.response.json()
+                    error_detail = oparse(e.response)
                     flash(f"Dados inválidos: {error_detail}", "error")
                 except:
                     flash("Dados inválidos. Verifique o formato.", "error")
             else:
                 flash(f"Erro no servidor (HTTP {e.response.status_code if e.response else 'N/A'}).", "error")
         except requests.exceptions.RequestException as e:
-            print(f"[DEBUG] RequestException: {e}")
+            app.logger.debug("RequestException: %s", e)
             flash("Erro de comunicação com o servidor.", "error")
         except Exception as e:
-            print(f"[DEBUG] Exception: {e}")
+            app.logger.debug("Exception: %s", e)
             flash("Erro inesperado ao cadastrar docente.", "error")
     
-    return render_template('docentes/add.html', disciplinas=disciplinas)
+    return render_template('docentes/add.html', disciplinas=disciplinas_future.result())
 
 @app.route('/docentes/view/<id>')
 @login_required
 def docentes_view(id):
     # Visualiza docente - busca da API ou sessão
     try:
-        print(f"[DEBUG] Buscando professor {id} (tipo: {type(id)})")
+        app.logger.debug("Buscando professor %s (tipo: %s)", id, type(id))
         headers = get_auth_headers()
         
         # Tenta buscar professor por ID diretamente (endpoint específico)
         docente = None
         try:
-            response = requests.get(f"{API_BASE_URL}/professores/get_professor/{id}", headers=headers, timeout=10)
+            response = API_SESSION.get(f"{API_BASE_URL}/professores/get_professor/{id}", headers=headers, timeout=10)
             if response.status_code == 200:
-                docente = response.json()
-                print(f"[DEBUG] Docente encontrado via get_professor: {docente.get('nome_professor', 'N/A')}")
-                print(f"[DEBUG] Disciplinas associadas: {docente.get('disciplina_nomes', [])}")
-                print(f"[DEBUG] Dias atendimento: {docente.get('dias_atendimento', [])}")
-                print(f"[DEBUG] Horários: {docente.get('atendimento_hora_inicio')} - {docente.get('atendimento_hora_fim')}")
+                docente = oparse(response)
+                app.logger.debug("Docente encontrado via get_professor: %s", docente.get('nome_professor', 'N/A'))
+                app.logger.debug("Disciplinas associadas: %s", docente.get('disciplina_nomes', []))
+                app.logger.debug("Dias atendimento: %s", docente.get('dias_atendimento', []))
+                app.logger.debug("Horários: %s - %s", docente.get('atendimento_hora_inicio'), docente.get('atendimento_hora_fim'))
         except Exception as e:
-            print(f"[WARN] Erro ao buscar professor por ID: {e}")
+            app.logger.warning("Erro ao buscar professor por ID: %s", e)
         
-        # Se não encontrou pelo endpoint específico, tenta buscar na lista
+        # Se não encontrou pelo endpoint específico, procura no índice da lista (em cache)
         if not docente:
-            response = requests.get(f"{API_BASE_URL}/professores/lista_professores/", headers=headers, timeout=10)
-            
-            if response.status_code == 200:
-                professores = response.json()
-                print(f"[DEBUG] Professores encontrados: {len(professores)}")
-                # Compara IDs como string (suporta UUID e números)
-                id_str = str(id).strip()
-                for p in professores:
-                    p_id = p.get('id')
-                    if p_id is not None:
-                        p_id_str = str(p_id).strip()
-                        if p_id_str == id_str:
-                            docente = p
-                            print(f"[DEBUG] Docente encontrado na API: {docente.get('nome_professor', 'N/A')}")
-                            break
-                        # Tenta também comparar como int se ambos forem numéricos
-                        try:
-                            if str(p_id_str).isdigit() and str(id_str).isdigit():
-                                if int(p_id_str) == int(id_str):
-                                    docente = p
-                                    print(f"[DEBUG] Docente encontrado na API (comparação numérica): {docente.get('nome_professor', 'N/A')}")
-                                    break
-                        except (ValueError, TypeError):
-                            pass
+            docente = find_professor_por_id(id)
+            if docente:
+                app.logger.debug("Docente encontrado na API: %s", docente.get('nome_professor', 'N/A'))
         
         # Se não encontrou na API, tenta da sessão
         if not docente:
-            docentes_list = get_docentes_list()
-            id_str = str(id).strip()
-            for d in docentes_list:
-                d_id = d.get('id')
-                if d_id is not None:
-                    d_id_str = str(d_id).strip()
-                    if d_id_str == id_str:
-                        docente = d
-                        print(f"[DEBUG] Docente encontrado na sessão: {docente.get('nome_professor', 'N/A')}")
-                        break
-                    # Tenta também comparar como int se ambos forem numéricos
-                    try:
-                        if str(d_id_str).isdigit() and str(id_str).isdigit():
-                            if int(d_id_str) == int(id_str):
-                                docente = d
-                                print(f"[DEBUG] Docente encontrado na sessão (comparação numérica): {docente.get('nome_professor', 'N/A')}")
-                                break
-                    except (ValueError, TypeError):
-                        pass
+            docente = find_docente_session(id)
+            if docente:
+                app.logger.debug("Docente encontrado na sessão: %s", docente.get('nome_professor', 'N/A'))
         
         if not docente:
-            print(f"[DEBUG] Docente {id} não encontrado na API nem na sessão")
+            app.logger.debug("Docente %s não encontrado na API nem na sessão", id)
             flash("Docente não encontrado.", "error")
             return redirect(url_for('docentes_list'))
         
-        print(f"[DEBUG] Docente encontrado: ID={docente.get('id')}, Nome={docente.get('nome_professor', 'N/A')}")
-        print(f"[DEBUG] Dados completos do docente: {docente}")
+        app.logger.debug("Docente encontrado: ID=%s, Nome=%s", docente.get('id'), docente.get('nome_professor', 'N/A'))
+        app.logger.debug("Dados completos do docente: %s", docente)
         
         # Garantir que disciplina_nomes seja uma lista
         if 'disciplina_nomes' not in docente or docente.get('disciplina_nomes') is None:
@@ -1050,14 +1430,14 @@ def docentes_view(id):
             docente['dias_atendimento'] = []
         
         # Log para debug
-        print(f"[DEBUG] Disciplinas associadas: {docente.get('disciplina_nomes', [])}")
-        print(f"[DEBUG] Dias atendimento: {docente.get('dias_atendimento', [])}")
-        print(f"[DEBUG] Horários: {docente.get('atendimento_hora_inicio')} - {docente.get('atendimento_hora_fim')}")
+        app.logger.debug("Disciplinas associadas: %s", docente.get('disciplina_nomes', []))
+        app.logger.debug("Dias atendimento: %s", docente.get('dias_atendimento', []))
+        app.logger.debug("Horários: %s - %s", docente.get('atendimento_hora_inicio'), docente.get('atendimento_hora_fim'))
         
-        return render_template('docentes/view.html', docente=docente, user=session.get('user', {}))
+        return render_template('docentes/view.html', docente=docente)
         
     except requests.exceptions.RequestException as e:
-        print(f"[DEBUG] Erro ao buscar professor: {e}")
+        app.logger.debug("Erro ao buscar professor: %s", e)
         flash("Erro ao carregar dados do docente.", "error")
         return redirect(url_for('docentes_list'))
 
@@ -1065,22 +1445,16 @@ def docentes_view(id):
 @login_required
 @role_required(['admin', 'coordenador'])
 def docentes_edit(id):
-    # Edita docente - GET usa mock, POST envia para API
-    # Buscar disciplinas da API para popular select
-    disciplinas = []
-    try:
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/disciplinas/lista_disciplina/", headers=headers, timeout=10)
-        if response.status_code == 200:
-            disciplinas = response.json()
-    except Exception as e:
-        print(f"[DEBUG] Erro ao buscar disciplinas: {e}")
-        disciplinas = []
+    # Edita docente - GET busca o docente na API (ou na sessão), POST envia para API
+    # Busca as disciplinas (select do formulário) em segundo plano: no POST em paralelo
+    # com a leitura do formulário, no GET em paralelo com a busca do professor
+    disciplinas_future = get_disciplinas_async()
     
     if request.method == 'POST':
         try:
             # Coleta dados do formulário e mapeia para a API
-            nome_completo = request.form.get('nome', '').strip()
+            form = request.form
+            nome_completo = form.get('nome', '').strip()
             partes_nome = nome_completo.split(' ', 1)
             nome_professor = partes_nome[0] if partes_nome else ''
             sobrenome_professor = partes_nome[1] if len(partes_nome) > 1 else ''
@@ -1089,11 +1463,13 @@ def docentes_edit(id):
             docente_data = {
                 'nome_professor': nome_professor,
                 'sobrenome_professor': sobrenome_professor,
-                'email_institucional': request.form.get('email', '')
+                'email_institucional': form.get('email', '')
             }
             
+            disciplinas = disciplinas_future.result()
+            
             # Coleta IDs de disciplinas selecionadas do formulário
-            disciplinas_ids = request.form.getlist('disciplinas')
+            disciplinas_ids = form.getlist('disciplinas')
             disciplinas_ids = [d for d in disciplinas_ids if d]  # Remove valores vazios
             
             # Converte IDs de disciplinas para nomes (API espera nomes, não IDs)
@@ -1114,10 +1490,10 @@ def docentes_edit(id):
                 docente_data['disciplina_nomes'] = disciplina_nomes
             
             # Coleta dados de atendimento se fornecidos
-            dias_atendimento = request.form.getlist('dias_atendimento')
+            dias_atendimento = form.getlist('dias_atendimento')
             dias_atendimento = [d.strip() for d in dias_atendimento if d.strip()]
-            horario_inicio = request.form.get('horario_inicio', '').strip()
-            horario_fim = request.form.get('horario_fim', '').strip()
+            horario_inicio = form.get('horario_inicio', '').strip()
+            horario_fim = form.get('horario_fim', '').strip()
             
             if dias_atendimento:
                 docente_data['dias_atendimento'] = dias_atendimento
@@ -1128,44 +1504,44 @@ def docentes_edit(id):
             if horario_fim:
                 docente_data['atendimento_hora_fim'] = horario_fim
             
-            print(f"[DEBUG] Disciplinas selecionadas (IDs): {disciplinas_ids}")
-            print(f"[DEBUG] Disciplinas convertidas (nomes): {disciplina_nomes}")
+            app.logger.debug("Disciplinas selecionadas (IDs): %s", disciplinas_ids)
+            app.logger.debug("Disciplinas convertidas (nomes): %s", disciplina_nomes)
             
-            print(f"[DEBUG] Atualizando docente {id}: {docente_data}")
+            app.logger.debug("Atualizando docente %s: %s", id, docente_data)
             headers = get_auth_headers()
-            response = requests.put(f"{API_BASE_URL}/professores/update/{id}", json=docente_data, headers=headers, timeout=10)
-            print(f"[DEBUG] Status Code: {response.status_code}")
-            print(f"[DEBUG] Response: {response.text}")
+            response = API_SESSION.put(f"{API_BASE_URL}/professores/update/{id}", data=orjson.dumps(docente_data), headers=headers, timeout=10)
+            app.logger.debug("Status Code: %s", response.status_code)
+            if app.logger.isEnabledFor(logging.DEBUG):
+                app.logger.debug("Response: %s", response.text)
             
             response.raise_for_status()
             
             # Obtém o docente atualizado da resposta
-            docente_atualizado = response.json()
+            docente_atualizado = oparse(response)
             docente_id_atualizado = docente_atualizado.get('id')
             
             # Atualiza o docente na lista da sessão
             if 'docentes_list' in session and docente_id_atualizado:
-                for i, d in enumerate(session['docentes_list']):
-                    if d.get('id') == docente_id_atualizado or str(d.get('id')) == str(docente_id_atualizado):
-                        session['docentes_list'][i] = docente_atualizado
-                        session.modified = True
-                        print(f"[DEBUG] Docente atualizado na sessão")
-                        break
+                pos = get_docente_index_session().get(str(docente_id_atualizado).strip())
+                if pos is not None:
+                    session['docentes_list'][pos] = docente_atualizado
+                    session.modified = True
+                    app.logger.debug("Docente atualizado na sessão")
             
             # Usa o ID retornado pela API para o redirect
             id_para_redirect = docente_id_atualizado if docente_id_atualizado else id
-            print(f"[DEBUG] Redirecionando para visualização com ID: {id_para_redirect}")
+            app.logger.debug("Redirecionando para visualização com ID: %s", id_para_redirect)
             
             flash("Docente atualizado com sucesso!", "success")
             return redirect(url_for('docentes_view', id=id_para_redirect))
             
         except requests.exceptions.HTTPError as e:
-            print(f"[DEBUG] HTTPError: {e}")
+            app.logger.debug("HTTPError: %s", e)
             if e.response and e.response.status_code == 401:
                 return handle_token_expiration()
             elif e.response and e.response.status_code == 422:
                 try:
-                    error_detail = e.response.json()
+                    error_detail = oparse(e.response)
                     flash(f"Dados inválidos: {error_detail}", "error")
                 except:
                     flash("Dados inválidos. Verifique o formato.", "error")
@@ -1174,91 +1550,51 @@ def docentes_edit(id):
             # Em caso de erro, redireciona de volta para a página de edição para que o usuário possa corrigir
             return redirect(url_for('docentes_edit', id=id))
         except requests.exceptions.RequestException as e:
-            print(f"[DEBUG] RequestException: {e}")
+            app.logger.debug("RequestException: %s", e)
             flash("Erro de comunicação com o servidor.", "error")
             # Em caso de erro, redireciona de volta para a página de edição
             return redirect(url_for('docentes_edit', id=id))
         except Exception as e:
-            print(f"[DEBUG] Exception: {e}")
+            app.logger.debug("Exception: %s", e)
             import traceback
-            print(f"[DEBUG] Traceback: {traceback.format_exc()}")
+            app.logger.debug("Traceback: %s", traceback.format_exc())
             flash("Erro inesperado ao atualizar docente.", "error")
             # Em caso de erro, redireciona de volta para a página de edição
             return redirect(url_for('docentes_edit', id=id))
     
     # GET - Buscar dados do docente para edição
-    print(f"[DEBUG] Buscando professor {id} para edição (tipo: {type(id)})")
+    app.logger.debug("Buscando professor %s para edição (tipo: %s)", id, type(id))
     try:
-        headers = get_auth_headers()
-        # Tenta buscar da API primeiro
-        response = requests.get(f"{API_BASE_URL}/professores/lista_professores/", headers=headers, timeout=10)
-        
-        docente = None
-        if response.status_code == 200:
-            professores = response.json()
-            print(f"[DEBUG] Professores encontrados: {len(professores)}")
-            # Tenta encontrar o docente comparando IDs como string (suporta UUID e números)
-            id_str = str(id).strip()
-            for p in professores:
-                p_id = p.get('id')
-                if p_id is not None:
-                    p_id_str = str(p_id).strip()
-                    # Compara como string (funciona para UUID e números)
-                    if p_id_str == id_str:
-                        docente = p
-                        print(f"[DEBUG] Docente encontrado na API: {docente.get('nome_professor', 'N/A')}")
-                        break
-                    # Tenta também comparar como int se ambos forem numéricos
-                    try:
-                        if str(p_id_str).isdigit() and str(id_str).isdigit():
-                            if int(p_id_str) == int(id_str):
-                                docente = p
-                                print(f"[DEBUG] Docente encontrado na API (comparação numérica): {docente.get('nome_professor', 'N/A')}")
-                                break
-                    except (ValueError, TypeError):
-                        pass
+        # Tenta buscar da API primeiro (índice da lista de professores, em cache)
+        docente = find_professor_por_id(id)
+        if docente:
+            app.logger.debug("Docente encontrado na API: %s", docente.get('nome_professor', 'N/A'))
         
         # Se não encontrou na API, tenta da sessão
         if not docente:
-            docentes_list = get_docentes_list()
-            id_str = str(id).strip()
-            for d in docentes_list:
-                d_id = d.get('id')
-                if d_id is not None:
-                    d_id_str = str(d_id).strip()
-                    if d_id_str == id_str:
-                        docente = d
-                        print(f"[DEBUG] Docente encontrado na sessão: {docente.get('nome_professor', 'N/A')}")
-                        break
-                    # Tenta também comparar como int se ambos forem numéricos
-                    try:
-                        if str(d_id_str).isdigit() and str(id_str).isdigit():
-                            if int(d_id_str) == int(id_str):
-                                docente = d
-                                print(f"[DEBUG] Docente encontrado na sessão (comparação numérica): {docente.get('nome_professor', 'N/A')}")
-                                break
-                    except (ValueError, TypeError):
-                        pass
+            docente = find_docente_session(id)
+            if docente:
+                app.logger.debug("Docente encontrado na sessão: %s", docente.get('nome_professor', 'N/A'))
         
         if not docente:
-            print(f"[DEBUG] Docente {id} não encontrado na API nem na sessão")
-            print(f"[DEBUG] IDs disponíveis na API: {[str(p.get('id', 'N/A')) for p in professores[:5]]}")
+            app.logger.debug("Docente %s não encontrado na API nem na sessão", id)
+            app.logger.debug("IDs disponíveis na API: %s", list(get_professores_por_id())[:5])
             flash("Docente não encontrado.", "error")
             return redirect(url_for('docentes_list'))
         
-        print(f"[DEBUG] Docente encontrado para edição: ID={docente.get('id')}, Nome={docente.get('nome_professor', 'N/A')}")
-        return render_template('docentes/edit.html', docente=docente, disciplinas=disciplinas, user=session.get('user', {}))
+        app.logger.debug("Docente encontrado para edição: ID=%s, Nome=%s", docente.get('id'), docente.get('nome_professor', 'N/A'))
+        return render_template('docentes/edit.html', docente=docente, disciplinas=disciplinas_future.result())
         
     except requests.exceptions.RequestException as e:
-        print(f"[DEBUG] Erro ao buscar professor: {e}")
+        app.logger.debug("Erro ao buscar professor: %s", e)
         import traceback
-        print(f"[DEBUG] Traceback: {traceback.format_exc()}")
+        app.logger.debug("Traceback: %s", traceback.format_exc())
         flash("Erro ao carregar dados do docente.", "error")
         return redirect(url_for('docentes_list'))
     except Exception as e:
-        print(f"[DEBUG] Erro inesperado: {e}")
+        app.logger.debug("Erro inesperado: %s", e)
         import traceback
-        print(f"[DEBUG] Traceback: {traceback.format_exc()}")
+        app.logger.debug("Traceback: %s", traceback.format_exc())
         flash("Erro inesperado ao carregar dados do docente.", "error")
         return redirect(url_for('docentes_list'))
 
@@ -1268,16 +1604,17 @@ def docentes_edit(id):
 def docentes_delete(id):
     # Remove docente via API
     try:
-        print(f"[DEBUG] Removendo docente {id} (tipo: {type(id)})")
+        app.logger.debug("Removendo docente %s (tipo: %s)", id, type(id))
         # DELETE /professores/delete/{id} - endpoint correto da API
-        headers = get_auth_headers()
+        headers = g.get('auth_headers') or get_auth_headers()
         url = f"{API_BASE_URL}/professores/delete/{id}"
-        print(f"[DEBUG] URL da requisição: {url}")
-        print(f"[DEBUG] Headers: {headers}")
+        app.logger.debug("URL da requisição: %s", url)
+        app.logger.debug("Headers: %s", headers)
         
-        response = requests.delete(url, headers=headers, timeout=10)
-        print(f"[DEBUG] Status Code: {response.status_code}")
-        print(f"[DEBUG] Response Text: {response.text}")
+        response = API_SESSION.delete(url, headers=headers, timeout=10)
+        app.logger.debug("Status Code: %s", response.status_code)
+        if app.logger.isEnabledFor(logging.DEBUG):
+            app.logger.debug("Response Text: %s", response.text)
         
         # Status 204 (No Content) é o esperado para delete bem-sucedido
         if response.status_code == 204:
@@ -1288,8 +1625,9 @@ def docentes_delete(id):
             response.raise_for_status()
         
     except requests.exceptions.HTTPError as e:
-        print(f"[DEBUG] HTTPError: {e}")
-        print(f"[DEBUG] Response: {e.response.text if e.response else 'N/A'}")
+        app.logger.debug("HTTPError: %s", e)
+        if app.logger.isEnabledFor(logging.DEBUG):
+            app.logger.debug("Response: %s", e.response.text if e.response else 'N/A')
         if e.response and e.response.status_code == 401:
             return handle_token_expiration()
         elif e.response and e.response.status_code == 404:
@@ -1299,12 +1637,12 @@ def docentes_delete(id):
         else:
             flash(f"Erro ao remover docente (HTTP {e.response.status_code if e.response else 'N/A'}).", "error")
     except requests.exceptions.RequestException as e:
-        print(f"[DEBUG] RequestException: {e}")
+        app.logger.debug("RequestException: %s", e)
         flash("Erro de comunicação com o servidor.", "error")
     except Exception as e:
-        print(f"[DEBUG] Exception: {e}")
+        app.logger.debug("Exception: %s", e)
         import traceback
-        print(f"[DEBUG] Traceback: {traceback.format_exc()}")
+        app.logger.debug("Traceback: %s", traceback.format_exc())
         flash("Erro inesperado ao remover docente.", "error")
     
     return redirect(url_for('docentes_list'))
@@ -1315,6 +1653,41 @@ def get_docentes_list():
     # Retorna a lista de docentes da sessão (vem da API) ou lista vazia
     return session.get('docentes_list', [])
 
+def _build_docente_index(items):
+    # Índice id (str) -> posição na lista; IDs numéricos também sem zeros à esquerda.
+    # Os itens não são alterados (a lista pode ser a mesma guardada no cache da API)
+    index = {}
+    for i, d in enumerate(items):
+        if d.get('id') is None:
+            continue
+        d_id = str(d.get('id')).strip()
+        index.setdefault(d_id, i)
+        if d_id.isdigit():
+            index.setdefault(str(int(d_id)), i)
+    return index
+
+def get_docente_index_session():
+    # Índice mantido junto com 'docentes_list' (reconstruído se estiver ausente)
+    index = session.get('docentes_by_id')
+    if index is None:
+        index = _build_docente_index(get_docentes_list())
+        session['docentes_by_id'] = index
+    return index
+
+def set_docentes_list_session(items):
+    session['docentes_by_id'] = _build_docente_index(items)
+    session['docentes_list'] = items
+    session.modified = True
+
+def find_docente_session(docente_id):
+    # Busca o docente da sessão pelo índice; devolve uma cópia (a view altera o dict)
+    index = get_docente_index_session()
+    id_str = str(docente_id).strip()
+    pos = index.get(id_str)
+    if pos is None and id_str.isdigit():
+        pos = index.get(str(int(id_str)))
+    return dict(get_docentes_list()[pos]) if pos is not None else None
+
 def add_docente_to_list(docente_data, response_data=None):
     # Adiciona um novo docente à lista da sessão
     if 'docentes_list' not in session:
@@ -1345,22 +1718,26 @@ def add_docente_to_list(docente_data, response_data=None):
             'atendimento_hora_fim': response_data.get('atendimento_hora_fim')
         })
     
+    index = get_docente_index_session()
+    novo_id_str = str(novo_docente['id']).strip()
+    index[novo_id_str] = len(session['docentes_list'])
+    if novo_id_str.isdigit():
+        index.setdefault(str(int(novo_id_str)), index[novo_id_str])
     session['docentes_list'].append(novo_docente)
     session.modified = True
     return novo_docente
 
 def remove_docente_from_list(docente_id):
-    # Remove um docente da lista da sessão
+    # Remove um docente da lista da sessão (posição encontrada pelo índice)
     if 'docentes_list' in session:
-        original_count = len(session['docentes_list'])
-        # Compara IDs como string para garantir que funcione independente do tipo
-        session['docentes_list'] = [
-            d for d in session['docentes_list'] 
-            if d.get('id') is not None and str(d.get('id')) != str(docente_id)
-        ]
-        session.modified = True
-        removed_count = original_count - len(session['docentes_list'])
-        print(f"[DEBUG] Docente {docente_id} removido da sessão. {removed_count} removido(s), restam {len(session['docentes_list'])} docentes.")
+        pos = get_docente_index_session().get(str(docente_id).strip())
+        if pos is None:
+            return
+        items = list(session['docentes_list'])
+        del items[pos]
+        # As posições seguintes mudam: o índice é remontado junto com a lista
+        set_docentes_list_session(items)
+        app.logger.debug("Docente %s removido da sessão, restam %s docentes.", docente_id, len(items))
 
 # ===== ROTAS DE CONTEÚDO =====
 
@@ -1373,166 +1750,190 @@ CONTENT_ENDPOINT_CANDIDATES = [
 def _join_url(base, path):
     return f"{base}{path if path.startswith('/') else '/' + path}"
 
+# Status que indicam que o endpoint existe (mesmo com erro de validação/auth ou método)
+CONTENT_ENDPOINT_OK_STATUS = frozenset((200, 204, 400, 401, 403, 405))
+# O endpoint detectado vale para todos os usuários e quase nunca muda: fica 1 hora no cache
+CONTENT_ENDPOINT_CACHE_KEY = ('content_endpoint', None, None)
+CONTENT_ENDPOINT_TTL = 3600
+
 def resolve_content_endpoint():
     # Tenta detectar qual endpoint de conteúdo está disponível na API
-    # Retorna o primeiro endpoint que responder (mesmo com erro 400 ou 405, pois indica que existe)
+    # Os candidatos são sondados em paralelo (API_EXECUTOR); vale o primeiro da lista
+    # que responder (mesmo com erro 400 ou 405, pois indica que existe)
     # Se nenhum for encontrado, retorna '/conteudo' como padrão
-    print(f"[DEBUG] Tentando detectar endpoint de conteúdo em {API_BASE_URL}")
-    for cand in CONTENT_ENDPOINT_CANDIDATES:
+    cand = cache_get(CONTENT_ENDPOINT_CACHE_KEY)
+    if cand is not None:
+        return cand
+    app.logger.debug("Tentando detectar endpoint de conteúdo em %s", API_BASE_URL)
+    # Headers montados aqui: as threads do executor não têm a sessão
+    headers = g.get('auth_headers') or get_auth_headers()
+    futures = [
+        (cand, API_EXECUTOR.submit(API_SESSION.get, _join_url(API_BASE_URL, f"{cand}/"), headers=headers, timeout=5))
+        for cand in CONTENT_ENDPOINT_CANDIDATES
+    ]
+    for cand, future in futures:
         try:
-            url = _join_url(API_BASE_URL, f"{cand}/")
-            # Usa headers de autenticação para verificar o endpoint
-            headers = get_auth_headers()
-            resp = requests.get(url, headers=headers, timeout=5)
-            # 200, 204 = sucesso
-            # 400, 401, 403 = endpoint existe mas com erro de validação/auth
-            # 405 = método não permitido, mas endpoint existe
-            # 404 = endpoint não existe
-            if resp.status_code in (200, 204, 400, 401, 403, 405):
-                print(f"[INFO] Endpoint de conteúdo detectado: {cand} (Status: {resp.status_code})")
-                return cand
+            resp = future.result()
         except requests.exceptions.RequestException as e:
-            print(f"[DEBUG] Endpoint {cand} não acessível: {e}")
+            app.logger.debug("Endpoint %s não acessível: %s", cand, e)
             continue
-    print(f"[WARN] Nenhum endpoint de conteúdo encontrado. Usando padrão: /conteudo")
-    print(f"[WARN] ATENÇÃO: O endpoint /conteudo pode não existir na API em {API_BASE_URL}")
+        # 404 = endpoint não existe
+        if resp.status_code in CONTENT_ENDPOINT_OK_STATUS:
+            app.logger.info("Endpoint de conteúdo detectado: %s (Status: %s)", cand, resp.status_code)
+            for _, pendente in futures:
+                pendente.cancel()
+            cache_set(CONTENT_ENDPOINT_CACHE_KEY, cand, CONTENT_ENDPOINT_TTL)
+            return cand
+    app.logger.warning("Nenhum endpoint de conteúdo encontrado. Usando padrão: /conteudo")
+    app.logger.warning("ATENÇÃO: O endpoint /conteudo pode não existir na API em %s", API_BASE_URL)
     return "/conteudo"
 
+# Campos gravados em conteudo_processado ("Link: ...", "Arquivo: ...", "Material: ..."):
+# o valor vai até o fim da linha
+CONTEUDO_LINK_RE = re.compile(r'Link:([^\n]*)')
+CONTEUDO_ARQUIVO_RE = re.compile(r'Arquivo:([^\n]*)')
+CONTEUDO_MATERIAL_RE = re.compile(r'Material:([^\n]*)')
+
+def conhecimento_para_conteudo(item, disciplinas_map):
+    # Transforma um item da base de conhecimento para o formato do frontend
+    get = item.get
+    # Busca nome da disciplina se tiver id_disciplina
+    id_disciplina = get('id_disciplina')
+    disciplina_nome = disciplinas_map.get(str(id_disciplina), 'Sem Disciplina') if id_disciplina else 'Sem Disciplina'
+
+    # Extrai link e URL do arquivo do conteúdo processado
+    link = ''
+    url_arquivo = get('url_documento', '')  # Campo direto do banco
+    conteudo_texto = get('conteudo_processado', '') or ''
+
+    if conteudo_texto:
+        # Tenta extrair link do conteúdo processado
+        m = CONTEUDO_LINK_RE.search(conteudo_texto)
+        if m:
+            link = m.group(1).strip()
+        # Tenta extrair URL do arquivo do conteúdo processado se não tiver no campo direto
+        if not url_arquivo:
+            m = CONTEUDO_ARQUIVO_RE.search(conteudo_texto)
+            if m:
+                url_arquivo = m.group(1).strip()
+
+    # Determina o tipo baseado na categoria
+    categoria = get('categoria', 'Material de Aula')
+    # Removido suporte a Material Complementar
+    tipo = 'aula'  # Sempre Material de Aula
+
+    # Título pode vir do nome_arquivo_origem ou do conteúdo processado
+    nome_arquivo_origem = get('nome_arquivo_origem', 'Sem título')
+    titulo = nome_arquivo_origem
+    if (titulo == 'Sem título' or not titulo) and conteudo_texto:
+        # Tenta extrair título do conteúdo processado
+        m = CONTEUDO_MATERIAL_RE.search(conteudo_texto)
+        if m:
+            titulo = m.group(1).strip()
+
+    # Se ainda não tem título, usa o nome do arquivo de origem
+    if not titulo or titulo == 'Sem título':
+        titulo = nome_arquivo_origem or 'Sem título'
+
+    return {
+        'id': str(get('id_conhecimento', '')),
+        'titulo': titulo,
+        'disciplina': disciplina_nome,
+        'tipo': tipo,
+        'link': link,
+        'url_arquivo': url_arquivo,
+        'categoria': categoria
+    }
+
 def get_conteudos_api():
     # Busca conteúdo da base de conhecimento da API
     try:
-        headers = get_auth_headers()
+        # As disciplinas (para mapear IDs para nomes) são buscadas em paralelo com
+        # a base de conhecimento: o tempo total fica o da chamada mais lenta
+        disciplinas_future = get_disciplinas_async()
         # Usa o endpoint correto para listar todos os conhecimentos
-        resp = requests.get(f"{API_BASE_URL}/baseconhecimento/get_lista_conhecimento", headers=headers, timeout=10)
+        resp = api_get("/baseconhecimento/get_lista_conhecimento")
         
         if resp.status_code == 200:
-            items = resp.json()
+            items = oparse(resp)
+            # O corpo bruto não é mais necessário: libera a memória antes da transformação
+            del resp
             if isinstance(items, list):
-                # Busca todas as disciplinas de uma vez para mapear IDs para nomes
                 disciplinas_map = {}
-                try:
-                    disc_response = requests.get(f"{API_BASE_URL}/disciplinas/lista_disciplina/", headers=headers, timeout=10)
-                    if disc_response.status_code == 200:
-                        disciplinas = disc_response.json()
-                        for disc in disciplinas:
-                            disc_id = str(disc.get('id_disciplina', ''))
-                            disciplinas_map[disc_id] = disc.get('nome_disciplina', 'Sem Disciplina')
-                except Exception as e:
-                    print(f"[WARN] Erro ao buscar disciplinas: {e}")
+                for disc in disciplinas_future.result():
+                    disc_id = str(disc.get('id_disciplina', ''))
+                    disciplinas_map[disc_id] = disc.get('nome_disciplina', 'Sem Disciplina')
                 
                 # Transforma dados da base de conhecimento para o formato do frontend
-                conteudos = []
-                for item in items:
-                    # Busca nome da disciplina se tiver id_disciplina
-                    disciplina_nome = 'Sem Disciplina'
-                    id_disciplina = item.get('id_disciplina')
-                    if id_disciplina:
-                        id_disciplina_str = str(id_disciplina)
-                        disciplina_nome = disciplinas_map.get(id_disciplina_str, 'Sem Disciplina')
-                    
-                    # Extrai link e URL do arquivo do conteúdo processado
-                    link = ''
-                    url_arquivo = item.get('url_documento', '')  # Campo direto do banco
-                    conteudo_texto = item.get('conteudo_processado', '') or ''
-                    
-                    # Tenta extrair link do conteúdo processado
-                    if conteudo_texto and 'Link:' in conteudo_texto:
-                        link_parts = conteudo_texto.split('Link:')
-                        if len(link_parts) > 1:
-                            link = link_parts[1].split('\n')[0].strip()
-                    
-                    # Tenta extrair URL do arquivo do conteúdo processado se não tiver no campo direto
-                    if not url_arquivo and conteudo_texto and 'Arquivo:' in conteudo_texto:
-                        arquivo_parts = conteudo_texto.split('Arquivo:')
-                        if len(arquivo_parts) > 1:
-                            url_arquivo = arquivo_parts[1].split('\n')[0].strip()
-                    
-                    # Determina o tipo baseado na categoria
-                    categoria = item.get('categoria', 'Material de Aula')
-                    # Removido suporte a Material Complementar
-                    tipo = 'aula'  # Sempre Material de Aula
-                    
-                    # Título pode vir do nome_arquivo_origem ou do conteúdo processado
-                    titulo = item.get('nome_arquivo_origem', 'Sem título')
-                    if (titulo == 'Sem título' or not titulo) and conteudo_texto:
-                        # Tenta extrair título do conteúdo processado
-                        if 'Material:' in conteudo_texto:
-                            titulo_parts = conteudo_texto.split('Material:')
-                            if len(titulo_parts) > 1:
-                                titulo = titulo_parts[1].split('\n')[0].strip()
-                    
-                    # Se ainda não tem título, usa o nome do arquivo de origem
-                    if not titulo or titulo == 'Sem título':
-                        titulo = item.get('nome_arquivo_origem', 'Sem título') or 'Sem título'
-                    
-                    conteudo = {
-                        'id': str(item.get('id_conhecimento', '')),
-                        'titulo': titulo,
-                        'disciplina': disciplina_nome,
-                        'tipo': tipo,
-                        'link': link,
-                        'url_arquivo': url_arquivo,
-                        'categoria': categoria
-                    }
-                    conteudos.append(conteudo)
+                conteudos = [conhecimento_para_conteudo(item, disciplinas_map) for item in items]
                 
-                print(f"[INFO] {len(conteudos)} conteúdos encontrados na base de conhecimento")
+                app.logger.info("%s conteúdos encontrados na base de conhecimento", len(conteudos))
                 return conteudos
             else:
-                print(f"[WARN] Resposta da API não é uma lista: {type(items)}")
+                app.logger.warning("Resposta da API não é uma lista: %s", type(items))
         else:
-            print(f"[WARN] Erro ao buscar base de conhecimento: Status {resp.status_code}")
+            app.logger.warning("Erro ao buscar base de conhecimento: Status %s", resp.status_code)
             if resp.status_code == 401:
-                print(f"[ERROR] Não autorizado - token expirado")
+                app.logger.error("Não autorizado - token expirado")
                 return handle_token_expiration()
             elif resp.status_code == 403:
-                print(f"[ERROR] Acesso negado")
+                app.logger.error("Acesso negado")
             else:
                 try:
-                    error_detail = resp.json()
-                    print(f"[ERROR] Detalhes do erro: {error_detail}")
+                    error_detail = oparse(resp)
+                    app.logger.error("Detalhes do erro: %s", error_detail)
                 except:
-                    print(f"[ERROR] Resposta: {resp.text[:200]}")
+                    app.logger.error("Resposta: %s", resp.text[:200])
                     
     except requests.exceptions.HTTPError as e:
-        print(f"[ERROR] Erro HTTP ao buscar base de conhecimento: {e}")
+        app.logger.error("Erro HTTP ao buscar base de conhecimento: %s", e)
         if hasattr(e, 'response') and e.response is not None:
-            print(f"[ERROR] Status: {e.response.status_code}")
+            app.logger.error("Status: %s", e.response.status_code)
             if e.response.status_code == 401:
                 return handle_token_expiration()
     except requests.exceptions.RequestException as e:
-        print(f"[ERROR] Erro de requisição ao buscar base de conhecimento: {e}")
+        app.logger.error("Erro de requisição ao buscar base de conhecimento: %s", e)
     except Exception as e:
-        print(f"[ERROR] Erro inesperado ao buscar base de conhecimento: {e}")
+        app.logger.error("Erro inesperado ao buscar base de conhecimento: %s", e)
         import traceback
-        traceback.print_exc()
+        app.logger.debug("Traceback: %s", traceback.format_exc())
     
     return []
 
+def get_disciplinas_por_nome():
+    # Índice nome (minúsculo) -> id das disciplinas, guardado no cache junto com a
+    # própria lista (invalidado pelas escritas em /disciplinas)
+    key = api_cache_key(DISCIPLINAS_PATH) + ('por_nome',)
+    por_nome = cache_get(key)
+    if por_nome is None:
+        disciplinas, status_code = api_get_cached(DISCIPLINAS_PATH, ttl=DISCIPLINAS_CACHE_TTL)
+        if status_code != 200:
+            app.logger.warning("Erro ao buscar disciplinas: Status %s", status_code)
+            return {}
+        por_nome = {}
+        for disc in disciplinas:
+            por_nome.setdefault((disc.get('nome_disciplina') or '').lower(), disc.get('id_disciplina'))
+        cache_set(key, por_nome, DISCIPLINAS_CACHE_TTL)
+    return por_nome
+
+# UUID no formato canônico (IDs de disciplina, professor e coordenador), compilado uma única vez
+UUID_RE = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.I)
+
 def get_disciplina_id_by_name(disciplina_nome):
-    # Busca o ID da disciplina pelo nome usando a API
+    # Busca o ID da disciplina pelo nome (case-insensitive) no índice em cache
+    # Se já vier um UUID (ex.: formulário que envia o ID), usa direto, sem consultar a lista
+    if UUID_RE.match(disciplina_nome):
+        return disciplina_nome
     try:
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/disciplinas/lista_disciplina/", headers=headers, timeout=10)
-        if response.status_code == 200:
-            disciplinas = response.json()
-            # Busca disciplina por nome (case-insensitive)
-            for disc in disciplinas:
-                if disc.get('nome_disciplina', '').lower() == disciplina_nome.lower():
-                    disciplina_id = disc.get('id_disciplina')
-                    print(f"[INFO] Disciplina '{disciplina_nome}' encontrada - ID: {disciplina_id}")
-                    return disciplina_id
-            print(f"[WARN] Disciplina '{disciplina_nome}' não encontrada na API")
-        else:
-            print(f"[WARN] Erro ao buscar disciplinas: Status {response.status_code}")
-            try:
-                print(f"[DEBUG] Resposta: {response.text[:200]}")
-            except:
-                pass
+        disciplina_id = get_disciplinas_por_nome().get(disciplina_nome.lower())
+        if disciplina_id is not None:
+            app.logger.info("Disciplina '%s' encontrada - ID: %s", disciplina_nome, disciplina_id)
+            return disciplina_id
+        app.logger.warning("Disciplina '%s' não encontrada na API", disciplina_nome)
     except Exception as e:
-        print(f"[ERROR] Erro ao buscar disciplina: {e}")
+        app.logger.error("Erro ao buscar disciplina: %s", e)
         import traceback
-        traceback.print_exc()
+        app.logger.debug("Traceback: %s", traceback.format_exc())
     return None
 
 def create_conteudo_api(data, file_storage=None):
@@ -1540,12 +1941,14 @@ def create_conteudo_api(data, file_storage=None):
     # - /documentos/upload para arquivos
     # - /baseconhecimento/ para metadados
     user_email = session.get('user', {}).get('email', 'unknown')
-    print(f"[INFO] Criando conteúdo - Usuário: {user_email}")
-    print(f"[DEBUG] Dados recebidos: {data}")
-    print(f"[DEBUG] Arquivo: {file_storage.filename if file_storage and file_storage.filename else 'Nenhum'}")
+    app.logger.info("Criando conteúdo - Usuário: %s", user_email)
+    # Nome do arquivo lido uma única vez (vazio se não houver arquivo)
+    filename = file_storage.filename if file_storage else None
+    app.logger.debug("Dados recebidos: %s", data)
+    app.logger.debug("Arquivo: %s", filename or 'Nenhum')
     
     try:
-        headers = get_auth_headers()
+        headers = g.get('auth_headers') or get_auth_headers()
         titulo = data.get('titulo', '')
         disciplina_nome = data.get('disciplina', '')
         tipo = data.get('tipo', 'aula')  # aula ou complementar
@@ -1559,19 +1962,19 @@ def create_conteudo_api(data, file_storage=None):
         categoria = 'Material de Aula'  # Sempre Material de Aula (removido Material Complementar)
         
         # 1. CASO 1: Upload de arquivo (o endpoint já cria na baseconhecimento automaticamente)
-        if file_storage and file_storage.filename:
-            print(f"[INFO] Fazendo upload do arquivo: {file_storage.filename}")
+        if filename:
+            app.logger.info("Fazendo upload do arquivo: %s", filename)
             
             # Usa upload_disciplina que já salva na baseconhecimento
             if disciplina_nome and disciplina_nome != 'Sem Disciplina':
-                print(f"[DEBUG] Iniciando upload de documento para disciplina: {disciplina_nome}")
+                app.logger.debug("Iniciando upload de documento para disciplina: %s", disciplina_nome)
                 success, result = upload_documento_por_categoria(
                     file_storage,
                     'disciplina',
                     nome_disciplina=disciplina_nome
                 )
                 
-                print(f"[DEBUG] Resultado do upload: success={success}, result={result if success else 'Erro: ' + str(result)}")
+                app.logger.debug("Resultado do upload: success=%s, result=%s", success, result if success else 'Erro: ' + str(result))
                 
                 if success:
                     # O endpoint já criou o registro na baseconhecimento
@@ -1582,7 +1985,7 @@ def create_conteudo_api(data, file_storage=None):
                     if id_conhecimento:
                         # Atualiza o registro criado com título e categoria corretos
                         update_data = {
-                            "nome_arquivo_origem": titulo or file_storage.filename,
+                            "nome_arquivo_origem": titulo or filename,
                             "categoria": categoria,
                             "palavra_chave": json.dumps([titulo.lower()] if titulo else []),
                         }
@@ -1592,19 +1995,19 @@ def create_conteudo_api(data, file_storage=None):
                         conteudo_atualizado = f"{conteudo_existente}\nMaterial: {titulo}" if conteudo_existente else f"Material: {titulo}"
                         update_data["conteudo_processado"] = conteudo_atualizado
                         
-                        update_response = requests.put(
+                        update_response = API_SESSION.put(
                             f"{API_BASE_URL}/baseconhecimento/update/{id_conhecimento}",
-                            json=update_data,
+                            data=orjson.dumps(update_data),
                             headers=headers,
                             timeout=10
                         )
                         
                         if update_response.status_code in (200, 204):
-                            print(f"[INFO] ✅ Registro atualizado com título e categoria")
+                            app.logger.info("✅ Registro atualizado com título e categoria")
                         
                         return True, {
                             'id': str(id_conhecimento),
-                            'titulo': titulo or file_storage.filename,
+                            'titulo': titulo or filename,
                             'disciplina': disciplina_nome,
                             'tipo': tipo,
                             'link': '',
@@ -1612,21 +2015,21 @@ def create_conteudo_api(data, file_storage=None):
                             'message': 'Conteúdo salvo com sucesso na API e armazenado no Supabase'
                         }
                     else:
-                        print(f"[WARN] Upload bem-sucedido mas ID não retornado. Dados: {result}")
+                        app.logger.warning("Upload bem-sucedido mas ID não retornado. Dados: %s", result)
                         return False, "Erro: Upload concluído mas ID do conhecimento não foi retornado."
                 else:
                     error_msg = f"Erro ao fazer upload do arquivo: {result}"
-                    print(f"[ERROR] {error_msg}")
+                    app.logger.error("%s", error_msg)
                     return False, error_msg
             else:
                 # Sem disciplina: precisa criar diretamente na baseconhecimento
                 error_msg = "Disciplina é obrigatória para upload de arquivos."
-                print(f"[ERROR] {error_msg}")
+                app.logger.error("%s", error_msg)
                 return False, error_msg
         
         # CASO 2: Apenas link (cria diretamente na baseconhecimento)
         elif link:
-            print(f"[INFO] Criando conteúdo com apenas link (sem arquivo)")
+            app.logger.info("Criando conteúdo com apenas link (sem arquivo)")
             
             # Buscar ID da disciplina
             id_disciplina = None
@@ -1646,19 +2049,19 @@ def create_conteudo_api(data, file_storage=None):
                 base_conhecimento_data["id_disciplina"] = str(id_disciplina)
             
             # Salvar na base de conhecimento
-            base_response = requests.post(
+            base_response = API_SESSION.post(
                 f"{API_BASE_URL}/baseconhecimento/",
-                json=base_conhecimento_data,
+                data=orjson.dumps(base_conhecimento_data),
                 headers=headers,
                 timeout=10
             )
             
-            print(f"[INFO] POST /baseconhecimento/ - Status: {base_response.status_code}")
+            app.logger.info("POST /baseconhecimento/ - Status: %s", base_response.status_code)
             
             if base_response.status_code == 201:
-                response_data = base_response.json()
+                response_data = oparse(base_response)
                 id_conhecimento = response_data.get('id_conhecimento', '')
-                print(f"[INFO] ✅ Conteúdo salvo com sucesso na base de conhecimento")
+                app.logger.info("✅ Conteúdo salvo com sucesso na base de conhecimento")
                 
                 return True, {
                     'id': str(id_conhecimento),
@@ -1671,37 +2074,40 @@ def create_conteudo_api(data, file_storage=None):
                 }
             else:
                 try:
-                    error_detail = base_response.json()
+                    error_detail = oparse(base_response)
                     error_msg = error_detail.get('detail', base_response.text)
                 except:
                     error_msg = base_response.text or f"Erro HTTP {base_response.status_code}"
-                print(f"[ERROR] POST /baseconhecimento/ - Status: {base_response.status_code} - {error_msg}")
+                app.logger.error("POST /baseconhecimento/ - Status: %s - %s", base_response.status_code, error_msg)
                 return False, error_msg
         else:
             # Nem arquivo nem link - retorna erro
             error_msg = "É necessário fornecer um arquivo ou um link."
-            print(f"[ERROR] {error_msg}")
+            app.logger.error("%s", error_msg)
             return False, error_msg
             
     except requests.exceptions.ConnectionError as e:
         error_msg = f"Não foi possível conectar à API em {API_BASE_URL}. Verifique se a API está rodando e acessível."
-        print(f"[ERROR] Erro de conexão: {e}")
+        app.logger.error("Erro de conexão: %s", e)
         return False, error_msg
     except requests.exceptions.Timeout as e:
         error_msg = f"Timeout ao conectar com a API em {API_BASE_URL}. O servidor pode estar sobrecarregado."
-        print(f"[ERROR] Timeout: {e}")
+        app.logger.error("Timeout: %s", e)
         return False, error_msg
     except Exception as e:
         error_msg = f"Erro inesperado ao criar conteúdo: {str(e)}"
-        print(f"[ERROR] Exception: {e}")
+        app.logger.error("Exception: %s", e)
         import traceback
-        traceback.print_exc()
+        app.logger.debug("Traceback: %s", traceback.format_exc())
         return False, error_msg
 
-def update_conteudo_api(conteudo_id, data, file_storage=None):
+def update_conteudo_api(conteudo_id, data, file_storage=None, disciplinas_future=None):
     # Atualiza conteúdo usando /baseconhecimento/update/{item_id}
+    # disciplinas_future: busca das disciplinas já iniciada pela rota (get_disciplinas_async);
+    # ela roda durante o upload e, ao terminar, o ID sai do índice em cache sem nova chamada
+    filename = file_storage.filename if file_storage else None
     try:
-        headers = get_auth_headers()
+        headers = g.get('auth_headers') or get_auth_headers()
         titulo = data.get('titulo', '')
         disciplina_nome = data.get('disciplina', '')
         tipo = data.get('tipo', 'aula')
@@ -1710,17 +2116,12 @@ def update_conteudo_api(conteudo_id, data, file_storage=None):
         # Mapear tipo para categoria
         categoria = 'Material de Aula'  # Sempre Material de Aula (removido Material Complementar)
         
-        # Buscar ID da disciplina
-        id_disciplina = None
-        if disciplina_nome and disciplina_nome != 'Sem Disciplina':
-            id_disciplina = get_disciplina_id_by_name(disciplina_nome)
-        
         # CASO 1: Upload de novo arquivo (cria novo registro, depois atualiza o antigo e deleta o novo)
         novo_id_conhecimento = None
         url_documento_novo = None
         
-        if file_storage and file_storage.filename:
-            print(f"[INFO] Fazendo upload do novo arquivo: {file_storage.filename}")
+        if filename:
+            app.logger.info("Fazendo upload do novo arquivo: %s", filename)
             
             if disciplina_nome and disciplina_nome != 'Sem Disciplina':
                 success, result = upload_documento_por_categoria(
@@ -1736,12 +2137,12 @@ def update_conteudo_api(conteudo_id, data, file_storage=None):
                     url_documento_novo = result.get('url_documento', '') or base_conhecimento.get('url_documento', '')
                     
                     if novo_id_conhecimento and url_documento_novo:
-                        print(f"[INFO] ✅ Novo arquivo enviado. Novo registro criado: {novo_id_conhecimento}")
-                        print(f"[INFO] URL do documento: {url_documento_novo}")
+                        app.logger.info("✅ Novo arquivo enviado. Novo registro criado: %s", novo_id_conhecimento)
+                        app.logger.info("URL do documento: %s", url_documento_novo)
                     else:
-                        print(f"[WARN] Upload concluído mas dados incompletos: {result}")
+                        app.logger.warning("Upload concluído mas dados incompletos: %s", result)
                 else:
-                    print(f"[WARN] Erro ao fazer upload do novo arquivo: {result}")
+                    app.logger.warning("Erro ao fazer upload do novo arquivo: %s", result)
                     return False
         
         # Preparar dados para atualização
@@ -1762,108 +2163,146 @@ def update_conteudo_api(conteudo_id, data, file_storage=None):
             # Atualiza com informação do novo arquivo
             update_data["conteudo_processado"] = f"Arquivo: {titulo}\nMaterial: {titulo}"
         
+        id_disciplina = None
+        if disciplina_nome and disciplina_nome != 'Sem Disciplina':
+            if disciplinas_future is not None:
+                disciplinas_future.result()
+            id_disciplina = get_disciplina_id_by_name(disciplina_nome)
         if id_disciplina:
             update_data["id_disciplina"] = str(id_disciplina)
         
         # Atualizar registro existente na base de conhecimento
-        resp = requests.put(
+        resp = API_SESSION.put(
             f"{API_BASE_URL}/baseconhecimento/update/{conteudo_id}",
-            json=update_data,
+            data=orjson.dumps(update_data),
             headers=headers,
             timeout=10
         )
         
-        print(f"[INFO] PUT /baseconhecimento/update/{conteudo_id} - Status: {resp.status_code}")
+        app.logger.info("PUT /baseconhecimento/update/%s - Status: %s", conteudo_id, resp.status_code)
         
         if resp.status_code in (200, 204):
-            print(f"[INFO] ✅ Conteúdo atualizado com sucesso no Supabase")
+            app.logger.info("✅ Conteúdo atualizado com sucesso no Supabase")
             
             # Se um novo registro foi criado pelo upload, deleta ele (já que atualizamos o antigo)
             if novo_id_conhecimento and str(novo_id_conhecimento) != str(conteudo_id):
-                print(f"[INFO] Deletando registro duplicado criado pelo upload: {novo_id_conhecimento}")
+                app.logger.info("Deletando registro duplicado criado pelo upload: %s", novo_id_conhecimento)
                 try:
-                    delete_resp = requests.delete(
+                    delete_resp = API_SESSION.delete(
                         f"{API_BASE_URL}/baseconhecimento/delete/{novo_id_conhecimento}",
                         headers=headers,
                         timeout=10
                     )
                     if delete_resp.status_code in (200, 204):
-                        print(f"[INFO] ✅ Registro duplicado deletado com sucesso")
+                        app.logger.info("✅ Registro duplicado deletado com sucesso")
                 except Exception as e:
-                    print(f"[WARN] Erro ao deletar registro duplicado: {e}")
+                    app.logger.warning("Erro ao deletar registro duplicado: %s", e)
             
             return True
         else:
-            print(f"[ERROR] Erro ao atualizar conteúdo: Status {resp.status_code}")
+            app.logger.error("Erro ao atualizar conteúdo: Status %s", resp.status_code)
             try:
-                error_detail = resp.json()
-                print(f"[ERROR] Detalhes: {error_detail}")
+                error_detail = oparse(resp)
+                app.logger.error("Detalhes: %s", error_detail)
             except:
-                print(f"[ERROR] Resposta: {resp.text[:200]}")
+                app.logger.error("Resposta: %s", resp.text[:200])
             return False
         
     except requests.exceptions.RequestException as e:
-        print(f"[ERROR] Conteúdo PUT falhou: {e}")
+        app.logger.error("Conteúdo PUT falhou: %s", e)
         import traceback
-        traceback.print_exc()
+        app.logger.debug("Traceback: %s", traceback.format_exc())
         return False
     except Exception as e:
-        print(f"[ERROR] Erro inesperado ao atualizar conteúdo: {e}")
+        app.logger.error("Erro inesperado ao atualizar conteúdo: %s", e)
         import traceback
-        traceback.print_exc()
+        app.logger.debug("Traceback: %s", traceback.format_exc())
         return False
 
-def delete_conteudo_api(conteudo_id):
+def delete_conteudo_api(conteudo_id, headers=None):
     # Deleta conteúdo usando /baseconhecimento/delete/{item_id}
+    # (headers podem ser passados para rodar fora da requisição, no API_EXECUTOR)
     try:
-        headers = get_auth_headers()
-        resp = requests.delete(
+        headers = headers or g.get('auth_headers') or get_auth_headers()
+        resp = API_SESSION.delete(
             f"{API_BASE_URL}/baseconhecimento/delete/{conteudo_id}",
             headers=headers,
             timeout=8
         )
-        print(f"[INFO] DELETE /baseconhecimento/delete/{conteudo_id} - Status: {resp.status_code}")
+        app.logger.info("DELETE /baseconhecimento/delete/%s - Status: %s", conteudo_id, resp.status_code)
         if resp.status_code in (200, 204):
-            print(f"[INFO] ✅ Conteúdo deletado com sucesso do Supabase")
+            app.logger.info("✅ Conteúdo deletado com sucesso do Supabase")
         return resp.status_code in (200, 204)
     except requests.exceptions.RequestException as e:
-        print(f"[ERROR] Conteúdo DELETE falhou: {e}")
+        app.logger.error("Conteúdo DELETE falhou: %s", e)
         return False
 
 # ===== Sessão (fallback local) =====
 
+def get_conteudo_dict_session():
+    # Conteúdos da sessão indexados pelo id (str), na ordem em que foram gravados:
+    # busca, atualização e remoção por id sem percorrer a lista
+    items = session.get('conteudos')
+    if items is None:
+        # Sessões antigas guardavam uma lista ('conteudos_list') + índice de posições
+        session.pop('conteudos_by_id', None)
+        items = _build_conteudo_dict(session.pop('conteudos_list', []))
+        session['conteudos'] = items
+    return items
+
 def get_conteudo_list_session():
     # Retorna lista de conteúdos da sessão ou lista vazia se não houver dados
-    return session.get('conteudos_list', [])
+    return list(get_conteudo_dict_session().values())
+
+def _build_conteudo_dict(items):
+    # Normaliza os ids para string uma única vez, evitando str() a cada comparação
+    by_id = {}
+    for it in items:
+        if it.get('id') is not None:
+            it['id'] = str(it['id'])
+            by_id[it['id']] = it
+    return by_id
 
 def set_conteudo_list_session(items):
-    session['conteudos_list'] = items
+    session['conteudos'] = _build_conteudo_dict(items)
     session.modified = True
 
 def add_conteudo_session(item):
-    items = get_conteudo_list_session()
-    max_id = max([i.get('id', 0) for i in items], default=0)
-    item = { **item, 'id': item.get('id') or (max_id + 1) }
-    items.append(item)
+    items = get_conteudo_dict_session()
+    max_id = max((int(k) for k in items if k.isdigit()), default=0)
+    item = { **item, 'id': str(item.get('id') or (max_id + 1)) }
+    items[item['id']] = item
     session.modified = True
     return item
 
 def update_conteudo_session(conteudo_id, updates):
-    items = get_conteudo_list_session()
-    for i, it in enumerate(items):
-        if str(it.get('id')) == str(conteudo_id):
-            items[i] = { **it, **updates }
-            session.modified = True
-            return items[i]
-    return None
+    # Altera o item no lugar: quem já o obteve por find_conteudo_session vê a mudança
+    item = get_conteudo_dict_session().get(str(conteudo_id))
+    if item is None:
+        return None
+    item.update(updates)
+    session.modified = True
+    return item
 
 def find_conteudo_session(conteudo_id):
-    items = get_conteudo_list_session()
-    return next((it for it in items if str(it.get('id')) == str(conteudo_id)), None)
+    return get_conteudo_dict_session().get(str(conteudo_id))
+
+def remove_conteudo_session(conteudo_id):
+    if get_conteudo_dict_session().pop(str(conteudo_id), None) is not None:
+        session.modified = True
 
 from collections import defaultdict
 
+def group_by_disciplina_api(items):
+    # Versão para os itens de get_conteudos_api, que já vêm normalizados
+    # (id, titulo, tipo, link, url_arquivo): só agrupa por disciplina
+    groups = defaultdict(list)
+    for it in items:
+        groups[it['disciplina'] or 'Sem Disciplina'].append(it)
+    return groups
+
 def group_by_disciplina(items):
+    # Versão genérica (itens da sessão, de origem variada): normaliza os campos
     groups = defaultdict(list)
     for it in items:
         disc = it.get('disciplina') or 'Sem Disciplina'
@@ -1887,63 +2326,63 @@ def conteudo_list():
     
     # Se conseguir buscar da API, usa esses dados
     if api_items and len(api_items) > 0:
-        set_conteudo_list_session(api_items)
+        # Só regrava a sessão se a lista mudou desde a última visita
+        if api_items != get_conteudo_list_session():
+            set_conteudo_list_session(api_items)
         items = api_items
-        print(f"[INFO] Carregados {len(items)} conteúdos da API")
+        app.logger.info("Carregados %s conteúdos da API", len(items))
     else:
         # Fallback para sessão apenas se a API não retornar nada
         items = get_conteudo_list_session()
         if items:
-            print(f"[INFO] Usando {len(items)} conteúdos da sessão (fallback)")
+            app.logger.info("Usando %s conteúdos da sessão (fallback)", len(items))
         else:
-            print(f"[INFO] Nenhum conteúdo encontrado na API nem na sessão")
+            app.logger.info("Nenhum conteúdo encontrado na API nem na sessão")
 
-    grouped = group_by_disciplina(items)
+    grouped = group_by_disciplina_api(items) if items is api_items else group_by_disciplina(items)
     disciplina = request.args.get('disciplina') or (next(iter(grouped.keys()), 'Sem Disciplina') if grouped else 'Sem Disciplina')
 
-    return render_template('conteudo/list.html', grouped=grouped, disciplina_selecionada=disciplina, user=session.get('user', {}))
+    return render_template('conteudo/list.html', grouped=grouped, disciplina_selecionada=disciplina)
 
 @app.route('/conteudo/add', methods=['GET', 'POST'])
 @login_required
 def conteudo_add():
-    print(f"[DEBUG] Rota /conteudo/add acessada - Método: {request.method}")
+    app.logger.debug("Rota /conteudo/add acessada - Método: %s", request.method)
     
-    # Buscar disciplinas da API para popular select
-    disciplinas = []
-    try:
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/disciplinas/lista_disciplina/", headers=headers, timeout=10)
-        if response.status_code == 200:
-            disciplinas = response.json()
-    except Exception as e:
-        print(f"[DEBUG] Erro ao buscar disciplinas: {e}")
-        disciplinas = []
+    # Busca as disciplinas (select do formulário) em segundo plano, com o mesmo
+    # cache usado na busca do ID da disciplina pelo nome
+    disciplinas_future = get_disciplinas_async()
     
     if request.method == 'POST':
-        print(f"[DEBUG] Processando POST /conteudo/add")
-        tipo = request.form.get('tipo', 'aula')
-        titulo = request.form.get('titulo', '').strip()
-        disciplina = request.form.get('disciplina', '').strip() or 'Sem Disciplina'
-        link = request.form.get('link', '').strip()
+        app.logger.debug("Processando POST /conteudo/add")
+        get = request.form.get
+        tipo = get('tipo', 'aula')
+        titulo = get('titulo', '').strip()
+        disciplina = get('disciplina', '').strip() or 'Sem Disciplina'
+        link = get('link', '').strip()
         arquivo = request.files.get('arquivo')
         
-        print(f"[DEBUG] Dados do formulário - tipo: {tipo}, titulo: {titulo}, disciplina: {disciplina}, link: {link}")
-        print(f"[DEBUG] Arquivo recebido: {arquivo.filename if arquivo and arquivo.filename else 'Nenhum'}")
+        app.logger.debug("Dados do formulário - tipo: %s, titulo: %s, disciplina: %s, link: %s", tipo, titulo, disciplina, link)
+        app.logger.debug("Arquivo recebido: %s", arquivo.filename if arquivo and arquivo.filename else 'Nenhum')
 
         if not titulo:
-            print(f"[WARN] POST /conteudo/add - Título não fornecido")
+            app.logger.warning("POST /conteudo/add - Título não fornecido")
             flash('Título é obrigatório.', 'error')
-            return render_template('conteudo/add.html', disciplinas=disciplinas)
+            return render_template('conteudo/add.html', disciplinas=disciplinas_future.result())
 
         if not link and (not arquivo or not arquivo.filename):
-            print(f"[WARN] POST /conteudo/add - Nem arquivo nem link fornecido")
+            app.logger.warning("POST /conteudo/add - Nem arquivo nem link fornecido")
             flash('Envie um arquivo ou informe um link.', 'error')
-            return render_template('conteudo/add.html', disciplinas=disciplinas)
+            return render_template('conteudo/add.html', disciplinas=disciplinas_future.result())
 
         payload = { 'tipo': tipo, 'titulo': titulo, 'disciplina': disciplina, 'link': link }
-        print(f"[DEBUG] Chamando create_conteudo_api com payload: {payload}")
+        app.logger.debug("Chamando create_conteudo_api com payload: %s", payload)
+        if link and not (arquivo and arquivo.filename):
+            # Só com link, o ID da disciplina é buscado pelo nome na mesma lista em cache:
+            # aguarda a busca já iniciada em vez de disparar uma segunda chamada
+            disciplinas_future.result()
         ok, resp = create_conteudo_api(payload, arquivo)
-        print(f"[DEBUG] Resposta de create_conteudo_api - ok: {ok}, resp: {resp}")
+        app.logger.debug("Resposta de create_conteudo_api - ok: %s, resp: %s", ok, resp)
         if ok:
             # Conteúdo já foi salvo na API (base de conhecimento + documentos)
             # Adiciona à sessão para exibição imediata
@@ -1961,7 +2400,7 @@ def conteudo_add():
             error_message = resp if isinstance(resp, str) else str(resp)
             flash(f'Erro ao cadastrar conteúdo: {error_message}', 'error')
 
-    return render_template('conteudo/add.html', disciplinas=disciplinas)
+    return render_template('conteudo/add.html', disciplinas=disciplinas_future.result())
 
 @app.route('/conteudo/edit/<conteudo_id>', methods=['GET', 'POST'])
 @login_required
@@ -1971,26 +2410,20 @@ def conteudo_edit(conteudo_id):
         flash('Conteúdo não encontrado.', 'error')
         return redirect(url_for('conteudo_list'))
     
-    # Buscar disciplinas da API para popular select
-    disciplinas = []
-    try:
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/disciplinas/lista_disciplina/", headers=headers, timeout=10)
-        if response.status_code == 200:
-            disciplinas = response.json()
-    except Exception as e:
-        print(f"[DEBUG] Erro ao buscar disciplinas: {e}")
-        disciplinas = []
+    # Busca as disciplinas (select do formulário) em segundo plano, com o mesmo
+    # cache usado na busca do ID da disciplina pelo nome
+    disciplinas_future = get_disciplinas_async()
 
     if request.method == 'POST':
-        tipo = request.form.get('tipo', item.get('tipo'))
-        titulo = request.form.get('titulo', item.get('titulo', ''))
-        disciplina = request.form.get('disciplina', item.get('disciplina', ''))
-        link = request.form.get('link', item.get('link', ''))
+        get = request.form.get
+        tipo = get('tipo', item.get('tipo'))
+        titulo = get('titulo', item.get('titulo', ''))
+        disciplina = get('disciplina', item.get('disciplina', ''))
+        link = get('link', item.get('link', ''))
         arquivo = request.files.get('arquivo')
 
         updates = { 'tipo': tipo, 'titulo': titulo, 'disciplina': disciplina, 'link': link }
-        api_ok = update_conteudo_api(conteudo_id, updates, arquivo)
+        api_ok = update_conteudo_api(conteudo_id, updates, arquivo, disciplinas_future)
         if api_ok:
             update_conteudo_session(conteudo_id, updates)
             flash('Conteúdo atualizado com sucesso!', 'success')
@@ -1998,211 +2431,237 @@ def conteudo_edit(conteudo_id):
         else:
             flash('Erro ao atualizar conteúdo.', 'error')
 
-    return render_template('conteudo/edit.html', conteudo=item, disciplinas=disciplinas)
+    return render_template('conteudo/edit.html', conteudo=item, disciplinas=disciplinas_future.result())
 
 @app.route('/conteudo/delete/<conteudo_id>', methods=['POST'])
 @login_required
 def conteudo_delete(conteudo_id):
     # Remove conteúdo via API (Supabase)
     try:
-        print(f"[DEBUG] Removendo conteúdo {conteudo_id}")
+        app.logger.debug("Removendo conteúdo %s", conteudo_id)
         
-        # Deletar na API (Supabase)
-        api_ok = delete_conteudo_api(conteudo_id)
+        # Deletar na API (Supabase) em segundo plano
+        headers = g.get('auth_headers') or get_auth_headers()
+        api_ok = wait_api_delete(API_EXECUTOR.submit(delete_conteudo_api, conteudo_id, headers))
         
-        if api_ok:
-            # Remove da sessão local
-            items = get_conteudo_list_session()
-            items[:] = [item for item in items if str(item.get('id')) != str(conteudo_id)]
-            set_conteudo_list_session(items)
+        if api_ok is not False:
+            # Remove da sessão local (também quando a exclusão ainda está em andamento)
+            remove_conteudo_session(conteudo_id)
             
-            flash('Conteúdo removido com sucesso do Supabase!', 'success')
+            if api_ok:
+                flash('Conteúdo removido com sucesso do Supabase!', 'success')
+            else:
+                flash('Remoção do conteúdo em processamento.', 'info')
         else:
             flash('Erro ao remover conteúdo da API.', 'error')
             
     except Exception as e:
-        print(f"[DEBUG] Erro ao remover conteúdo: {e}")
+        app.logger.debug("Erro ao remover conteúdo: %s", e)
         flash('Erro inesperado ao remover conteúdo.', 'error')
     
     return redirect(url_for('conteudo_list'))
 
 # ===== ROTAS DE AVISOS =====
 
+PROFESSORES_PATH = "/professores/lista_professores/"
+COORDENADORES_PATH = "/coordenador/get_list_coordenador/"
+# Listas dos selects (professores, coordenadores) mudam pouco: ficam 60 s no cache,
+# que é invalidado pelas escritas em /professores e /coordenador
+SELECTS_CACHE_TTL = 60
+
+# Data no formato YYYY-MM-DD, compilado uma única vez. O regex fixa o formato
+# (date.fromisoformat também aceitaria "20240101") e fromisoformat valida a data.
+ISO_DATE_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
+def is_iso_date(value):
+    if not ISO_DATE_RE.fullmatch(value):
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+def get_professores_coordenadores_async():
+    # Futures com professores e coordenadores para os selects dos avisos, buscados
+    # em paralelo e servidos do cache quando possível ([] em caso de erro)
+    return (api_list_async(PROFESSORES_PATH, ttl=SELECTS_CACHE_TTL),
+            api_list_async(COORDENADORES_PATH, ttl=SELECTS_CACHE_TTL))
+
+def get_professores_coordenadores():
+    # Como acima, já aguardando as duas listas: a espera fica a da chamada mais lenta
+    professores_future, coordenadores_future = get_professores_coordenadores_async()
+    return professores_future.result(), coordenadores_future.result()
+
+def get_professores_com_nome():
+    # Professores com 'nome_completo' já montado para os selects, guardados no cache
+    # junto com a lista (invalidados pelas escritas em /professores)
+    key = api_cache_key(PROFESSORES_PATH) + ('nome_completo',)
+    professores = cache_get(key)
+    if professores is None:
+        professores_api, status_code = api_get_cached(PROFESSORES_PATH, ttl=SELECTS_CACHE_TTL)
+        if status_code != 200:
+            return []
+        professores = [
+            {**prof, 'nome_completo': f"{prof.get('nome_professor', '')} {prof.get('sobrenome_professor', '')}".strip()}
+            for prof in professores_api
+        ]
+        cache_set(key, professores, SELECTS_CACHE_TTL)
+    return professores
+
 @app.route('/avisos')
 @login_required
 def avisos_list():
     # Lista avisos - busca da API
     try:
-        print(f"[DEBUG] Buscando avisos em: {API_BASE_URL}/aviso/get_lista_aviso/")
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/aviso/get_lista_aviso/", headers=headers, timeout=10)
-        print(f"[DEBUG] Avisos - Status: {response.status_code}")
+        app.logger.debug("Buscando avisos em: %s", AVISO_LIST_URL)
+        response = API_SESSION.get(AVISO_LIST_URL, headers=g.auth_headers, timeout=API_TIMEOUT)
+        app.logger.debug("Avisos - Status: %s", response.status_code)
         
         if response.status_code == 200:
-            avisos = response.json()
-            print(f"[DEBUG] {len(avisos)} avisos encontrados")
+            avisos = oparse(response)
+            app.logger.debug("%s avisos encontrados", len(avisos))
         else:
-            print(f"[DEBUG] Avisos retornou status {response.status_code}")
+            app.logger.debug("Avisos retornou status %s", response.status_code)
             avisos = []
             
     except requests.exceptions.RequestException as e:
-        print(f"[DEBUG] Erro ao buscar avisos: {e}")
+        app.logger.debug("Erro ao buscar avisos: %s", e)
         flash("Erro ao carregar avisos. Tente novamente.", "error")
         avisos = []
     
-    # Passar user para o template
-    user = session.get('user')
-    return render_template('avisos/list.html', avisos=avisos, user=user)
+    return render_template('avisos/list.html', avisos=avisos)
 
 @app.route('/avisos/add', methods=['GET', 'POST'])
 @login_required
 def avisos_add():
     # Adiciona novo aviso via API
-    # Carregar professores e coordenadores para o formulário
-    professores = []
-    coordenadores = []
-    
-    try:
-        headers = get_auth_headers()
-        # Buscar professores
-        prof_response = requests.get(f"{API_BASE_URL}/professores/lista_professores/", headers=headers, timeout=10)
-        if prof_response.status_code == 200:
-            professores = prof_response.json()
-        
-        # Buscar coordenadores
-        coord_response = requests.get(f"{API_BASE_URL}/coordenador/get_list_coordenador/", headers=headers, timeout=10)
-        if coord_response.status_code == 200:
-            coordenadores = coord_response.json()
-    except requests.exceptions.RequestException as e:
-        print(f"[DEBUG] Erro ao carregar professores/coordenadores: {e}")
-        # Continua com listas vazias
+    # Carregar professores e coordenadores para o formulário (em paralelo)
+    professores, coordenadores = get_professores_coordenadores()
     
     if request.method == 'POST':
         try:
             # Coleta dados do formulário
-            id_professor = request.form.get('id_professor', '').strip()
-            id_coordenador = request.form.get('id_coordenador', '').strip()
+            get = request.form.get
+            id_professor = get('id_professor', '').strip()
+            id_coordenador = get('id_coordenador', '').strip()
             
-            # Validar UUIDs - se vazio ou inválido, usar None
+            # Validações: acumula os erros e re-renderiza o formulário uma única vez
+            errors = []
             id_professor_uuid = None
             id_coordenador_uuid = None
             
+            # Validar UUIDs - se vazio usa None, se inválido registra erro
             if id_professor:
-                try:
-                    id_professor_uuid = str(uuid.UUID(id_professor))
-                except (ValueError, AttributeError):
-                    flash(f"ID do professor inválido: {id_professor}. Use um UUID válido ou deixe em branco.", "error")
-                    return render_template('avisos/add.html', professores=professores, coordenadores=coordenadores)
+                if UUID_RE.match(id_professor):
+                    id_professor_uuid = id_professor.lower()
+                else:
+                    errors.append(f"ID do professor inválido: {id_professor}. Use um UUID válido ou deixe em branco.")
             
             if id_coordenador:
-                try:
-                    id_coordenador_uuid = str(uuid.UUID(id_coordenador))
-                except (ValueError, AttributeError):
-                    flash(f"ID do coordenador inválido: {id_coordenador}. Use um UUID válido ou deixe em branco.", "error")
-                    return render_template('avisos/add.html', professores=professores, coordenadores=coordenadores)
+                if UUID_RE.match(id_coordenador):
+                    id_coordenador_uuid = id_coordenador.lower()
+                else:
+                    errors.append(f"ID do coordenador inválido: {id_coordenador}. Use um UUID válido ou deixe em branco.")
             
             aviso_data = {
-                'titulo': request.form.get('titulo', '').strip(),
-                'conteudo': request.form.get('conteudo', '').strip(),
-                'data': request.form.get('data', '').strip(),
+                'titulo': get('titulo', '').strip(),
+                'conteudo': get('conteudo', '').strip(),
+                'data': get('data', '').strip(),
                 'id_professor': id_professor_uuid,
                 'id_coordenador': id_coordenador_uuid
             }
             
             # Validação obrigatória
             if not aviso_data['titulo'] or not aviso_data['conteudo'] or not aviso_data['data']:
-                flash("Título, conteúdo e data são obrigatórios.", "error")
-                return render_template('avisos/add.html', professores=professores, coordenadores=coordenadores)
+                errors.append("Título, conteúdo e data são obrigatórios.")
+            else:
+                # Validação de data
+                if not is_iso_date(aviso_data['data']):
+                    errors.append("Formato de data inválido. Use YYYY-MM-DD.")
             
-            # Validação de data
-            try:
-                from datetime import datetime
-                datetime.strptime(aviso_data['data'], '%Y-%m-%d')
-            except ValueError:
-                flash("Formato de data inválido. Use YYYY-MM-DD.", "error")
+            if errors:
+                for msg in errors:
+                    flash(msg, "error")
                 return render_template('avisos/add.html', professores=professores, coordenadores=coordenadores)
             
             # Log do usuário que está criando o aviso
             user_role = session.get('user', {}).get('tipo', 'unknown')
             user_email = session.get('user', {}).get('email', 'unknown')
-            print(f"[INFO] POST /aviso/ - Usuário: {user_email}, Role: {user_role}")
-            print(f"[DEBUG] Criando aviso: {aviso_data}")
+            app.logger.info("POST /aviso/ - Usuário: %s, Role: %s", user_email, user_role)
+            app.logger.debug("Criando aviso: %s", aviso_data)
             
-            headers = get_auth_headers()
-            response = requests.post(f"{API_BASE_URL}/aviso/", json=aviso_data, headers=headers, timeout=10)
+            response = API_SESSION.post(AVISO_CREATE_URL, data=orjson.dumps(aviso_data), headers=g.auth_headers, timeout=API_TIMEOUT)
             
-            print(f"[INFO] POST /aviso/ - Status: {response.status_code}")
-            print(f"[DEBUG] Response: {response.text}")
+            app.logger.info("POST /aviso/ - Status: %s", response.status_code)
+            if app.logger.isEnabledFor(logging.DEBUG):
+                app.logger.debug("Response: %s", response.text)
             
             if response.status_code == 201:
-                print(f"[INFO] POST /aviso/ - Status: 201 - Aviso criado com sucesso")
-                print(f"[DEBUG] User role: {user_role}")
-                print(f"[DEBUG] Aviso criado com sucesso")
+                app.logger.info("POST /aviso/ - Status: 201 - Aviso criado com sucesso")
+                app.logger.debug("User role: %s", user_role)
+                app.logger.debug("Aviso criado com sucesso")
                 flash("Aviso criado com sucesso!", "success")
                 return redirect(url_for('avisos_list'))
             elif response.status_code == 400:
-                print(f"[ERROR] POST /aviso/ - Status: 400 - Dados inválidos")
+                app.logger.error("POST /aviso/ - Status: 400 - Dados inválidos")
                 try:
-                    error_detail = response.json()
+                    error_detail = oparse(response)
                     flash(f"Dados inválidos: {error_detail}", "error")
                 except:
                     flash("Dados inválidos. Verifique se todos os campos estão preenchidos corretamente.", "error")
-                return render_template('avisos/add.html', professores=professores, coordenadores=coordenadores)
             elif response.status_code == 403:
-                print(f"[WARN] POST /aviso/ - Status: 403 - Acesso negado")
-                print(f"[WARN] User role: {user_role}")
+                app.logger.warning("POST /aviso/ - Status: 403 - Acesso negado")
+                app.logger.warning("User role: %s", user_role)
                 try:
-                    error_detail = response.json()
+                    error_detail = oparse(response)
                     detail_msg = error_detail.get('detail', 'Acesso negado')
-                    print(f"[WARN] Acesso negado. Roles permitidos: admin, coordenador. Seu role: {user_role}")
+                    app.logger.warning("Acesso negado. Roles permitidos: admin, coordenador. Seu role: %s", user_role)
                     flash(f"Acesso negado: {detail_msg}", "error")
                 except:
                     flash("Acesso negado. Apenas administradores e coordenadores podem criar avisos.", "error")
-                return render_template('avisos/add.html', professores=professores, coordenadores=coordenadores)
             elif response.status_code == 401:
-                print(f"[ERROR] POST /aviso/ - Status: 401 - Token inválido ou não fornecido")
+                app.logger.error("POST /aviso/ - Status: 401 - Token inválido ou não fornecido")
                 return handle_token_expiration()
             else:
                 response.raise_for_status()
             
         except requests.exceptions.HTTPError as e:
             status_code = e.response.status_code if hasattr(e, 'response') else 'N/A'
-            print(f"[ERROR] POST /aviso/ - HTTPError: Status {status_code}")
-            print(f"[DEBUG] HTTPError: {e}")
+            app.logger.error("POST /aviso/ - HTTPError: Status %s", status_code)
+            app.logger.debug("HTTPError: %s", e)
             if e.response and e.response.status_code == 401:
                 return handle_token_expiration()
             elif e.response and e.response.status_code == 422:
                 try:
-                    error_detail = e.response.json()
+                    error_detail = oparse(e.response)
                     flash(f"Dados inválidos: {error_detail}", "error")
                 except:
                     flash("Dados inválidos. Verifique o formato.", "error")
-                return render_template('avisos/add.html', professores=professores, coordenadores=coordenadores)
             elif e.response.status_code == 403:
-                print(f"[WARN] POST /aviso/ - Status: 403 - Acesso negado")
+                app.logger.warning("POST /aviso/ - Status: 403 - Acesso negado")
                 user_role = session.get('user', {}).get('tipo', 'unknown')
-                print(f"[WARN] User role: {user_role}")
+                app.logger.warning("User role: %s", user_role)
                 try:
-                    error_detail = e.response.json()
+                    error_detail = oparse(e.response)
                     detail_msg = error_detail.get('detail', 'Acesso negado')
-                    print(f"[WARN] Acesso negado. Roles permitidos: admin, coordenador. Seu role: {user_role}")
+                    app.logger.warning("Acesso negado. Roles permitidos: admin, coordenador. Seu role: %s", user_role)
                     flash(f"Acesso negado: {detail_msg}", "error")
                 except:
                     flash("Acesso negado. Apenas administradores e coordenadores podem criar avisos.", "error")
-                return render_template('avisos/add.html', professores=professores, coordenadores=coordenadores)
             elif e.response.status_code == 401:
-                print(f"[ERROR] POST /aviso/ - Status: 401 - Token inválido ou não fornecido")
+                app.logger.error("POST /aviso/ - Status: 401 - Token inválido ou não fornecido")
                 return handle_token_expiration()
             else:
                 flash(f"Erro no servidor (HTTP {e.response.status_code}).", "error")
-                return render_template('avisos/add.html', professores=professores, coordenadores=coordenadores)
         except requests.exceptions.RequestException as e:
-            print(f"[DEBUG] RequestException: {e}")
+            app.logger.debug("RequestException: %s", e)
             flash("Erro de comunicação com o servidor.", "error")
         except Exception as e:
-            print(f"[DEBUG] Exception: {e}")
+            app.logger.debug("Exception: %s", e)
             flash("Erro inesperado ao criar aviso.", "error")
     
+    # Erros da API caem aqui e re-renderizam o formulário com as mensagens flash
     return render_template('avisos/add.html', professores=professores, coordenadores=coordenadores)
 
 @app.route('/avisos/view/<aviso_id>')
@@ -2210,14 +2669,13 @@ def avisos_add():
 def avisos_view(aviso_id):
     """ Visualiza aviso espec��fico """
     try:
-        print(f"[DEBUG] Buscando aviso {aviso_id}")
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/aviso/get_aviso_id/{aviso_id}", headers=headers, timeout=10)
-        print(f"[DEBUG] Status Code: {response.status_code}")
+        app.logger.debug("Buscando aviso %s", aviso_id)
+        response = API_SESSION.get(f"{API_BASE_URL}/aviso/get_aviso_id/{aviso_id}", headers=g.auth_headers, timeout=API_TIMEOUT)
+        app.logger.debug("Status Code: %s", response.status_code)
         
         if response.status_code == 200:
-            aviso = response.json()
-            print(f"[DEBUG] Aviso encontrado: {aviso}")
+            aviso = oparse(response)
+            app.logger.debug("Aviso encontrado: %s", aviso)
             return render_template('avisos/view.html', aviso=aviso)
         elif response.status_code == 404:
             flash("Aviso não encontrado.", "error")
@@ -2225,15 +2683,15 @@ def avisos_view(aviso_id):
             response.raise_for_status()
             
     except requests.exceptions.HTTPError as e:
-        print(f"[DEBUG] HTTPError: {e}")
+        app.logger.debug("HTTPError: %s", e)
         if e.response and e.response.status_code == 401:
             return handle_token_expiration()
         flash(f"Erro ao buscar aviso (HTTP {e.response.status_code if e.response else 'N/A'}).", "error")
     except requests.exceptions.RequestException as e:
-        print(f"[DEBUG] RequestException: {e}")
+        app.logger.debug("RequestException: %s", e)
         flash("Erro de comunicação com o servidor.", "error")
     except Exception as e:
-        print(f"[DEBUG] Exception: {e}")
+        app.logger.debug("Exception: %s", e)
         flash("Erro inesperado ao buscar aviso.", "error")
     
     return redirect(url_for('avisos_list'))
@@ -2242,109 +2700,58 @@ def avisos_view(aviso_id):
 @login_required
 def avisos_edit(aviso_id):
     # Edita aviso existente
+    # Professores e coordenadores (selects do formulário) são buscados uma única vez,
+    # em segundo plano, e reaproveitados por todos os caminhos que renderizam o formulário
+    professores_future, coordenadores_future = get_professores_coordenadores_async()
     if request.method == 'POST':
         try:
             # Coleta dados do formulário
+            get = request.form.get
             aviso_data = {
-                'titulo': request.form.get('titulo', '').strip(),
-                'conteudo': request.form.get('conteudo', '').strip(),
-                'data': request.form.get('data', '').strip(),
-                'id_professor': request.form.get('id_professor', '').strip() or None,
-                'id_coordenador': request.form.get('id_coordenador', '').strip() or None
+                'titulo': get('titulo', '').strip(),
+                'conteudo': get('conteudo', '').strip(),
+                'data': get('data', '').strip(),
+                'id_professor': get('id_professor', '').strip() or None,
+                'id_coordenador': get('id_coordenador', '').strip() or None
             }
             
             # Validação obrigatória
             if not aviso_data['titulo'] or not aviso_data['conteudo'] or not aviso_data['data']:
                 flash("Título, conteúdo e data são obrigatórios.", "error")
-                # Recarregar professores e coordenadores em caso de erro
-                professores = []
-                coordenadores = []
-                try:
-                    headers = get_auth_headers()
-                    prof_response = requests.get(f"{API_BASE_URL}/professores/lista_professores/", headers=headers, timeout=10)
-                    if prof_response.status_code == 200:
-                        professores = prof_response.json()
-                    coord_response = requests.get(f"{API_BASE_URL}/coordenador/get_list_coordenador/", headers=headers, timeout=10)
-                    if coord_response.status_code == 200:
-                        coordenadores = coord_response.json()
-                except:
-                    pass
-                return render_template('avisos/edit.html', aviso={'id_aviso': aviso_id, **aviso_data}, professores=professores, coordenadores=coordenadores)
+                return render_template('avisos/edit.html', aviso={'id_aviso': aviso_id, **aviso_data}, professores=professores_future.result(), coordenadores=coordenadores_future.result())
             
             # Validar UUIDs - se vazio ou inválido, usar None
             id_professor_uuid = None
             id_coordenador_uuid = None
             
             if aviso_data['id_professor']:
-                try:
-                    id_professor_uuid = str(uuid.UUID(aviso_data['id_professor']))
-                except (ValueError, AttributeError):
+                if UUID_RE.match(aviso_data['id_professor']):
+                    id_professor_uuid = aviso_data['id_professor'].lower()
+                else:
                     flash(f"ID do professor inválido: {aviso_data['id_professor']}. Use um UUID válido ou deixe em branco.", "error")
-                    # Recarregar professores e coordenadores em caso de erro
-                    professores = []
-                    coordenadores = []
-                    try:
-                        headers = get_auth_headers()
-                        prof_response = requests.get(f"{API_BASE_URL}/professores/lista_professores/", headers=headers, timeout=10)
-                        if prof_response.status_code == 200:
-                            professores = prof_response.json()
-                        coord_response = requests.get(f"{API_BASE_URL}/coordenador/get_list_coordenador/", headers=headers, timeout=10)
-                        if coord_response.status_code == 200:
-                            coordenadores = coord_response.json()
-                    except:
-                        pass
-                    return render_template('avisos/edit.html', aviso={'id_aviso': aviso_id, **aviso_data}, professores=professores, coordenadores=coordenadores)
+                    return render_template('avisos/edit.html', aviso={'id_aviso': aviso_id, **aviso_data}, professores=professores_future.result(), coordenadores=coordenadores_future.result())
             
             if aviso_data['id_coordenador']:
-                try:
-                    id_coordenador_uuid = str(uuid.UUID(aviso_data['id_coordenador']))
-                except (ValueError, AttributeError):
+                if UUID_RE.match(aviso_data['id_coordenador']):
+                    id_coordenador_uuid = aviso_data['id_coordenador'].lower()
+                else:
                     flash(f"ID do coordenador inválido: {aviso_data['id_coordenador']}. Use um UUID válido ou deixe em branco.", "error")
-                    # Recarregar professores e coordenadores em caso de erro
-                    professores = []
-                    coordenadores = []
-                    try:
-                        headers = get_auth_headers()
-                        prof_response = requests.get(f"{API_BASE_URL}/professores/lista_professores/", headers=headers, timeout=10)
-                        if prof_response.status_code == 200:
-                            professores = prof_response.json()
-                        coord_response = requests.get(f"{API_BASE_URL}/coordenador/get_list_coordenador/", headers=headers, timeout=10)
-                        if coord_response.status_code == 200:
-                            coordenadores = coord_response.json()
-                    except:
-                        pass
-                    return render_template('avisos/edit.html', aviso={'id_aviso': aviso_id, **aviso_data}, professores=professores, coordenadores=coordenadores)
+                    return render_template('avisos/edit.html', aviso={'id_aviso': aviso_id, **aviso_data}, professores=professores_future.result(), coordenadores=coordenadores_future.result())
             
             # Atualizar aviso_data com UUIDs validados
             aviso_data['id_professor'] = id_professor_uuid
             aviso_data['id_coordenador'] = id_coordenador_uuid
             
             # Validação de data
-            try:
-                from datetime import datetime
-                datetime.strptime(aviso_data['data'], '%Y-%m-%d')
-            except ValueError:
+            if not is_iso_date(aviso_data['data']):
                 flash("Formato de data inválido. Use YYYY-MM-DD.", "error")
-                # Recarregar professores e coordenadores em caso de erro
-                professores = []
-                coordenadores = []
-                try:
-                    headers = get_auth_headers()
-                    prof_response = requests.get(f"{API_BASE_URL}/professores/lista_professores/", headers=headers, timeout=10)
-                    if prof_response.status_code == 200:
-                        professores = prof_response.json()
-                    coord_response = requests.get(f"{API_BASE_URL}/coordenador/get_list_coordenador/", headers=headers, timeout=10)
-                    if coord_response.status_code == 200:
-                        coordenadores = coord_response.json()
-                except:
-                    pass
-                return render_template('avisos/edit.html', aviso={'id_aviso': aviso_id, **aviso_data}, professores=professores, coordenadores=coordenadores)
+                return render_template('avisos/edit.html', aviso={'id_aviso': aviso_id, **aviso_data}, professores=professores_future.result(), coordenadores=coordenadores_future.result())
             
-            print(f"[DEBUG] Atualizando aviso {aviso_id}: {aviso_data}")
-            headers = get_auth_headers()
-            response = requests.put(f"{API_BASE_URL}/aviso/update/{aviso_id}", json=aviso_data, headers=headers, timeout=10)
-            print(f"[DEBUG] Status Code: {response.status_code}")
-            print(f"[DEBUG] Response: {response.text}")
+            app.logger.debug("Atualizando aviso %s: %s", aviso_id, aviso_data)
+            response = API_SESSION.put(f"{API_BASE_URL}/aviso/update/{aviso_id}", data=orjson.dumps(aviso_data), headers=g.auth_headers, timeout=API_TIMEOUT)
+            app.logger.debug("Status Code: %s", response.status_code)
+            if app.logger.isEnabledFor(logging.DEBUG):
+                app.logger.debug("Response: %s", response.text)
             
             if response.status_code == 200:
                 flash("Aviso atualizado com sucesso!", "success")
@@ -2356,54 +2763,35 @@ def avisos_edit(aviso_id):
                 response.raise_for_status()
             
         except requests.exceptions.HTTPError as e:
-            print(f"[DEBUG] HTTPError: {e}")
+            app.logger.debug("HTTPError: %s", e)
             if e.response and e.response.status_code == 401:
                 return handle_token_expiration()
             elif e.response and e.response.status_code == 422:
                 try:
-                    error_detail = e.response.json()
+                    error_detail = oparse(e.response)
                     flash(f"Dados inválidos: {error_detail}", "error")
                 except:
                     flash("Dados inválidos. Verifique o formato.", "error")
             else:
                 flash(f"Erro no servidor (HTTP {e.response.status_code if e.response else 'N/A'}).", "error")
         except requests.exceptions.RequestException as e:
-            print(f"[DEBUG] RequestException: {e}")
+            app.logger.debug("RequestException: %s", e)
             flash("Erro de comunicação com o servidor.", "error")
         except Exception as e:
-            print(f"[DEBUG] Exception: {e}")
+            app.logger.debug("Exception: %s", e)
             flash("Erro inesperado ao atualizar aviso.", "error")
     
     # GET - Buscar dados do aviso para edição
-    # Carregar professores e coordenadores para o formulário
-    professores = []
-    coordenadores = []
-    
+    # As listas dos selects seguem sendo buscadas em segundo plano enquanto o aviso é carregado
     try:
-        headers = get_auth_headers()
-        # Buscar professores
-        prof_response = requests.get(f"{API_BASE_URL}/professores/lista_professores/", headers=headers, timeout=10)
-        if prof_response.status_code == 200:
-            professores = prof_response.json()
-        
-        # Buscar coordenadores
-        coord_response = requests.get(f"{API_BASE_URL}/coordenador/get_list_coordenador/", headers=headers, timeout=10)
-        if coord_response.status_code == 200:
-            coordenadores = coord_response.json()
-    except requests.exceptions.RequestException as e:
-        print(f"[DEBUG] Erro ao carregar professores/coordenadores: {e}")
-        # Continua com listas vazias
-    
-    try:
-        print(f"[DEBUG] Buscando aviso {aviso_id} para edição")
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/aviso/get_aviso_id/{aviso_id}", headers=headers, timeout=10)
-        print(f"[DEBUG] Status Code: {response.status_code}")
+        app.logger.debug("Buscando aviso %s para edição", aviso_id)
+        response = api_get(f"/aviso/get_aviso_id/{aviso_id}")
+        app.logger.debug("Status Code: %s", response.status_code)
         
         if response.status_code == 200:
-            aviso = response.json()
-            print(f"[DEBUG] Aviso encontrado para edição: {aviso}")
-            return render_template('avisos/edit.html', aviso=aviso, professores=professores, coordenadores=coordenadores)
+            aviso = oparse(response)
+            app.logger.debug("Aviso encontrado para edição: %s", aviso)
+            return render_template('avisos/edit.html', aviso=aviso, professores=professores_future.result(), coordenadores=coordenadores_future.result())
         elif response.status_code == 404:
             flash("Aviso não encontrado.", "error")
             return redirect(url_for('avisos_list'))
@@ -2411,15 +2799,15 @@ def avisos_edit(aviso_id):
             response.raise_for_status()
             
     except requests.exceptions.HTTPError as e:
-        print(f"[DEBUG] HTTPError: {e}")
+        app.logger.debug("HTTPError: %s", e)
         if e.response and e.response.status_code == 401:
             return handle_token_expiration()
         flash(f"Erro ao buscar aviso (HTTP {e.response.status_code if e.response else 'N/A'}).", "error")
     except requests.exceptions.RequestException as e:
-        print(f"[DEBUG] RequestException: {e}")
+        app.logger.debug("RequestException: %s", e)
         flash("Erro de comunicação com o servidor.", "error")
     except Exception as e:
-        print(f"[DEBUG] Exception: {e}")
+        app.logger.debug("Exception: %s", e)
         flash("Erro inesperado ao buscar aviso.", "error")
     
     return redirect(url_for('avisos_list'))
@@ -2429,12 +2817,13 @@ def avisos_edit(aviso_id):
 def avisos_delete(aviso_id):
     # Remove aviso via API
     try:
-        print(f"[DEBUG] Removendo aviso {aviso_id}")
-        headers = get_auth_headers()
-        response = requests.delete(f"{API_BASE_URL}/aviso/delete/{aviso_id}", headers=headers, timeout=10)
-        print(f"[DEBUG] Status Code: {response.status_code}")
+        app.logger.debug("Removendo aviso %s", aviso_id)
+        headers = g.auth_headers
+        response = wait_api_delete(submit_api_delete(f"{API_BASE_URL}/aviso/delete/{aviso_id}", headers))
         
-        if response.status_code == 204:
+        if response is None:
+            flash("Remoção do aviso em processamento.", "info")
+        elif response.status_code == 204:
             flash("Aviso removido com sucesso!", "success")
         elif response.status_code == 404:
             flash("Aviso não encontrado.", "error")
@@ -2442,15 +2831,15 @@ def avisos_delete(aviso_id):
             response.raise_for_status()
         
     except requests.exceptions.HTTPError as e:
-        print(f"[DEBUG] HTTPError: {e}")
+        app.logger.warning("HTTPError ao remover aviso: %s", e)
         if e.response and e.response.status_code == 401:
             return handle_token_expiration()
         flash(f"Erro ao remover aviso (HTTP {e.response.status_code if e.response else 'N/A'}).", "error")
     except requests.exceptions.RequestException as e:
-        print(f"[DEBUG] RequestException: {e}")
+        app.logger.warning("RequestException ao remover aviso: %s", e)
         flash("Erro de comunicação com o servidor.", "error")
     except Exception as e:
-        print(f"[DEBUG] Exception: {e}")
+        app.logger.error("Erro inesperado ao remover aviso: %s", e)
         flash("Erro inesperado ao remover aviso.", "error")
     
     return redirect(url_for('avisos_list'))
@@ -2458,18 +2847,45 @@ def avisos_delete(aviso_id):
 
 # ===== ROTAS DE CALENDÁRIO =====
 
+# Campos do wizard de matérias (add/edit) lidos diretamente do formulário
+WIZARD_STEP_FIELDS = {
+    1: ('nome', 'professor', 'codigo', 'carga_horaria', 'modalidade'),
+    3: ('dia_semana', 'hora_inicio', 'hora_fim', 'sala', 'tipo_aula'),
+}
+# Provas do passo 4: cada campo chega como '<prova>_<campo>' (ex.: np1_data)
+PROVA_KINDS = ('np1', 'np2', 'exame', 'sub')
+PROVA_FIELDS = ('data', 'inicio', 'fim', 'sala', 'aplicador', 'conteudo')
+
+def read_form_fields(form, fields):
+    return {f: form.get(f, '').strip() for f in fields}
+
+def read_provas_form(form):
+    return {k: {f: form.get(f"{k}_{f}", '').strip() for f in PROVA_FIELDS} for k in PROVA_KINDS}
+
+def index_professores_por_id(professores):
+    # id (str) -> professor, para resolver o aplicador das avaliações sem varrer a lista
+    return {str(prof.get('id')): prof for prof in professores}
+
+def index_professores_por_nome(professores):
+    # nome completo -> professor (mantém o primeiro em caso de nomes repetidos)
+    por_nome = {}
+    for prof in professores:
+        nome = prof.get('nome_completo') or f"{prof.get('nome_professor', '')} {prof.get('sobrenome_professor', '')}".strip()
+        por_nome.setdefault(nome, prof)
+    return por_nome
+
 def get_materias_list():
     # Busca a lista de disciplinas (matérias) da API
     try:
-        headers = get_auth_headers()
-        response = requests.get(
-            f"{API_BASE_URL}/disciplinas/lista_disciplina/",
+        headers = g.get('auth_headers') or get_auth_headers()
+        response = API_SESSION.get(
+            DISCIPLINAS_LIST_URL,
             headers=headers,
-            timeout=10
+            timeout=API_TIMEOUT
         )
         
         if response.status_code == 200:
-            disciplinas = response.json()
+            disciplinas = oparse(response)
             # Transforma os dados da API para o formato esperado pelo template
             materias = []
             for disc in disciplinas:
@@ -2479,7 +2895,7 @@ def get_materias_list():
                     # Se for UUID, converte para string
                     id_str = str(id_disciplina)
                 else:
-                    print(f"[WARN] Disciplina sem ID: {disc.get('nome_disciplina', 'N/A')}")
+                    app.logger.warning("Disciplina sem ID: %s", disc.get('nome_disciplina', 'N/A'))
                     continue
                 
                 materia = {
@@ -2500,19 +2916,19 @@ def get_materias_list():
                 
                 materias.append(materia)
             
-            print(f"[DEBUG] {len(materias)} matérias carregadas da API")
+            app.logger.debug("%s matérias carregadas da API", len(materias))
             return materias
         else:
-            print(f"[ERROR] Erro ao buscar disciplinas: {response.status_code}")
-            print(f"[ERROR] Resposta: {response.text}")
+            app.logger.error("Erro ao buscar disciplinas: %s", response.status_code)
+            app.logger.error("Resposta: %s", response.text)
             return []
     except requests.exceptions.RequestException as e:
-        print(f"[ERROR] Erro de conexão ao buscar disciplinas: {e}")
+        app.logger.error("Erro de conexão ao buscar disciplinas: %s", e)
         return []
     except Exception as e:
-        print(f"[ERROR] Erro inesperado ao buscar disciplinas: {e}")
+        app.logger.error("Erro inesperado ao buscar disciplinas: %s", e)
         import traceback
-        traceback.print_exc()
+        app.logger.debug("Traceback: %s", traceback.format_exc())
         return []
 
 def add_materia_session(item):
@@ -2534,7 +2950,7 @@ def clear_wizard_state():
 @login_required
 def calendario_list():
     materias = get_materias_list()
-    return render_template('calendario/list.html', materias=materias, user=session.get('user', {}))
+    return render_template('calendario/list.html', materias=materias)
 
 @app.route('/calendario/add', methods=['GET', 'POST'])
 @login_required
@@ -2546,87 +2962,36 @@ def calendario_add():
     # Buscar professores da API para popular selects
     professores = []
     try:
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/professores/lista_professores/", headers=headers, timeout=10)
-        if response.status_code == 200:
-            professores = response.json()
-            # Formatar nome completo para exibição
-            for prof in professores:
-                nome = prof.get('nome_professor', '')
-                sobrenome = prof.get('sobrenome_professor', '')
-                prof['nome_completo'] = f"{nome} {sobrenome}".strip()
+        professores = get_professores_com_nome()
     except Exception as e:
-        print(f"[DEBUG] Erro ao buscar professores: {e}")
+        app.logger.debug("Erro ao buscar professores: %s", e)
         professores = []
 
     if request.method == 'POST':
+        form = request.form
         if step == 1:
-            wizard.update({
-                'nome': request.form.get('nome', '').strip(),
-                'professor': request.form.get('professor', '').strip(),
-                'codigo': request.form.get('codigo', '').strip(),
-                'carga_horaria': request.form.get('carga_horaria', '').strip(),
-                'modalidade': request.form.get('modalidade', '').strip(),
-            })
+            wizard.update(read_form_fields(form, WIZARD_STEP_FIELDS[1]))
             session.modified = True
             return redirect(url_for('calendario_add', step=2))
         elif step == 2:
+            ementa_arquivo = request.files.get('ementa_arquivo')
             wizard.update({
-                'ementa_resumo': request.form.get('ementa_resumo', '').strip(),
-                'ementa_arquivo_nome': (request.files.get('ementa_arquivo').filename if request.files.get('ementa_arquivo') and request.files.get('ementa_arquivo').filename else '')
+                'ementa_resumo': form.get('ementa_resumo', '').strip(),
+                'ementa_arquivo_nome': (ementa_arquivo.filename if ementa_arquivo and ementa_arquivo.filename else '')
             })
             session.modified = True
             return redirect(url_for('calendario_add', step=3))
         elif step == 3:
-            wizard.update({
-                'dia_semana': request.form.get('dia_semana', '').strip(),
-                'hora_inicio': request.form.get('hora_inicio', '').strip(),
-                'hora_fim': request.form.get('hora_fim', '').strip(),
-                'sala': request.form.get('sala', '').strip(),
-                'tipo_aula': request.form.get('tipo_aula', '').strip(),
-            })
+            wizard.update(read_form_fields(form, WIZARD_STEP_FIELDS[3]))
             session.modified = True
             return redirect(url_for('calendario_add', step=4))
         elif step == 4:
-            provas = {
-                'np1': {
-                    'data': request.form.get('np1_data', '').strip(),
-                    'inicio': request.form.get('np1_inicio', '').strip(),
-                    'fim': request.form.get('np1_fim', '').strip(),
-                    'sala': request.form.get('np1_sala', '').strip(),
-                    'aplicador': request.form.get('np1_aplicador', '').strip(),
-                    'conteudo': request.form.get('np1_conteudo', '').strip(),
-                },
-                'np2': {
-                    'data': request.form.get('np2_data', '').strip(),
-                    'inicio': request.form.get('np2_inicio', '').strip(),
-                    'fim': request.form.get('np2_fim', '').strip(),
-                    'sala': request.form.get('np2_sala', '').strip(),
-                    'aplicador': request.form.get('np2_aplicador', '').strip(),
-                    'conteudo': request.form.get('np2_conteudo', '').strip(),
-                },
-                'exame': {
-                    'data': request.form.get('exame_data', '').strip(),
-                    'inicio': request.form.get('exame_inicio', '').strip(),
-                    'fim': request.form.get('exame_fim', '').strip(),
-                    'sala': request.form.get('exame_sala', '').strip(),
-                    'aplicador': request.form.get('exame_aplicador', '').strip(),
-                    'conteudo': request.form.get('exame_conteudo', '').strip(),
-                },
-                'sub': {
-                    'data': request.form.get('sub_data', '').strip(),
-                    'inicio': request.form.get('sub_inicio', '').strip(),
-                    'fim': request.form.get('sub_fim', '').strip(),
-                    'sala': request.form.get('sub_sala', '').strip(),
-                    'aplicador': request.form.get('sub_aplicador', '').strip(),
-                    'conteudo': request.form.get('sub_conteudo', '').strip(),
-                }
-            }
-            wizard['provas'] = provas
+            wizard['provas'] = read_provas_form(form)
+            professores_por_nome = index_professores_por_nome(professores)
 
             # Salvar na API
             try:
-                headers = get_auth_headers()
+                headers = g.auth_headers
                 
                 # 1. Criar disciplina na API
                 # Mapear dia da semana de nome para número
@@ -2649,73 +3014,75 @@ def calendario_add():
                     'carga_horaria': int(wizard.get('carga_horaria', '0').replace('h', '').replace('H', '').strip()) if wizard.get('carga_horaria') else 0
                 }
                 
-                print(f"[DEBUG] Criando disciplina: {disciplina_data}")
-                disciplina_response = requests.post(
-                    f"{API_BASE_URL}/disciplinas/",
-                    json=disciplina_data,
+                app.logger.debug("Criando disciplina: %s", disciplina_data)
+                disciplina_response = API_SESSION.post(
+                    DISCIPLINAS_CREATE_URL,
+                    data=orjson.dumps(disciplina_data),
                     headers=headers,
-                    timeout=10
+                    timeout=API_TIMEOUT
                 )
                 
                 if disciplina_response.status_code not in [200, 201]:
-                    error_detail = disciplina_response.json().get('detail', f'Erro {disciplina_response.status_code}') if disciplina_response.headers.get('content-type', '').startswith('application/json') else disciplina_response.text
+                    error_detail = oparse(disciplina_response).get('detail', f'Erro {disciplina_response.status_code}') if disciplina_response.headers.get('content-type', '').startswith('application/json') else disciplina_response.text
                     raise Exception(f"Erro ao criar disciplina: {error_detail}")
                 
-                disciplina_criada = disciplina_response.json()
+                disciplina_criada = oparse(disciplina_response)
                 disciplina_id = disciplina_criada.get('id_disciplina')
-                print(f"[DEBUG] Disciplina criada com ID: {disciplina_id}")
+                app.logger.debug("Disciplina criada com ID: %s", disciplina_id)
                 
                 # 2. Associar professor à disciplina (se houver)
                 if wizard.get('professor'):
                     # Buscar ID do professor pelo nome
-                    professores_response = requests.get(
-                        f"{API_BASE_URL}/professores/lista_professores/",
-                        headers=headers,
-                        timeout=10
-                    )
-                    if professores_response.status_code == 200:
-                        professores_list = professores_response.json()
-                        for prof in professores_list:
-                            nome_completo = f"{prof.get('nome_professor', '')} {prof.get('sobrenome_professor', '')}".strip()
-                            if nome_completo == wizard.get('professor'):
-                                # Campo correto é 'id', não 'id_professor'
-                                professor_id = prof.get('id')
-                                if not professor_id:
-                                    print(f"[WARN] Professor encontrado mas sem ID: {nome_completo}")
-                                    break
-                                
-                                # Associar professor à disciplina via atualização do professor
-                                # A API cria a associação automaticamente quando atualizamos disciplina_nomes
-                                try:
-                                    # Buscar disciplinas atuais do professor (se retornadas pela API)
-                                    disciplinas_atual = prof.get('disciplina_nomes', [])
-                                    
-                                    # Se não estiver na lista de disciplinas, adiciona
-                                    nome_disciplina = wizard.get('nome', '')
-                                    if nome_disciplina and nome_disciplina not in disciplinas_atual:
-                                        disciplinas_atual.append(nome_disciplina)
-                                    
-                                    # Atualizar professor com nova disciplina (a API cria a associação)
-                                    update_response = requests.put(
-                                        f"{API_BASE_URL}/professores/update/{professor_id}",
-                                        json={'disciplina_nomes': disciplinas_atual},
-                                        headers=headers,
-                                        timeout=10
-                                    )
-                                    if update_response.status_code == 200:
-                                        print(f"[DEBUG] Professor {nome_completo} associado à disciplina {nome_disciplina}")
-                                    else:
-                                        error_text = update_response.text
-                                        try:
-                                            error_detail = update_response.json().get('detail', error_text)
-                                        except:
-                                            error_detail = error_text
-                                        print(f"[WARN] Erro ao atualizar professor: {error_detail}")
-                                except Exception as e:
-                                    print(f"[WARN] Erro ao associar professor: {e}")
-                                    import traceback
-                                    traceback.print_exc()
+                    # Usa a lista de professores já carregada para o formulário
+                    for prof in professores:
+                        nome_completo = prof['nome_completo']
+                        if nome_completo == wizard.get('professor'):
+                            # Campo correto é 'id', não 'id_professor'
+                            professor_id = prof.get('id')
+                            if not professor_id:
+                                app.logger.warning("Professor encontrado mas sem ID: %s", nome_completo)
                                 break
+                            
+                            # Associar professor à disciplina via atualização do professor
+                            # A API cria a associação automaticamente quando atualizamos disciplina_nomes
+                            try:
+                                # Buscar disciplinas atuais do professor direto na API: a lista dos
+                                # selects vem do cache (até 60 s, por processo) e um PUT com ela
+                                # desfaria associações feitas nesse intervalo. A lista é copiada
+                                # para não alterar o item guardado no cache.
+                                prof_response = api_get(f"/professores/get_professor/{professor_id}", headers=headers)
+                                if prof_response.status_code == 200:
+                                    disciplinas_atual = list(oparse(prof_response).get('disciplina_nomes') or [])
+                                else:
+                                    app.logger.warning("Professor %s não encontrado na API (HTTP %s); usando a lista dos selects", professor_id, prof_response.status_code)
+                                    disciplinas_atual = list(prof.get('disciplina_nomes') or [])
+                                
+                                # Se não estiver na lista de disciplinas, adiciona
+                                nome_disciplina = wizard.get('nome', '')
+                                if nome_disciplina and nome_disciplina not in disciplinas_atual:
+                                    disciplinas_atual.append(nome_disciplina)
+                                
+                                # Atualizar professor com nova disciplina (a API cria a associação)
+                                update_response = API_SESSION.put(
+                                    f"{API_BASE_URL}/professores/update/{professor_id}",
+                                    data=orjson.dumps({'disciplina_nomes': disciplinas_atual}),
+                                    headers=headers,
+                                    timeout=API_TIMEOUT
+                                )
+                                if update_response.status_code == 200:
+                                    app.logger.debug("Professor %s associado à disciplina %s", nome_completo, nome_disciplina)
+                                else:
+                                    error_text = update_response.text
+                                    try:
+                                        error_detail = oparse(update_response).get('detail', error_text)
+                                    except:
+                                        error_detail = error_text
+                                    app.logger.warning("Erro ao atualizar professor: %s", error_detail)
+                            except Exception as e:
+                                app.logger.warning("Erro ao associar professor: %s", e)
+                                import traceback
+                                app.logger.debug("Traceback: %s", traceback.format_exc())
+                            break
                 
                 # 3. Criar cronograma na API (se houver dados)
                 if wizard.get('dia_semana') and wizard.get('hora_inicio') and wizard.get('hora_fim'):
@@ -2740,20 +3107,20 @@ def calendario_add():
                             'tipo_aula': wizard.get('tipo_aula', '') if wizard.get('tipo_aula') else None
                         }
                         
-                        print(f"[DEBUG] Criando cronograma: {cronograma_data}")
-                        cronograma_response = requests.post(
-                            f"{API_BASE_URL}/cronograma/",
-                            json=cronograma_data,
+                        app.logger.debug("Criando cronograma: %s", cronograma_data)
+                        cronograma_response = API_SESSION.post(
+                            CRONOGRAMA_CREATE_URL,
+                            data=orjson.dumps(cronograma_data),
                             headers=headers,
-                            timeout=10
+                            timeout=API_TIMEOUT
                         )
                         
                         if cronograma_response.status_code not in [200, 201]:
-                            print(f"[WARN] Erro ao criar cronograma: {cronograma_response.text}")
+                            app.logger.warning("Erro ao criar cronograma: %s", cronograma_response.text)
                         else:
-                            print(f"[DEBUG] Cronograma criado com sucesso")
+                            app.logger.debug("Cronograma criado com sucesso")
                     except Exception as e:
-                        print(f"[WARN] Erro ao criar cronograma: {e}")
+                        app.logger.warning("Erro ao criar cronograma: %s", e)
                 
                 # 4. Criar avaliações na API
                 for tipo_prova, dados_prova in wizard.get('provas', {}).items():
@@ -2762,18 +3129,9 @@ def calendario_add():
                             # Buscar ID do aplicador pelo nome
                             id_aplicador = None
                             if dados_prova.get('aplicador'):
-                                professores_response = requests.get(
-                                    f"{API_BASE_URL}/professores/lista_professores/",
-                                    headers=headers,
-                                    timeout=10
-                                )
-                                if professores_response.status_code == 200:
-                                    professores_list = professores_response.json()
-                                    for prof in professores_list:
-                                        nome_completo = f"{prof.get('nome_professor', '')} {prof.get('sobrenome_professor', '')}".strip()
-                                        if nome_completo == dados_prova.get('aplicador'):
-                                            id_aplicador = prof.get('id')  # Campo correto é 'id', não 'id_professor'
-                                            break
+                                aplicador = professores_por_nome.get(dados_prova.get('aplicador'))
+                                if aplicador:
+                                    id_aplicador = aplicador.get('id')  # Campo correto é 'id', não 'id_professor'
                             
                             # Formatar hora para HH:MM:SS se necessário
                             hora_inicio_av = dados_prova.get('inicio', '')
@@ -2794,20 +3152,20 @@ def calendario_add():
                                 'id_aplicador': str(id_aplicador) if id_aplicador else None
                             }
                             
-                            print(f"[DEBUG] Criando avaliação {tipo_prova}: {avaliacao_data}")
-                            avaliacao_response = requests.post(
-                                f"{API_BASE_URL}/avaliacao/",
-                                json=avaliacao_data,
+                            app.logger.debug("Criando avaliação %s: %s", tipo_prova, avaliacao_data)
+                            avaliacao_response = API_SESSION.post(
+                                AVALIACAO_CREATE_URL,
+                                data=orjson.dumps(avaliacao_data),
                                 headers=headers,
-                                timeout=10
+                                timeout=API_TIMEOUT
                             )
                             
                             if avaliacao_response.status_code not in [200, 201]:
-                                print(f"[WARN] Erro ao criar avaliação {tipo_prova}: {avaliacao_response.text}")
+                                app.logger.warning("Erro ao criar avaliação %s: %s", tipo_prova, avaliacao_response.text)
                             else:
-                                print(f"[DEBUG] Avaliação {tipo_prova} criada com sucesso")
+                                app.logger.debug("Avaliação %s criada com sucesso", tipo_prova)
                         except Exception as e:
-                            print(f"[WARN] Erro ao criar avaliação {tipo_prova}: {e}")
+                            app.logger.warning("Erro ao criar avaliação %s: %s", tipo_prova, e)
                 
                 # 5. Upload do arquivo de ementa se houver
                 if request.files.get('ementa_arquivo'):
@@ -2821,25 +3179,25 @@ def calendario_add():
                                 nome_disciplina=wizard.get('nome')
                             )
                             if sucesso:
-                                print(f"[DEBUG] Arquivo de ementa enviado com sucesso")
+                                app.logger.debug("Arquivo de ementa enviado com sucesso")
                             else:
-                                print(f"[WARN] Erro ao enviar arquivo de ementa: {mensagem}")
+                                app.logger.warning("Erro ao enviar arquivo de ementa: %s", mensagem)
                         except Exception as e:
-                            print(f"[WARN] Erro ao enviar arquivo de ementa: {e}")
+                            app.logger.warning("Erro ao enviar arquivo de ementa: %s", e)
                 
                 clear_wizard_state()
                 flash('Matéria cadastrada com sucesso na API!', 'success')
                 return redirect(url_for('calendario_view', materia_id=str(disciplina_id)))
                 
             except Exception as e:
-                print(f"[ERROR] Erro ao salvar na API: {e}")
+                app.logger.error("Erro ao salvar na API: %s", e)
                 import traceback
-                traceback.print_exc()
+                app.logger.debug("Traceback: %s", traceback.format_exc())
                 flash(f'Erro ao salvar matéria na API: {str(e)}', 'error')
                 # Mantém o wizard para o usuário poder tentar novamente
                 return redirect(url_for('calendario_add', step=4))
 
-    return render_template('calendario/add.html', step=step, wizard=wizard, user=session.get('user', {}), professores=professores)
+    return render_template('calendario/add.html', step=step, wizard=wizard, professores=professores)
 
 @app.route('/calendario/view/<materia_id>')
 @login_required
@@ -2853,7 +3211,11 @@ def calendario_view(materia_id):
         print(f"[DEBUG] Buscando disciplina: {url}")
         print(f"[DEBUG] Materia ID recebido: {materia_id} (tipo: {type(materia_id)})")
         
-        response = requests.get(url, headers=headers, timeout=10)
+        # Cronograma e avaliações não dependem da disciplina: busca em paralelo
+        cronograma_future = API_EXECUTOR.submit(api_get, f"/cronograma/disciplina/{materia_id}", headers)
+        avaliacoes_future = API_EXECUTOR.submit(api_get, f"/avaliacao/disciplina/{materia_id}", headers)
+        
+        response = API_SESSION.get(url, headers=headers, timeout=10)
         
         print(f"[DEBUG] Status Code: {response.status_code}")
         print(f"[DEBUG] Response: {response.text[:200] if response.text else 'Sem resposta'}")
@@ -2865,11 +3227,7 @@ def calendario_view(materia_id):
             # Busca todos os cronogramas da disciplina
             cronogramas_list = []
             try:
-                cronograma_response = requests.get(
-                    f"{API_BASE_URL}/cronograma/disciplina/{materia_id}",
-                    headers=headers,
-                    timeout=10
-                )
+                cronograma_response = cronograma_future.result()
                 if cronograma_response.status_code == 200:
                     cronogramas = cronograma_response.json()
                     # Mantém todos os cronogramas
@@ -2882,14 +3240,10 @@ def calendario_view(materia_id):
             # Busca as avaliações da disciplina
             avaliacoes_data = []
             provas_dict = {}
+            professores_por_id = None
             try:
-                avaliacoes_url = f"{API_BASE_URL}/avaliacao/disciplina/{materia_id}"
-                print(f"[DEBUG] Buscando avaliações para disciplina {materia_id} em: {avaliacoes_url}")
-                avaliacoes_response = requests.get(
-                    avaliacoes_url,
-                    headers=headers,
-                    timeout=10
-                )
+                print(f"[DEBUG] Buscando avaliações para disciplina {materia_id}")
+                avaliacoes_response = avaliacoes_future.result()
                 print(f"[DEBUG] Status Code da resposta de avaliações: {avaliacoes_response.status_code}")
                 
                 if avaliacoes_response.status_code == 200:
@@ -2908,7 +3262,6 @@ def calendario_view(materia_id):
                             data_prova = avaliacao.get('data_prova', '')
                             if data_prova:
                                 try:
-                                    from datetime import datetime
                                     dt = datetime.strptime(data_prova, '%Y-%m-%d')
                                     data_formatada = dt.strftime('%d/%m/%Y')
                                 except:
@@ -2926,18 +3279,13 @@ def calendario_view(materia_id):
                                 try:
                                     # Buscar o nome do professor/aplicador na lista de professores
                                     aplicador_id = avaliacao.get('id_aplicador')
-                                    aplicador_data = None
-                                    professores_response = requests.get(
-                                        f"{API_BASE_URL}/professores/lista_professores/",
-                                        headers=headers,
-                                        timeout=5
-                                    )
-                                    if professores_response.status_code == 200:
-                                        professores_list = professores_response.json()
-                                        for prof in professores_list:
-                                            if str(prof.get('id')) == str(aplicador_id):
-                                                aplicador_data = prof
-                                                break
+                                    # Lista de professores buscada uma única vez e indexada por id
+                                    if professores_por_id is None:
+                                        professores_por_id = {}
+                                        professores_response = api_get("/professores/lista_professores/", headers, timeout=5)
+                                        if professores_response.status_code == 200:
+                                            professores_por_id = index_professores_por_id(professores_response.json())
+                                    aplicador_data = professores_por_id.get(str(aplicador_id))
                                     
                                     if aplicador_data:
                                         nome_aplicador = f"{aplicador_data.get('nome_professor', '')} {aplicador_data.get('sobrenome_professor', '')}".strip()
@@ -3062,7 +3410,7 @@ def calendario_view(materia_id):
         flash('Matéria não encontrada.', 'error')
         return redirect(url_for('calendario_list'))
     
-    return render_template('calendario/view.html', materia=materia, user=session.get('user', {}))
+    return render_template('calendario/view.html', materia=materia)
 
 @app.route('/calendario/edit/<materia_id>', methods=['GET', 'POST'])
 @login_required
@@ -3071,6 +3419,24 @@ def calendario_edit(materia_id):
     # Buscar dados da API
     headers = get_auth_headers()
     materia = None
+
+    # Lista de professores buscada uma única vez por requisição, em segundo plano
+    # (junto com a disciplina): serve ao nome do aplicador das avaliações, aos
+    # selects e à associação do professor no passo 4
+    def buscar_professores():
+        # Sem contexto de requisição na thread do executor: usa os headers já montados
+        try:
+            response = api_get(PROFESSORES_PATH, headers)
+            if response.status_code == 200:
+                return [
+                    {**prof, 'nome_completo': f"{prof.get('nome_professor', '')} {prof.get('sobrenome_professor', '')}".strip()}
+                    for prof in oparse(response)
+                ]
+        except Exception as e:
+            print(f"[DEBUG] Erro ao buscar professores: {e}")
+        return []
+
+    professores_future = API_EXECUTOR.submit(buscar_professores)
     
     try:
         # Buscar disciplina da API
@@ -3097,6 +3463,7 @@ def calendario_edit(materia_id):
             
             # Buscar avaliações
             provas_dict = {}
+            professores_por_id = None
             try:
                 avaliacoes_response = requests.get(
                     f"{API_BASE_URL}/avaliacao/disciplina/{materia_id}",
@@ -3123,18 +3490,10 @@ def calendario_edit(materia_id):
                                 try:
                                     # Buscar o nome do professor/aplicador na lista de professores
                                     aplicador_id = avaliacao.get('id_aplicador')
-                                    aplicador_data = None
-                                    professores_response = requests.get(
-                                        f"{API_BASE_URL}/professores/lista_professores/",
-                                        headers=headers,
-                                        timeout=5
-                                    )
-                                    if professores_response.status_code == 200:
-                                        professores_list = professores_response.json()
-                                        for prof in professores_list:
-                                            if str(prof.get('id')) == str(aplicador_id):
-                                                aplicador_data = prof
-                                                break
+                                    # Lista de professores da requisição, indexada por id uma única vez
+                                    if professores_por_id is None:
+                                        professores_por_id = index_professores_por_id(professores_future.result())
+                                    aplicador_data = professores_por_id.get(str(aplicador_id))
                                     
                                     if aplicador_data:
                                         nome_aplicador = f"{aplicador_data.get('nome_professor', '')} {aplicador_data.get('sobrenome_professor', '')}".strip()
@@ -3210,20 +3569,8 @@ def calendario_edit(materia_id):
         flash('Matéria não encontrada.', 'error')
         return redirect(url_for('calendario_list'))
 
-    # Buscar professores da API para popular selects
-    professores = []
-    try:
-        response = requests.get(f"{API_BASE_URL}/professores/lista_professores/", headers=headers, timeout=10)
-        if response.status_code == 200:
-            professores = response.json()
-            # Formatar nome completo para exibição
-            for prof in professores:
-                nome = prof.get('nome_professor', '')
-                sobrenome = prof.get('sobrenome_professor', '')
-                prof['nome_completo'] = f"{nome} {sobrenome}".strip()
-    except Exception as e:
-        print(f"[DEBUG] Erro ao buscar professores: {e}")
-        professores = []
+    # Professores para popular selects (mesma lista já buscada acima)
+    professores = professores_future.result()
 
     step = int(request.args.get('step') or request.form.get('step') or 1)
     # Usa dados da API se não houver wizard na sessão, senão mantém o wizard
@@ -3233,69 +3580,26 @@ def calendario_edit(materia_id):
         wizard = session.get('edit_wizard', materia.copy())
 
     if request.method == 'POST':
+        form = request.form
         if step == 1:
-            wizard.update({
-                'nome': request.form.get('nome', '').strip(),
-                'professor': request.form.get('professor', '').strip(),
-                'codigo': request.form.get('codigo', '').strip(),
-                'carga_horaria': request.form.get('carga_horaria', '').strip(),
-                'modalidade': request.form.get('modalidade', '').strip(),
-            })
+            wizard.update(read_form_fields(form, WIZARD_STEP_FIELDS[1]))
             session.modified = True
             return redirect(url_for('calendario_edit', materia_id=materia_id, step=2))
         elif step == 2:
+            ementa_arquivo = request.files.get('ementa_arquivo')
             wizard.update({
-                'ementa_resumo': request.form.get('ementa_resumo', '').strip(),
-                'ementa_arquivo_nome': (request.files.get('ementa_arquivo').filename if request.files.get('ementa_arquivo') and request.files.get('ementa_arquivo').filename else wizard.get('ementa_arquivo_nome', ''))
+                'ementa_resumo': form.get('ementa_resumo', '').strip(),
+                'ementa_arquivo_nome': (ementa_arquivo.filename if ementa_arquivo and ementa_arquivo.filename else wizard.get('ementa_arquivo_nome', ''))
             })
             session.modified = True
             return redirect(url_for('calendario_edit', materia_id=materia_id, step=3))
         elif step == 3:
-            wizard.update({
-                'dia_semana': request.form.get('dia_semana', '').strip(),
-                'hora_inicio': request.form.get('hora_inicio', '').strip(),
-                'hora_fim': request.form.get('hora_fim', '').strip(),
-                'sala': request.form.get('sala', '').strip(),
-                'tipo_aula': request.form.get('tipo_aula', '').strip(),
-            })
+            wizard.update(read_form_fields(form, WIZARD_STEP_FIELDS[3]))
             session.modified = True
             return redirect(url_for('calendario_edit', materia_id=materia_id, step=4))
         elif step == 4:
-            provas = {
-                'np1': {
-                    'data': request.form.get('np1_data', '').strip(),
-                    'inicio': request.form.get('np1_inicio', '').strip(),
-                    'fim': request.form.get('np1_fim', '').strip(),
-                    'sala': request.form.get('np1_sala', '').strip(),
-                    'aplicador': request.form.get('np1_aplicador', '').strip(),
-                    'conteudo': request.form.get('np1_conteudo', '').strip(),
-                },
-                'np2': {
-                    'data': request.form.get('np2_data', '').strip(),
-                    'inicio': request.form.get('np2_inicio', '').strip(),
-                    'fim': request.form.get('np2_fim', '').strip(),
-                    'sala': request.form.get('np2_sala', '').strip(),
-                    'aplicador': request.form.get('np2_aplicador', '').strip(),
-                    'conteudo': request.form.get('np2_conteudo', '').strip(),
-                },
-                'exame': {
-                    'data': request.form.get('exame_data', '').strip(),
-                    'inicio': request.form.get('exame_inicio', '').strip(),
-                    'fim': request.form.get('exame_fim', '').strip(),
-                    'sala': request.form.get('exame_sala', '').strip(),
-                    'aplicador': request.form.get('exame_aplicador', '').strip(),
-                    'conteudo': request.form.get('exame_conteudo', '').strip(),
-                },
-                'sub': {
-                    'data': request.form.get('sub_data', '').strip(),
-                    'inicio': request.form.get('sub_inicio', '').strip(),
-                    'fim': request.form.get('sub_fim', '').strip(),
-                    'sala': request.form.get('sub_sala', '').strip(),
-                    'aplicador': request.form.get('sub_aplicador', '').strip(),
-                    'conteudo': request.form.get('sub_conteudo', '').strip(),
-                }
-            }
-            wizard['provas'] = provas
+            wizard['provas'] = read_provas_form(form)
+            professores_por_nome = index_professores_por_nome(professores)
 
             # Atualizar na API
             try:
@@ -3326,7 +3630,7 @@ def calendario_edit(materia_id):
                 disciplina_update = {k: v for k, v in disciplina_update.items() if v is not None}
                 
                 print(f"[DEBUG] Atualizando disciplina {materia_id}: {disciplina_update}")
-                disciplina_response = requests.put(
+                disciplina_response = API_SESSION.put(
                     f"{API_BASE_URL}/disciplinas/update/{materia_id}",
                     json=disciplina_update,
                     headers=headers,
@@ -3342,52 +3646,45 @@ def calendario_edit(materia_id):
                 # 2. Atualizar associação do professor (se mudou)
                 if wizard.get('professor'):
                     # Buscar ID do professor pelo nome
-                    professores_response = requests.get(
-                        f"{API_BASE_URL}/professores/lista_professores/",
-                        headers=headers,
-                        timeout=10
-                    )
-                    if professores_response.status_code == 200:
-                        professores_list = professores_response.json()
-                        for prof in professores_list:
-                            nome_completo = f"{prof.get('nome_professor', '')} {prof.get('sobrenome_professor', '')}".strip()
-                            if nome_completo == wizard.get('professor'):
-                                # Campo correto é 'id', não 'id_professor'
-                                professor_id = prof.get('id')
-                                if not professor_id:
-                                    print(f"[WARN] Professor encontrado mas sem ID: {nome_completo}")
-                                    break
+                    # Usa a lista de professores já carregada para o formulário
+                    prof = professores_por_nome.get(wizard.get('professor'))
+                    if prof:
+                        nome_completo = prof['nome_completo']
+                        # Campo correto é 'id', não 'id_professor'
+                        professor_id = prof.get('id')
+                        if not professor_id:
+                            print(f"[WARN] Professor encontrado mas sem ID: {nome_completo}")
+                        else:
+                            # Buscar disciplinas atuais do professor (se retornadas pela API)
+                            try:
+                                disciplinas_atual = list(prof.get('disciplina_nomes') or [])
                                 
-                                # Buscar disciplinas atuais do professor (se retornadas pela API)
-                                try:
-                                    disciplinas_atual = prof.get('disciplina_nomes', [])
-                                    
-                                    # Se a disciplina não está na lista, adiciona
-                                    nome_disciplina = wizard.get('nome', '')
-                                    if nome_disciplina and nome_disciplina not in disciplinas_atual:
-                                        disciplinas_atual.append(nome_disciplina)
-                                    
-                                    # Atualizar professor com disciplinas (a API atualiza as relações)
-                                    update_response = requests.put(
-                                        f"{API_BASE_URL}/professores/update/{professor_id}",
-                                        json={'disciplina_nomes': disciplinas_atual},
-                                        headers=headers,
-                                        timeout=10
-                                    )
-                                    if update_response.status_code == 200:
-                                        print(f"[DEBUG] Professor {nome_completo} atualizado com disciplina {nome_disciplina}")
-                                    else:
-                                        error_text = update_response.text
-                                        try:
-                                            error_detail = update_response.json().get('detail', error_text)
-                                        except:
-                                            error_detail = error_text
-                                        print(f"[WARN] Erro ao atualizar professor: {error_detail}")
-                                except Exception as e:
-                                    print(f"[WARN] Erro ao atualizar professor: {e}")
-                                    import traceback
-                                    traceback.print_exc()
-                                break
+                                # Se a disciplina não está na lista, adiciona
+                                nome_disciplina = wizard.get('nome', '')
+                                if nome_disciplina and nome_disciplina not in disciplinas_atual:
+                                    disciplinas_atual.append(nome_disciplina)
+                                
+                                # Atualizar professor com disciplinas (a API atualiza as relações)
+                                # Pelo API_SESSION, para o hook invalidar o cache de /professores
+                                update_response = API_SESSION.put(
+                                    f"{API_BASE_URL}/professores/update/{professor_id}",
+                                    json={'disciplina_nomes': disciplinas_atual},
+                                    headers=headers,
+                                    timeout=10
+                                )
+                                if update_response.status_code == 200:
+                                    print(f"[DEBUG] Professor {nome_completo} atualizado com disciplina {nome_disciplina}")
+                                else:
+                                    error_text = update_response.text
+                                    try:
+                                        error_detail = update_response.json().get('detail', error_text)
+                                    except:
+                                        error_detail = error_text
+                                    print(f"[WARN] Erro ao atualizar professor: {error_detail}")
+                            except Exception as e:
+                                print(f"[WARN] Erro ao atualizar professor: {e}")
+                                import traceback
+                                traceback.print_exc()
                 
                 # 3. Buscar cronograma existente e atualizar ou criar
                 try:
@@ -3424,7 +3721,7 @@ def calendario_edit(materia_id):
                                 }
                                 
                                 print(f"[DEBUG] Atualizando cronograma {cronograma_id}: {cronograma_update}")
-                                update_response = requests.put(
+                                update_response = API_SESSION.put(
                                     f"{API_BASE_URL}/cronograma/updade/{cronograma_id}",
                                     json=cronograma_update,
                                     headers=headers,
@@ -3449,7 +3746,7 @@ def calendario_edit(materia_id):
                                 }
                                 
                                 print(f"[DEBUG] Criando novo cronograma: {cronograma_data}")
-                                create_response = requests.post(
+                                create_response = API_SESSION.post(
                                     f"{API_BASE_URL}/cronograma/",
                                     json=cronograma_data,
                                     headers=headers,
@@ -3477,18 +3774,9 @@ def calendario_edit(materia_id):
                         # Buscar ID do aplicador pelo nome
                         id_aplicador = None
                         if dados_prova.get('aplicador'):
-                            professores_response = requests.get(
-                                f"{API_BASE_URL}/professores/lista_professores/",
-                                headers=headers,
-                                timeout=10
-                            )
-                            if professores_response.status_code == 200:
-                                professores_list = professores_response.json()
-                                for prof in professores_list:
-                                    nome_completo = f"{prof.get('nome_professor', '')} {prof.get('sobrenome_professor', '')}".strip()
-                                    if nome_completo == dados_prova.get('aplicador'):
-                                        id_aplicador = prof.get('id')  # Campo correto é 'id', não 'id_professor'
-                                        break
+                            aplicador = professores_por_nome.get(dados_prova.get('aplicador'))
+                            if aplicador:
+                                id_aplicador = aplicador.get('id')  # Campo correto é 'id', não 'id_professor'
                         
                         avaliacao_update = {
                             'data_prova': dados_prova.get('data', '') if dados_prova.get('data') else None,
@@ -3505,7 +3793,7 @@ def calendario_edit(materia_id):
                         if dados_prova.get('data'):
                             # Atualizar avaliação existente ou criar nova
                             print(f"[DEBUG] Atualizando avaliação {tipo_prova}: {avaliacao_update}")
-                            update_response = requests.put(
+                            update_response = API_SESSION.put(
                                 f"{API_BASE_URL}/avaliacao/disciplina/{materia_id}/tipo/{tipo_prova}",
                                 json=avaliacao_update,
                                 headers=headers,
@@ -3519,7 +3807,7 @@ def calendario_edit(materia_id):
                                 avaliacao_create['id_disciplina'] = str(materia_id)
                                 
                                 print(f"[DEBUG] Criando nova avaliação {tipo_prova}: {avaliacao_create}")
-                                create_response = requests.post(
+                                create_response = API_SESSION.post(
                                     f"{API_BASE_URL}/avaliacao/",
                                     json=avaliacao_create,
                                     headers=headers,
@@ -3566,7 +3854,7 @@ def calendario_edit(materia_id):
                 # Mantém o wizard para o usuário poder tentar novamente
                 return redirect(url_for('calendario_edit', materia_id=materia_id, step=4))
 
-    return render_template('calendario/edit.html', step=step, wizard=wizard, materia_id=materia_id, user=session.get('user', {}), professores=professores)
+    return render_template('calendario/edit.html', step=step, wizard=wizard, materia_id=materia_id, professores=professores)
 
 @app.route('/calendario/delete/<materia_id>', methods=['POST'])
 @login_required
@@ -3575,7 +3863,7 @@ def calendario_delete(materia_id):
     # Remove disciplina da API
     try:
         headers = get_auth_headers()
-        response = requests.delete(
+        response = API_SESSION.delete(
             f"{API_BASE_URL}/disciplinas/delete/{materia_id}",
             headers=headers,
             timeout=10
@@ -3667,14 +3955,13 @@ def infos_curso_list():
         
         return render_template(
             'infos_curso/list.html',
-            user=session.get('user', {}),
             trabalhos_por_tipo=trabalhos_por_tipo
         )
     except Exception as e:
         print(f"[ERROR] Erro ao carregar informações do curso: {e}")
         import traceback
         traceback.print_exc()
-        return render_template('infos_curso/list.html', user=session.get('user', {}), trabalhos_por_tipo={})
+        return render_template('infos_curso/list.html', trabalhos_por_tipo={})
 
 @app.route('/infos-curso/add', methods=['GET', 'POST'])
 @login_required
@@ -3698,7 +3985,7 @@ def infos_curso_add():
             session['add_info_type'] = 'Horas Complementares'
             return redirect(url_for('infos_curso_add_horas'))
 
-    return render_template('infos_curso/add_select.html', user=session.get('user', {}))
+    return render_template('infos_curso/add_select.html')
 
 @app.route('/infos-curso/add/aps', methods=['GET', 'POST'])
 @login_required
@@ -3730,7 +4017,6 @@ def infos_curso_add_aps():
                 return redirect(url_for('infos_curso_add_aps'))
             
             # Formatar semestre (ano.semestre)
-            from datetime import datetime
             ano_atual = datetime.now().year
             semestre_formatado = f"{ano_atual}.{semestre_num}"
             
@@ -3792,7 +4078,7 @@ def infos_curso_add_aps():
             flash(f'Erro ao processar formulário: {str(e)}', 'error')
             return redirect(url_for('infos_curso_add_aps'))
 
-    return render_template('infos_curso/add_aps.html', user=session.get('user', {}))
+    return render_template('infos_curso/add_aps.html')
 
 @app.route('/infos-curso/add/tcc', methods=['GET', 'POST'])
 @login_required
@@ -3855,7 +4141,6 @@ def infos_curso_add_tcc():
                     return None
                 
                 # Formatar semestre (ano.semestre)
-                from datetime import datetime
                 ano_atual = datetime.now().year
                 semestre_atual = 1 if datetime.now().month <= 6 else 2
                 semestre_formatado = f"{ano_atual}.{semestre_atual}"
@@ -3962,7 +4247,7 @@ def infos_curso_add_tcc():
 
         return redirect(url_for('infos_curso_add_tcc'))
 
-    return render_template('infos_curso/add_tcc.html', step=session.get('tcc_step', 1), user=session.get('user', {}))
+    return render_template('infos_curso/add_tcc.html', step=session.get('tcc_step', 1))
 
 @app.route('/infos-curso/add/estagio', methods=['GET', 'POST'])
 @login_required
@@ -4031,7 +4316,6 @@ def infos_curso_add_estagio():
                         print(f"[WARN] Erro ao buscar orientador: {e}")
                 
                 # Formatar semestre
-                from datetime import datetime
                 ano_atual = datetime.now().year
                 semestre_atual = 1 if datetime.now().month <= 6 else 2
                 semestre_formatado = f"{ano_atual}.{semestre_atual}"
@@ -4111,7 +4395,7 @@ def infos_curso_add_estagio():
 
         return redirect(url_for('infos_curso_add_estagio'))
 
-    return render_template('infos_curso/add_estagio.html', step=session.get('estagio_step', 1), user=session.get('user', {}))
+    return render_template('infos_curso/add_estagio.html', step=session.get('estagio_step', 1))
 
 @app.route('/infos-curso/add/horas', methods=['GET', 'POST'])
 @login_required
@@ -4148,7 +4432,6 @@ def infos_curso_add_horas():
             data_limite = request.form.get('data_limite', '').strip()
             
             # Formatar semestre
-            from datetime import datetime
             ano_atual = datetime.now().year
             semestre_atual = 1 if datetime.now().month <= 6 else 2
             semestre_formatado = f"{ano_atual}.{semestre_atual}"
@@ -4227,7 +4510,7 @@ def infos_curso_add_horas():
             flash(f'Erro ao processar formulário: {str(e)}', 'error')
             return redirect(url_for('infos_curso_add_horas'))
 
-    return render_template('infos_curso/add_horas.html', user=session.get('user', {}))
+    return render_template('infos_curso/add_horas.html')
 
 # ===== ROTAS DE ALUNOS =====
 @app.route('/alunos')
@@ -4235,20 +4518,16 @@ def infos_curso_add_horas():
 def alunos_list():
     # Lista alunos - busca da API
     try:
-        print(f"[DEBUG] Buscando alunos em: {API_BASE_URL}/alunos/get_list_alunos/")
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/alunos/get_list_alunos/", headers=headers, timeout=10)
+        alunos, status_code = api_get_cached("/alunos/get_list_alunos/")
         
-        if response.status_code == 200:
-            alunos = response.json()
-            print(f"[DEBUG] {len(alunos)} alunos encontrados")
+        if status_code == 200:
             return jsonify(alunos), 200
         else:
-            flash(f"Erro ao carregar alunos (Status {response.status_code})", "error")
-            return jsonify([]), response.status_code
+            flash(f"Erro ao carregar alunos (Status {status_code})", "error")
+            return jsonify([]), status_code
             
     except requests.exceptions.RequestException as e:
-        print(f"[DEBUG] Erro ao buscar alunos: {e}")
+        app.logger.warning("Erro ao buscar alunos: %s", e)
         flash("Erro ao carregar alunos.", "error")
         return jsonify([]), 500
 
@@ -4257,10 +4536,10 @@ def alunos_list():
 def alunos_get_by_email(email):
     # Busca aluno por email
     try:
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/alunos/get_email/{email}", headers=headers, timeout=10)
+        headers = g.auth_headers
+        response = API_SESSION.get(f"{API_BASE_URL}/alunos/get_email/{email}", headers=headers, timeout=10)
         if response.status_code == 200:
-            return jsonify(response.json()), 200
+            return passthrough(response)
         return jsonify({"error": "Aluno não encontrado"}), response.status_code
     except requests.exceptions.RequestException as e:
         return jsonify({"error": str(e)}), 500
@@ -4271,19 +4550,15 @@ def alunos_get_by_email(email):
 def disciplinas_list():
     # Lista disciplinas - busca da API
     try:
-        print(f"[DEBUG] Buscando disciplinas em: {API_BASE_URL}/disciplinas/lista_disciplina/")
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/disciplinas/lista_disciplina/", headers=headers, timeout=10)
+        disciplinas, status_code = api_get_cached(DISCIPLINAS_PATH, ttl=DISCIPLINAS_CACHE_TTL)
         
-        if response.status_code == 200:
-            disciplinas = response.json()
-            print(f"[DEBUG] {len(disciplinas)} disciplinas encontradas")
+        if status_code == 200:
             return jsonify(disciplinas), 200
         else:
-            return jsonify([]), response.status_code
+            return jsonify([]), status_code
             
     except requests.exceptions.RequestException as e:
-        print(f"[DEBUG] Erro ao buscar disciplinas: {e}")
+        app.logger.warning("Erro ao buscar disciplinas: %s", e)
         return jsonify([]), 500
 
 @app.route('/disciplinas/get/<disciplina_id>')
@@ -4291,10 +4566,10 @@ def disciplinas_list():
 def disciplinas_get(disciplina_id):
     # Busca disciplina por ID
     try:
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/disciplinas/get_diciplina_id/{disciplina_id}", headers=headers, timeout=10)
+        headers = g.auth_headers
+        response = API_SESSION.get(f"{API_BASE_URL}/disciplinas/get_diciplina_id/{disciplina_id}", headers=headers, timeout=10)
         if response.status_code == 200:
-            return jsonify(response.json()), 200
+            return passthrough(response)
         return jsonify({"error": "Disciplina não encontrada"}), response.status_code
     except requests.exceptions.RequestException as e:
         return jsonify({"error": str(e)}), 500
@@ -4305,17 +4580,16 @@ def disciplinas_get(disciplina_id):
 def cursos_list():
     # Lista cursos - busca da API
     try:
-        headers = get_auth_headers()
         # Nota: API pode não ter endpoint de lista, verificar
-        response = requests.get(f"{API_BASE_URL}/curso/get_curso/", headers=headers, timeout=10)
+        cursos, status_code = api_get_cached("/curso/get_curso/")
         
-        if response.status_code == 200:
-            cursos = response.json() if isinstance(response.json(), list) else [response.json()]
+        if status_code == 200:
+            cursos = cursos if isinstance(cursos, list) else [cursos]
             return jsonify(cursos), 200
-        return jsonify([]), response.status_code
+        return jsonify([]), status_code
             
     except requests.exceptions.RequestException as e:
-        print(f"[DEBUG] Erro ao buscar cursos: {e}")
+        app.logger.warning("Erro ao buscar cursos: %s", e)
         return jsonify([]), 500
 
 @app.route('/cursos/get/<curso_id>')
@@ -4323,10 +4597,10 @@ def cursos_list():
 def cursos_get(curso_id):
     # Busca curso por ID
     try:
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/curso/get_curso/{curso_id}", headers=headers, timeout=10)
+        headers = g.auth_headers
+        response = API_SESSION.get(f"{API_BASE_URL}/curso/get_curso/{curso_id}", headers=headers, timeout=10)
         if response.status_code == 200:
-            return jsonify(response.json()), 200
+            return passthrough(response)
         return jsonify({"error": "Curso não encontrado"}), response.status_code
     except requests.exceptions.RequestException as e:
         return jsonify({"error": str(e)}), 500
@@ -4337,17 +4611,16 @@ def cursos_get(curso_id):
 def cronograma_list():
     # Lista cronogramas - busca da API
     try:
-        headers = get_auth_headers()
         # Nota: API pode precisar de disciplina_id, verificar
-        response = requests.get(f"{API_BASE_URL}/cronograma/", headers=headers, timeout=10)
+        cronogramas, status_code = api_get_cached("/cronograma/")
         
-        if response.status_code == 200:
-            cronogramas = response.json() if isinstance(response.json(), list) else [response.json()]
+        if status_code == 200:
+            cronogramas = cronogramas if isinstance(cronogramas, list) else [cronogramas]
             return jsonify(cronogramas), 200
-        return jsonify([]), response.status_code
+        return jsonify([]), status_code
             
     except requests.exceptions.RequestException as e:
-        print(f"[DEBUG] Erro ao buscar cronograma: {e}")
+        app.logger.warning("Erro ao buscar cronograma: %s", e)
         return jsonify([]), 500
 
 @app.route('/cronograma/disciplina/<disciplina_id>')
@@ -4355,10 +4628,10 @@ def cronograma_list():
 def cronograma_by_disciplina(disciplina_id):
     # Busca cronograma por disciplina
     try:
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/cronograma/disciplina/{disciplina_id}", headers=headers, timeout=10)
+        headers = g.auth_headers
+        response = API_SESSION.get(f"{API_BASE_URL}/cronograma/disciplina/{disciplina_id}", headers=headers, timeout=10)
         if response.status_code == 200:
-            return jsonify(response.json()), 200
+            return passthrough(response)
         return jsonify({"error": "Cronograma não encontrado"}), response.status_code
     except requests.exceptions.RequestException as e:
         return jsonify({"error": str(e)}), 500
@@ -4369,19 +4642,15 @@ def cronograma_by_disciplina(disciplina_id):
 def coordenadores_list():
     # Lista coordenadores - busca da API
     try:
-        print(f"[DEBUG] Buscando coordenadores em: {API_BASE_URL}/coordenador/get_list_coordenador/")
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/coordenador/get_list_coordenador/", headers=headers, timeout=10)
+        coordenadores, status_code = api_get_cached("/coordenador/get_list_coordenador/")
         
-        if response.status_code == 200:
-            coordenadores = response.json()
-            print(f"[DEBUG] {len(coordenadores)} coordenadores encontrados")
+        if status_code == 200:
             return jsonify(coordenadores), 200
         else:
-            return jsonify([]), response.status_code
+            return jsonify([]), status_code
             
     except requests.exceptions.RequestException as e:
-        print(f"[DEBUG] Erro ao buscar coordenadores: {e}")
+        app.logger.warning("Erro ao buscar coordenadores: %s", e)
         return jsonify([]), 500
 
 # ===== ROTAS DE AVALIAÇÃO =====
@@ -4390,10 +4659,10 @@ def coordenadores_list():
 def avaliacoes_by_disciplina(disciplina_id):
     # Busca avaliações por disciplina
     try:
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/avaliacao/disciplina/{disciplina_id}", headers=headers, timeout=10)
+        headers = g.auth_headers
+        response = API_SESSION.get(f"{API_BASE_URL}/avaliacao/disciplina/{disciplina_id}", headers=headers, timeout=10)
         if response.status_code == 200:
-            return jsonify(response.json()), 200
+            return passthrough(response)
         return jsonify({"error": "Avaliações não encontradas"}), response.status_code
     except requests.exceptions.RequestException as e:
         return jsonify({"error": str(e)}), 500
@@ -4405,20 +4674,20 @@ def trabalho_academico_list_create():
     # Lista trabalhos acadêmicos ou cria novo
     if request.method == 'GET':
         try:
-            headers = get_auth_headers()
+            headers = g.auth_headers
             # Nota: API não tem endpoint de listagem geral, retorna vazio
             return jsonify([]), 200
         except requests.exceptions.RequestException as e:
-            print(f"[DEBUG] Erro ao buscar trabalhos acadêmicos: {e}")
+            app.logger.warning("Erro ao buscar trabalhos acadêmicos: %s", e)
             return jsonify([]), 500
     elif request.method == 'POST':
         try:
-            headers = get_auth_headers()
+            headers = g.auth_headers
             data = request.get_json() if request.is_json else request.form.to_dict()
-            response = requests.post(f"{API_BASE_URL}/trabalho_academico/", json=data, headers=headers, timeout=10)
+            response = API_SESSION.post(f"{API_BASE_URL}/trabalho_academico/", json=data, headers=headers, timeout=10)
             if response.status_code == 201:
-                return jsonify(response.json()), 201
-            return jsonify({"error": response.json().get("detail", "Erro ao criar trabalho acadêmico")}), response.status_code
+                return passthrough(response)
+            return jsonify({"error": oparse(response).get("detail", "Erro ao criar trabalho acadêmico")}), response.status_code
         except requests.exceptions.RequestException as e:
             return jsonify({"error": str(e)}), 500
 
@@ -4427,10 +4696,10 @@ def trabalho_academico_list_create():
 def trabalho_academico_get(trabalho_id):
     # Busca trabalho acadêmico por ID
     try:
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/trabalho_academico/{trabalho_id}", headers=headers, timeout=10)
+        headers = g.auth_headers
+        response = API_SESSION.get(f"{API_BASE_URL}/trabalho_academico/{trabalho_id}", headers=headers, timeout=10)
         if response.status_code == 200:
-            return jsonify(response.json()), 200
+            return passthrough(response)
         return jsonify({"error": "Trabalho acadêmico não encontrado"}), response.status_code
     except requests.exceptions.RequestException as e:
         return jsonify({"error": str(e)}), 500
@@ -4440,10 +4709,10 @@ def trabalho_academico_get(trabalho_id):
 def trabalho_academico_by_curso(curso_id):
     # Lista trabalhos acadêmicos por curso
     try:
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/trabalho_academico/curso/{curso_id}", headers=headers, timeout=10)
+        headers = g.auth_headers
+        response = API_SESSION.get(f"{API_BASE_URL}/trabalho_academico/curso/{curso_id}", headers=headers, timeout=10)
         if response.status_code == 200:
-            return jsonify(response.json()), 200
+            return passthrough(response)
         return jsonify([]), response.status_code
     except requests.exceptions.RequestException as e:
         return jsonify({"error": str(e)}), 500
@@ -4453,10 +4722,10 @@ def trabalho_academico_by_curso(curso_id):
 def trabalho_academico_by_disciplina(disciplina_id):
     # Lista trabalhos acadêmicos por disciplina
     try:
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/trabalho_academico/disciplina/{disciplina_id}", headers=headers, timeout=10)
+        headers = g.auth_headers
+        response = API_SESSION.get(f"{API_BASE_URL}/trabalho_academico/disciplina/{disciplina_id}", headers=headers, timeout=10)
         if response.status_code == 200:
-            return jsonify(response.json()), 200
+            return passthrough(response)
         return jsonify([]), response.status_code
     except requests.exceptions.RequestException as e:
         return jsonify({"error": str(e)}), 500
@@ -4466,12 +4735,12 @@ def trabalho_academico_by_disciplina(disciplina_id):
 def trabalho_academico_update(trabalho_id):
     # Atualiza trabalho acadêmico
     try:
-        headers = get_auth_headers()
+        headers = g.auth_headers
         data = request.get_json() if request.is_json else request.form.to_dict()
-        response = requests.put(f"{API_BASE_URL}/trabalho_academico/update/{trabalho_id}", json=data, headers=headers, timeout=10)
+        response = API_SESSION.put(f"{API_BASE_URL}/trabalho_academico/update/{trabalho_id}", json=data, headers=headers, timeout=10)
         if response.status_code == 200:
-            return jsonify(response.json()), 200
-        return jsonify({"error": response.json().get("detail", "Erro ao atualizar trabalho acadêmico")}), response.status_code
+            return passthrough(response)
+        return jsonify({"error": oparse(response).get("detail", "Erro ao atualizar trabalho acadêmico")}), response.status_code
     except requests.exceptions.RequestException as e:
         return jsonify({"error": str(e)}), 500
 
@@ -4480,43 +4749,74 @@ def trabalho_academico_update(trabalho_id):
 def trabalho_academico_delete(trabalho_id):
     # Deleta trabalho acadêmico
     try:
-        headers = get_auth_headers()
-        response = requests.delete(f"{API_BASE_URL}/trabalho_academico/delete/{trabalho_id}", headers=headers, timeout=10)
+        headers = g.auth_headers
+        response = API_SESSION.delete(f"{API_BASE_URL}/trabalho_academico/delete/{trabalho_id}", headers=headers, timeout=10)
         if response.status_code == 204:
             return jsonify({"message": "Trabalho acadêmico deletado com sucesso"}), 200
-        return jsonify({"error": response.json().get("detail", "Erro ao deletar trabalho acadêmico")}), response.status_code
+        return jsonify({"error": oparse(response).get("detail", "Erro ao deletar trabalho acadêmico")}), response.status_code
     except requests.exceptions.RequestException as e:
         return jsonify({"error": str(e)}), 500
 
+# ===== ROTAS DE PROXY (UPDATE/DELETE) =====
+# Rotas que apenas repassam PUT/DELETE de um item à API, no mesmo caminho.
+# A URL base é montada uma única vez, no registro da rota.
+def register_proxy_update(rule, endpoint, erro):
+    base_url = API_BASE_URL + rule.split('<', 1)[0]
+
+    @login_required
+    def proxy_update(item_id):
+        try:
+            data = request.get_json() if request.is_json else request.form.to_dict()
+            response = API_SESSION.put(base_url + item_id, json=data, headers=g.auth_headers, timeout=10)
+            if response.status_code == 200:
+                return passthrough(response)
+            return jsonify({"error": oparse(response).get("detail", erro)}), response.status_code
+        except requests.exceptions.RequestException as e:
+            return jsonify({"error": str(e)}), 500
+
+    app.add_url_rule(rule, endpoint, proxy_update, methods=['PUT'])
+
+def register_proxy_delete(rule, endpoint, mensagem, erro):
+    base_url = API_BASE_URL + rule.split('<', 1)[0]
+
+    @login_required
+    def proxy_delete(item_id):
+        try:
+            response = API_SESSION.delete(base_url + item_id, headers=g.auth_headers, timeout=10)
+            if response.status_code == 204:
+                return jsonify({"message": mensagem}), 200
+            return jsonify({"error": oparse(response).get("detail", erro)}), response.status_code
+        except requests.exceptions.RequestException as e:
+            return jsonify({"error": str(e)}), 500
+
+    app.add_url_rule(rule, endpoint, proxy_delete, methods=['DELETE'])
+
 # ===== ROTAS DE BASE DE CONHECIMENTO =====
 @app.route('/baseconhecimento', methods=['GET', 'POST'])
 @login_required
 def base_conhecimento_list_create():
     # Lista base de conhecimento ou cria novo
     if request.method == 'GET':
+        query = request.args.get('q', '')
+        if not query:
+            # Se não houver query, retorna lista vazia (sem montar headers nem chamar a API)
+            return jsonify([]), 200
         try:
-            headers = get_auth_headers()
-            query = request.args.get('q', '')
-            if query:
-                response = requests.get(f"{API_BASE_URL}/baseconhecimento/get_buscar?q={query}", headers=headers, timeout=10)
-            else:
-                # Se não houver query, retorna lista vazia
-                return jsonify([]), 200
-            if response.status_code == 200:
-                resultados = response.json()
-                return jsonify(resultados), 200
-            return jsonify([]), response.status_code
+            corpo, status_code = api_get_cached_body("/baseconhecimento/get_buscar", ttl=15, params={"q": query})
+            if status_code == 200:
+                return json_bytes_response(corpo)
+            return jsonify([]), status_code
         except requests.exceptions.RequestException as e:
-            print(f"[DEBUG] Erro ao buscar base de conhecimento: {e}")
+            app.logger.warning("Erro ao buscar base de conhecimento: %s", e)
             return jsonify([]), 500
     elif request.method == 'POST':
         try:
-            headers = get_auth_headers()
+            headers = g.auth_headers
             data = request.get_json() if request.is_json else request.form.to_dict()
-            response = requests.post(f"{API_BASE_URL}/baseconhecimento/", json=data, headers=headers, timeout=10)
+            response = API_SESSION.post(f"{API_BASE_URL}/baseconhecimento/", json=data, headers=headers, timeout=10)
             if response.status_code == 201:
-                return jsonify(response.json()), 201
-            return jsonify({"error": response.json().get("detail", "Erro ao criar base de conhecimento")}), response.status_code
+                return passthrough(response)
+            return jsonify({"error": oparse(response).get("detail", "Erro ao criar base de conhecimento")}), response.status_code
         except requests.exceptions.RequestException as e:
             return jsonify({"error": str(e)}), 500
 
@@ -4524,57 +4824,37 @@ def base_conhecimento_list_create():
 @login_required
 def base_conhecimento_buscar():
     # Busca na base de conhecimento
+    # Valida antes de qualquer outra coisa: buscas de autocomplete chegam a cada tecla
+    query = request.args.get('q', '')
+    if not query or len(query) < 3:
+        return jsonify({"error": "Query deve ter pelo menos 3 caracteres"}), 400
     try:
-        headers = get_auth_headers()
-        query = request.args.get('q', '')
-        if not query or len(query) < 3:
-            return jsonify({"error": "Query deve ter pelo menos 3 caracteres"}), 400
-        response = requests.get(f"{API_BASE_URL}/baseconhecimento/get_buscar?q={query}", headers=headers, timeout=10)
+        headers = g.auth_headers
+        response = API_SESSION.get(f"{API_BASE_URL}/baseconhecimento/get_buscar", params={"q": query}, headers=headers, timeout=10)
         if response.status_code == 200:
-            return jsonify(response.json()), 200
+            return passthrough(response)
         return jsonify([]), response.status_code
     except requests.exceptions.RequestException as e:
         return jsonify({"error": str(e)}), 500
 
-@app.route('/baseconhecimento/<item_id>')
+@app.route('/baseconhecimento/<api_id:item_id>')
 @login_required
 def base_conhecimento_get(item_id):
     # Busca base de conhecimento por ID
     try:
-        headers = get_auth_headers()
-        response = requests.get(f"{API_BASE_URL}/baseconhecimento/get_baseconhecimento_id/{item_id}", headers=headers, timeout=10)
+        headers = g.auth_headers
+        response = API_SESSION.get(f"{API_BASE_URL}/baseconhecimento/get_baseconhecimento_id/{item_id}", headers=headers, timeout=10)
         if response.status_code == 200:
-            return jsonify(response.json()), 200
+            return passthrough(response)
         return jsonify({"error": "Item não encontrado"}), response.status_code
     except requests.exceptions.RequestException as e:
         return jsonify({"error": str(e)}), 500
 
-@app.route('/baseconhecimento/update/<item_id>', methods=['PUT'])
-@login_required
-def base_conhecimento_update(item_id):
-    # Atualiza base de conhecimento
-    try:
-        headers = get_auth_headers()
-        data = request.get_json() if request.is_json else request.form.to_dict()
-        response = requests.put(f"{API_BASE_URL}/baseconhecimento/update/{item_id}", json=data, headers=headers, timeout=10)
-        if response.status_code == 200:
-            return jsonify(response.json()), 200
-        return jsonify({"error": response.json().get("detail", "Erro ao atualizar base de conhecimento")}), response.status_code
-    except requests.exceptions.RequestException as e:
-        return jsonify({"error": str(e)}), 500
-
-@app.route('/baseconhecimento/delete/<item_id>', methods=['DELETE'])
-@login_required
-def base_conhecimento_delete(item_id):
-    # Deleta base de conhecimento
-    try:
-        headers = get_auth_headers()
-        response = requests.delete(f"{API_BASE_URL}/baseconhecimento/delete/{item_id}", headers=headers, timeout=10)
-        if response.status_code == 204:
-            return jsonify({"message": "Item deletado com sucesso"}), 200
-        return jsonify({"error": response.json().get("detail", "Erro ao deletar item")}), response.status_code
-    except requests.exceptions.RequestException as e:
-        return jsonify({"error": str(e)}), 500
+# Atualiza / deleta item da base de conhecimento
+register_proxy_update('/baseconhecimento/update/<api_id:item_id>', 'base_conhecimento_update',
+                      "Erro ao atualizar base de conhecimento")
+register_proxy_delete('/baseconhecimento/delete/<api_id:item_id>', 'base_conhecimento_delete',
+                      "Item deletado com sucesso", "Erro ao deletar item")
 
 # ===== ROTAS DE DÚVIDAS FREQUENTES =====
 @app.route('/duvidas-frequentes')
@@ -4586,14 +4866,14 @@ def duvidas_frequentes_list():
         user = session.get('user', {})
         
         # Buscar dados do dashboard da API
-        response = requests.get(
-            f"{API_BASE_URL}/mensagens_aluno/dashboard/",
+        response = API_SESSION.get(
+            MENSAGENS_DASHBOARD_URL,
             headers=headers,
             timeout=15
         )
         
         if response.status_code == 200:
-            dashboard_data = response.json()
+            dashboard_data = oparse(response)
         elif response.status_code == 404:
             dashboard_data = {
                 "total_geral": 0,
@@ -4616,7 +4896,6 @@ def duvidas_frequentes_list():
         
         return render_template(
             'duvidas_frequentes/list.html',
-            user=user,
             curso_codigo=curso_codigo,
             curso_nome=curso_nome,
             dashboard_data=dashboard_data
@@ -4625,7 +4904,6 @@ def duvidas_frequentes_list():
         flash(f"Erro ao carregar dashboard: {str(e)}", "error")
         return render_template(
             'duvidas_frequentes/list.html',
-            user=session.get('user', {}),
             curso_codigo=session.get('user', {}).get('curso_codigo', '') if session.get('user') else '',
             curso_nome=session.get('user', {}).get('curso_nome', '') if session.get('user') else '',
             dashboard_data={
@@ -4636,21 +4914,21 @@ def duvidas_frequentes_list():
             }
         )
 
-@app.route('/duvidas-frequentes/delete/<item_id>', methods=['POST'])
+@app.route('/duvidas-frequentes/delete/<api_id:item_id>', methods=['POST'])
 @login_required
 def duvidas_frequentes_delete(item_id):
     # Remove mensagem de aluno (dúvida frequente) via API
     try:
-        print(f"[DEBUG] Removendo mensagem de aluno {item_id}")
+        app.logger.debug("Removendo mensagem de aluno %s", item_id)
         headers = get_auth_headers()
         
-        response = requests.delete(
+        response = API_SESSION.delete(
             f"{API_BASE_URL}/mensagens_aluno/delete/{item_id}",
             headers=headers,
             timeout=10
         )
         
-        print(f"[DEBUG] Status Code: {response.status_code}")
+        app.logger.debug("Status Code: %s", response.status_code)
         
         if response.status_code in (200, 204):
             flash('Dúvida frequente removida com sucesso!', 'success')
@@ -4660,15 +4938,15 @@ def duvidas_frequentes_delete(item_id):
             response.raise_for_status()
             
     except requests.exceptions.HTTPError as e:
-        print(f"[DEBUG] HTTPError: {e}")
+        app.logger.warning("HTTPError ao remover dúvida frequente: %s", e)
         if e.response and e.response.status_code == 401:
             return handle_token_expiration()
         flash(f'Erro ao remover dúvida frequente (HTTP {e.response.status_code if e.response else "N/A"}).', 'error')
     except requests.exceptions.RequestException as e:
-        print(f"[DEBUG] RequestException: {e}")
+        app.logger.warning("RequestException ao remover dúvida frequente: %s", e)
         flash('Erro de comunicação com o servidor.', 'error')
     except Exception as e:
-        print(f"[DEBUG] Exception: {e}")
+        app.logger.error("Erro inesperado ao remover dúvida frequente: %s", e)
         flash('Erro inesperado ao remover dúvida frequente.', 'error')
     
     return redirect(url_for('duvidas_frequentes_list'))
@@ -4680,69 +4958,96 @@ def mensagens_aluno_list_create():
     # Lista mensagens de aluno ou cria nova
     if request.method == 'GET':
         try:
-            headers = get_auth_headers()
-            response = requests.get(f"{API_BASE_URL}/mensagens_aluno/get_lista_msg/", headers=headers, timeout=10)
-            if response.status_code == 200:
-                mensagens = response.json() if isinstance(response.json(), list) else [response.json()]
-                return jsonify(mensagens), 200
-            return jsonify([]), response.status_code
+            corpo, status_code = api_get_cached_body("/mensagens_aluno/get_lista_msg/", ttl=15)
+            if status_code == 200:
+                # O front sempre recebe uma lista, mesmo que a API devolva um único objeto
+                if not corpo.lstrip().startswith(b'['):
+                    corpo = b'[' + corpo + b']'
+                return json_bytes_response(corpo)
+            return jsonify([]), status_code
         except requests.exceptions.RequestException as e:
-            print(f"[DEBUG] Erro ao buscar mensagens de aluno: {e}")
+            app.logger.warning("Erro ao buscar mensagens de aluno: %s", e)
             return jsonify([]), 500
     elif request.method == 'POST':
         try:
             headers = get_auth_headers()
             data = request.get_json() if request.is_json else request.form.to_dict()
-            response = requests.post(f"{API_BASE_URL}/mensagens_aluno/", json=data, headers=headers, timeout=10)
+            response = API_SESSION.post(MENSAGENS_ALUNO_URL, json=data, headers=headers, timeout=10)
             if response.status_code == 201:
-                return jsonify(response.json()), 201
-            return jsonify({"error": response.json().get("detail", "Erro ao criar mensagem")}), response.status_code
+                return passthrough(response)
+            return jsonify({"error": oparse(response).get("detail", "Erro ao criar mensagem")}), response.status_code
         except requests.exceptions.RequestException as e:
             return jsonify({"error": str(e)}), 500
 
-@app.route('/mensagens_aluno/update/<item_id>', methods=['PUT'])
-@login_required
-def mensagens_aluno_update(item_id):
-    # Atualiza mensagem de aluno
-    try:
-        headers = get_auth_headers()
-        data = request.get_json() if request.is_json else request.form.to_dict()
-        response = requests.put(f"{API_BASE_URL}/mensagens_aluno/update/{item_id}", json=data, headers=headers, timeout=10)
-        if response.status_code == 200:
-            return jsonify(response.json()), 200
-        return jsonify({"error": response.json().get("detail", "Erro ao atualizar mensagem")}), response.status_code
-    except requests.exceptions.RequestException as e:
-        return jsonify({"error": str(e)}), 500
-
-@app.route('/mensagens_aluno/delete/<item_id>', methods=['DELETE'])
-@login_required
-def mensagens_aluno_delete(item_id):
-    # Deleta mensagem de aluno
-    try:
-        headers = get_auth_headers()
-        response = requests.delete(f"{API_BASE_URL}/mensagens_aluno/delete/{item_id}", headers=headers, timeout=10)
-        if response.status_code == 204:
-            return jsonify({"message": "Mensagem deletada com sucesso"}), 200
-        return jsonify({"error": response.json().get("detail", "Erro ao deletar mensagem")}), response.status_code
-    except requests.exceptions.RequestException as e:
-        return jsonify({"error": str(e)}), 500
+# Atualiza / deleta mensagem de aluno
+register_proxy_update('/mensagens_aluno/update/<api_id:item_id>', 'mensagens_aluno_update',
+                      "Erro ao atualizar mensagem")
+register_proxy_delete('/mensagens_aluno/delete/<api_id:item_id>', 'mensagens_aluno_delete',
+                      "Mensagem deletada com sucesso", "Erro ao deletar mensagem")
 
 # ===== FUNÇÕES AUXILIARES PARA UPLOAD DE DOCUMENTOS =====
+class MultipartFileStream:
+    # Corpo multipart/form-data lido sob demanda. Com files=, o requests faz read()
+    # do arquivo inteiro para montar o corpo em memória; aqui o arquivo enviado
+    # pelo usuário é repassado ao socket em blocos, com Content-Length conhecido.
+    def __init__(self, fields, file_field, filename, stream, mimetype):
+        boundary = uuid.uuid4().hex
+        # Nomes e filename passam pelo mesmo escape do urllib3 (", CR e LF viram
+        # %22, %0D e %0A): um filename com quebra de linha não injeta headers na parte.
+        # Campos com valor None são omitidos, como no data= do requests.
+        head = b''.join(
+            f'--{boundary}\r\nContent-Disposition: form-data; {format_multipart_header_param("name", name)}\r\n\r\n{value}\r\n'.encode()
+            for name, value in fields.items()
+            if value is not None
+        )
+        head += (
+            f'--{boundary}\r\nContent-Disposition: form-data; {format_multipart_header_param("name", file_field)}; '
+            f'{format_multipart_header_param("filename", filename or "")}\r\n'
+            f'Content-Type: {mimetype}\r\n\r\n'
+        ).encode()
+        tail = f'\r\n--{boundary}--\r\n'.encode()
+        stream.seek(0, os.SEEK_END)
+        size = stream.tell()
+        stream.seek(0)
+        self._parts = [io.BytesIO(head), stream, io.BytesIO(tail)]
+        self._length = len(head) + size + len(tail)
+        self.content_type = f'multipart/form-data; boundary={boundary}'
+
+    def __len__(self):
+        return self._length
+
+    def read(self, size=-1):
+        chunks = []
+        while self._parts and size != 0:
+            data = self._parts[0].read(size)
+            if not data:
+                self._parts.pop(0)
+                continue
+            chunks.append(data)
+            if size > 0:
+                size -= len(data)
+        return b''.join(chunks)
+
+# Timeout dos uploads: (conexão, leitura). Com o corpo em streaming a conexão fica
+# aberta durante todo o envio, então a leitura tem mais folga que nas demais chamadas
+UPLOAD_TIMEOUT = (5, 60)
+
+def post_multipart(url, file_storage, fields=None, timeout=UPLOAD_TIMEOUT):
+    # POST multipart com o arquivo em streaming (campo 'file', como esperado pela API)
+    body = MultipartFileStream(
+        fields or {}, 'file', file_storage.filename, file_storage.stream,
+        file_storage.mimetype or 'application/octet-stream'
+    )
+    return API_SESSION.post(url, data=body, headers={**get_upload_headers(), 'Content-Type': body.content_type}, timeout=timeout)
+
 def upload_documento_por_categoria(file_storage, categoria, **kwargs):
     # Faz upload de documento usando o endpoint correto baseado na categoria
     # categoria: 'disciplina', 'tcc', 'aps', 'estagio', 'hora_complementares'
     # Retorna: (success: bool, data: dict ou error: str)
     try:
-        headers = get_auth_headers()
-        upload_headers = {k: v for k, v in headers.items() if k.lower() != 'content-type'}
-        
         if not file_storage or file_storage.filename == '':
             return False, "Nenhum arquivo enviado"
         
-        # Reset stream position
-        file_storage.stream.seek(0)
-        files = {'file': (file_storage.filename, file_storage.stream, file_storage.mimetype or 'application/octet-stream')}
-        
         # Prepara dados conforme a categoria
         data = {}
         endpoint = ""
@@ -4785,28 +5090,28 @@ def upload_documento_por_categoria(file_storage, categoria, **kwargs):
             return False, f"Categoria '{categoria}' não suportada"
         
         # Faz a requisição
-        print(f"[DEBUG] Fazendo upload para: {endpoint}")
-        print(f"[DEBUG] Dados enviados: {data}")
-        print(f"[DEBUG] Arquivo: {file_storage.filename} ({file_storage.mimetype})")
-        print(f"[DEBUG] Headers: {list(upload_headers.keys())}")
+        app.logger.debug("Fazendo upload para: %s", endpoint)
+        app.logger.debug("Dados enviados: %s", data)
+        app.logger.debug("Arquivo: %s (%s)", file_storage.filename, file_storage.mimetype)
+        app.logger.debug("Headers: %s", list(get_upload_headers()))
         
-        response = requests.post(endpoint, files=files, data=data, headers=upload_headers, timeout=30)
+        response = post_multipart(endpoint, file_storage, fields=data)
         
-        print(f"[DEBUG] Status Code: {response.status_code}")
-        print(f"[DEBUG] Response Headers: {dict(response.headers)}")
+        app.logger.debug("Status Code: %s", response.status_code)
+        app.logger.debug("Response Headers: %s", response.headers)
         
         if response.status_code == 201:
-            result = response.json()
-            print(f"[DEBUG] Upload bem-sucedido: {result}")
+            result = oparse(response)
+            app.logger.debug("Upload bem-sucedido: %s", result)
             return True, result
         else:
             try:
-                error_json = response.json()
+                error_json = oparse(response)
                 error_detail = error_json.get("detail", f"Erro {response.status_code}")
-                print(f"[ERROR] Erro no upload: {error_detail}")
+                app.logger.error("Erro no upload: %s", error_detail)
             except:
                 error_detail = response.text[:500] if response.text else f"Erro {response.status_code}"
-                print(f"[ERROR] Erro no upload (não JSON): {error_detail}")
+                app.logger.error("Erro no upload (não JSON): %s", error_detail)
             return False, error_detail
             
     except requests.exceptions.RequestException as e:
@@ -4820,9 +5125,6 @@ def upload_documento_por_categoria(file_storage, categoria, **kwargs):
 def documentos_upload():
     # Upload de documento genérico (mantido para compatibilidade)
     try:
-        headers = get_auth_headers()
-        upload_headers = {k: v for k, v in headers.items() if k.lower() != 'content-type'}
-        
         if 'file' not in request.files:
             return jsonify({"error": "Nenhum arquivo enviado"}), 400
         
@@ -4839,53 +5141,138 @@ def documentos_upload():
             return jsonify({"error": result}), 400
         
         # Fallback para endpoint antigo (se ainda existir)
-        files = {'file': (file.filename, file.stream, file.content_type)}
-        response = requests.post(f"{API_BASE_URL}/documentos/upload", files=files, headers=upload_headers, timeout=30)
+        response = post_multipart(f"{API_BASE_URL}/documentos/upload", file)
         
         if response.status_code == 201:
-            return jsonify(response.json()), 201
-        return jsonify({"error": response.json().get("detail", "Erro ao fazer upload do documento")}), response.status_code
+            return passthrough(response)
+        return jsonify({"error": oparse(response).get("detail", "Erro ao fazer upload do documento")}), response.status_code
     except requests.exceptions.RequestException as e:
         return jsonify({"error": str(e)}), 500
 
 # ===== ROTAS DE IA SERVICES =====
+# Respostas da IA são caras (até 60 s); perguntas repetidas (mesmo texto, ignorando
+# maiúsculas e espaços, e mesmos demais campos) são servidas do cache em memória.
+IA_CACHE_TTL = int(os.getenv('IA_CACHE_TTL', '600'))
+# Tamanho máximo do corpo aceito em /ia/gerar-resposta (pergunta + contexto)
+IA_MAX_BODY = 16 * 1024
+
+def ia_cache_key(data):
+    normalizado = dict(data)
+    normalizado['pergunta'] = ' '.join(str(data['pergunta']).split()).lower()
+    digest = hashlib.blake2b(orjson.dumps(normalizado, option=orjson.OPT_SORT_KEYS), digest_size=16).digest()
+    # Por usuário, como as demais entradas do cache (api_cache_key): respostas não
+    # são compartilhadas entre usuários/perfis
+    return api_cache_key('/ia/gerar-resposta') + (digest,)
+
+# Perguntas idênticas que chegam ao mesmo tempo (antes da primeira resposta entrar
+# no cache) compartilham uma única chamada à API em vez de repeti-la.
+# A chave é a do cache (por usuário) e só respostas 200 são compartilhadas: quem
+# esperava por uma chamada que falhou faz a sua própria.
+_ia_em_andamento = {}
+_ia_em_andamento_lock = threading.Lock()
+
+def ia_chamada_compartilhada(key, chamada):
+    # chamada() retorna (dados, status)
+    with _ia_em_andamento_lock:
+        future = _ia_em_andamento.get(key)
+        lider = future is None
+        if lider:
+            future = Future()
+            _ia_em_andamento[key] = future
+    if not lider:
+        try:
+            resultado = future.result()
+        except Exception:
+            resultado = None
+        if resultado is not None and resultado[1] == 200:
+            return resultado
+        return chamada()
+    try:
+        resultado = chamada()
+        future.set_result(resultado)
+        return resultado
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _ia_em_andamento_lock:
+            _ia_em_andamento.pop(key, None)
+
 @app.route('/ia/gerar-resposta', methods=['POST'])
 @login_required
 def ia_gerar_resposta():
     # Gera resposta usando IA
+    # Rejeita corpos grandes ou inválidos antes de ler/decodificar tudo e de chamar a IA
+    if request.content_length is not None and request.content_length > IA_MAX_BODY:
+        return jsonify({"error": "Requisição muito grande"}), 413
+    if request.is_json:
+        raw = request.stream.read(IA_MAX_BODY + 1)
+        if len(raw) > IA_MAX_BODY:
+            return jsonify({"error": "Requisição muito grande"}), 413
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return jsonify({"error": "JSON inválido"}), 400
+    else:
+        data = request.form.to_dict()
+    
+    # Validação básica
+    if not isinstance(data, dict) or not data.get('pergunta'):
+        return jsonify({"error": "Campo 'pergunta' é obrigatório"}), 400
+    
     try:
         headers = get_auth_headers()
-        data = request.get_json() if request.is_json else request.form.to_dict()
-        
-        # Validação básica
-        if 'pergunta' not in data:
-            return jsonify({"error": "Campo 'pergunta' é obrigatório"}), 400
+        cache_key = ia_cache_key(data)
+        resposta = cache_get(cache_key)
+        if resposta is not None:
+            return jsonify(resposta), 200
         
-        response = requests.post(f"{API_BASE_URL}/ia/gerar-resposta", json=data, headers=headers, timeout=60)
+        def chamar_ia():
+            response = IA_SESSION.post(IA_GERAR_RESPOSTA_URL, json=data, headers=headers, timeout=60)
+            if response.status_code == 200:
+                resposta = oparse(response)
+                cache_set(cache_key, resposta, IA_CACHE_TTL)
+                return resposta, 200
+            return {"error": oparse(response).get("detail", "Erro ao gerar resposta com IA")}, response.status_code
         
-        if response.status_code == 200:
-            return jsonify(response.json()), 200
-        return jsonify({"error": response.json().get("detail", "Erro ao gerar resposta com IA")}), response.status_code
+        resposta, status_code = ia_chamada_compartilhada(cache_key, chamar_ia)
+        return jsonify(resposta), status_code
     except requests.exceptions.RequestException as e:
         return jsonify({"error": str(e)}), 500
 
 # ===== ERROS =====
+# Corpo JSON do 404 serializado uma única vez; por requisição só o path é codificado
+_NOT_FOUND_PREFIX = orjson.dumps({
+    'error': 'Not Found',
+    'message': 'A rota solicitada não foi encontrada.',
+})[:-1] + b',"path":'
+
 @app.errorhandler(404)
 def handle_404(e):
     # Handler para erros 404 - Página não encontrada
     if request.path.startswith('/debug/'):
         # Para rotas de debug, retorna JSON
-        return jsonify({
-            'error': 'Not Found',
-            'message': 'A rota solicitada não foi encontrada.',
-            'path': request.path
-        }), 404
+        return app.response_class(
+            _NOT_FOUND_PREFIX + orjson.dumps(request.path) + b'}',
+            status=404,
+            mimetype='application/json'
+        )
     else:
         # Para outras rotas, redireciona para a página inicial
         # Não exibe mensagem de erro para evitar duplicação, pois o flash já foi usado antes
         return redirect(url_for('index'))
 
 # Execução da aplicação
+WAITRESS_THREADS = int(os.getenv('WAITRESS_THREADS', '8'))
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5001))
-    app.run(debug=True, host='0.0.0.0', port=port)
+    if app.config['DEBUG']:
+        # Desenvolvimento: servidor do Flask com debugger e reloader
+        app.run(debug=True, host='0.0.0.0', port=port, threaded=True)
+    else:
+        # Produção: servidor WSGI com várias threads e keep-alive (funciona também no
+        # Windows, onde o gunicorn não roda)
+        from waitress import serve
+        print(f"[INFO] Servindo com waitress na porta {port}")
+        serve(app, host='0.0.0.0', port=port, threads=WAITRESS_THREADS, connection_limit=200)
@@ -0,0 +1,20 @@
+# Configuração do Gunicorn para produção.
+# Carregada automaticamente ao rodar, na raiz do projeto: gunicorn app:app
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5001')}"
+
+# Workers com threads: as rotas passam a maior parte do tempo esperando a API
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+
+keepalive = 30
+# /ia/gerar-resposta espera até 60 s pela API
+timeout = 90
+
+# Sem preload_app: o pool de conexões com a API, a thread de logs e o executor
+# são criados ao importar o app.py e não sobrevivem ao fork; cada worker
+# precisa criar os seus.
+preload_app = False